@@ -0,0 +1,75 @@
+"""Compare `getcurcur show` wall-clock time with and without the browser daemon.
+
+Usage:
+    python benchmarks/bench_daemon.py [--runs 20] [--bank hana]
+
+Runs `getcurcur show -b <bank> --no-cache -f json` repeatedly, first with a
+cold in-process browser launch and then against a running `getcurcur daemon`,
+and prints p50/p95 wall-clock latency for both modes. Requires network access
+and installed Playwright browsers.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from getcurcur.browser_manager import read_daemon_endpoint
+
+
+def _show_command(bank):
+    return [sys.executable, "-m", "getcurcur.main", "show", "-b", bank, "--no-cache", "-f", "json"]
+
+
+def _time_runs(bank, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(_show_command(bank), check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _percentiles(timings):
+    cuts = statistics.quantiles(timings, n=100, method="inclusive")
+    return cuts[49], cuts[94]
+
+
+def _wait_for_daemon(timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if read_daemon_endpoint():
+            return
+        time.sleep(0.2)
+    raise RuntimeError("Browser daemon did not start in time")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--bank", default="hana")
+    args = parser.parse_args()
+
+    if read_daemon_endpoint():
+        sys.exit("Stop the running daemon first (getcurcur daemon --stop)")
+
+    results = {"cold": _time_runs(args.bank, args.runs)}
+
+    daemon = subprocess.Popen([sys.executable, "-m", "getcurcur.main", "daemon"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_daemon()
+        results["daemon"] = _time_runs(args.bank, args.runs)
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=30)
+
+    print(f"{'mode':<8} {'runs':>5} {'p50 (s)':>9} {'p95 (s)':>9}")
+    for mode, timings in results.items():
+        p50, p95 = _percentiles(timings)
+        print(f"{mode:<8} {len(timings):>5} {p50:>9.3f} {p95:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure bytes transferred and time-to-table with and without the lean scrape profile.
+
+Usage:
+    python benchmarks/bench_lean.py [--runs 5] [--url URL] [--selector SELECTOR]
+
+Loads the Hana Bank rate page (or --url) in fresh browser contexts, first
+with full pages (navigation waits for `networkidle`, as before) and then
+with the lean ScrapeProfile (blocked resources, `domcontentloaded` plus a
+readiness selector). For each mode it prints the median number of
+requests, response bytes, blocked requests, time until the rate table
+rows are attached and the number of rates Hana's parser reads from the
+page, which should match between the two modes before browser.lean is
+enabled. Requires network access and installed Playwright browsers; the
+daemon is not used so every run starts a browser.
+"""
+
+import argparse
+import statistics
+import time
+
+from playwright.sync_api import sync_playwright
+
+from getcurcur.browser_manager import ScrapeProfile
+from getcurcur.providers.korea.hana import HanaBankProvider
+
+
+def _measure(browser, url, selector, profile, provider):
+    options = profile.context_options() if profile else {"viewport": {"width": 1920, "height": 1080}}
+    context = browser.new_context(**options)
+    blocked = []
+    if profile:
+        handler = profile.route_handler()
+
+        def _route(route):
+            if profile.should_block(*profile._describe(route.request)):
+                blocked.append(route.request.url)
+            handler(route)
+
+        context.route("**/*", _route)
+
+    finished = []
+    context.on("requestfinished", finished.append)
+    page = context.new_page()
+    try:
+        start = time.perf_counter()
+        page.goto(url, wait_until="domcontentloaded" if profile else "networkidle")
+        page.wait_for_selector(selector, state="attached", timeout=30000)
+        elapsed = time.perf_counter() - start
+        rates = len(provider._parse_exchange_table(page))
+        # Sizes are only available once each response body has been read
+        response_bytes = sum(request.sizes()["responseBodySize"] for request in list(finished))
+    finally:
+        context.close()
+    return {"seconds": elapsed, "requests": len(finished), "bytes": response_bytes, "blocked": len(blocked),
+            "rates": rates}
+
+
+def _report(label, samples):
+    median = {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+    print(f"{label:<6} time-to-table {median['seconds'] * 1000:8.0f} ms   "
+          f"requests {median['requests']:5.0f}   bytes {median['bytes'] / 1024:9.1f} KiB   "
+          f"blocked {median['blocked']:4.0f}   rates parsed {min(sample['rates'] for sample in samples)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--url", default=HanaBankProvider.URL)
+    parser.add_argument("--selector", default=HanaBankProvider.READY_SELECTOR)
+    args = parser.parse_args()
+
+    profile = ScrapeProfile()
+    provider = HanaBankProvider(cache_enabled=False)
+    with sync_playwright() as p:
+        full_browser = p.chromium.launch(headless=True)
+        full = [_measure(full_browser, args.url, args.selector, None, provider) for _ in range(args.runs)]
+        full_browser.close()
+
+        lean_browser = p.chromium.launch(headless=True, args=profile.launch_args())
+        lean = [_measure(lean_browser, args.url, args.selector, profile, provider) for _ in range(args.runs)]
+        lean_browser.close()
+
+    print(f"{args.url} ({args.runs} runs, medians)")
+    _report("full", full)
+    _report("lean", lean)
+
+
+if __name__ == "__main__":
+    main()
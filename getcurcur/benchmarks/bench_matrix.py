@@ -0,0 +1,91 @@
+"""Time to build the full conversion matrix of a synthetic rate table.
+
+Usage:
+    python benchmarks/bench_matrix.py [--currencies 50] [--iterations 20]
+
+Builds every buy and sell rate between all pairs of currencies of a table
+with N foreign currencies (plus KRW). "pairwise" converts each pair on its
+own, scanning the table for both currencies the way convert_amount did;
+"engine" is ConversionEngine's memoized graph; "matrix" is RateMatrix
+laid out from a fresh engine, with and without NumPy
+(`pip install getcurcur[matrix]`).
+"""
+
+import argparse
+import itertools
+import string
+import time
+
+from getcurcur.conversion import ConversionEngine, split_unit
+from getcurcur.matrix import RateMatrix, numpy_available
+from getcurcur.rates import TRANSACTION_TYPES, RateTable
+
+
+def _table(currencies):
+    codes = ["".join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3)]
+    rows = []
+    for i, code in enumerate(codes[:currencies]):
+        if i % 10 == 3:
+            code = f"{code} (100)"
+        rows.append((code, code, f"{1000 + i * 7.5:,.2f}", f"{980 + i * 7.5:,.2f}"))
+    return RateTable.from_rows("Bench Bank", "KR", rows)
+
+
+def _pairwise(rates):
+    def per_unit(currency, transaction_type):
+        if currency == "KRW":
+            return 1.0
+        for row in rates:
+            code, unit = split_unit(row.code)
+            if code == currency:
+                value = getattr(row, transaction_type)
+                return float(value) / unit if value else None
+        return None
+
+    currencies = ["KRW"] + [split_unit(code)[0] for code in rates.codes]
+    matrices = []
+    for transaction_type in TRANSACTION_TYPES:
+        matrices.append([[per_unit(source, transaction_type) / per_unit(target, transaction_type)
+                          for target in currencies] for source in currencies])
+    return matrices
+
+
+def _engine(rates):
+    engine = ConversionEngine(rates)
+    return [engine.matrix(transaction_type) for transaction_type in TRANSACTION_TYPES]
+
+
+def _bench(build, rates, iterations):
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter()
+        build(rates)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--currencies", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    rates = _table(args.currencies)
+    size = len(rates) + 1
+    print(f"{size}x{size} matrix, {len(TRANSACTION_TYPES)} transaction types, best of {args.iterations}")
+
+    candidates = [
+        ("pairwise", _pairwise),
+        ("engine", _engine),
+        ("matrix (python)", lambda table: RateMatrix.from_engine(ConversionEngine(table), use_numpy=False)),
+    ]
+    if numpy_available():
+        candidates.append(("matrix (numpy)", lambda table: RateMatrix.from_engine(ConversionEngine(table), use_numpy=True)))
+
+    for label, build in candidates:
+        elapsed = _bench(build, rates, args.iterations)
+        print(f"{label:<16} {elapsed * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Rows/second for each HTML parser backend over a Hana page fixture.
+
+Usage:
+    python benchmarks/bench_parsers.py [--iterations 200] [FIXTURE.html ...]
+
+Parses the rate table of each fixture (default: the synthetic
+tests/fixtures/hana_rates_synthetic.html, which only mimics the rate table
+layout and page size; pass a saved copy of the real page for numbers that
+reflect it) with every installed backend and prints parses/second and
+rows/second. The
+"html.parser (full)" line is the previous approach of building the whole
+document with BeautifulSoup before selecting the rows. Install the `fast`
+extra (`pip install getcurcur[fast]`) to include selectolax; lxml is used
+when lxml and cssselect are installed.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from getcurcur.parsing import available_backends, extract_table_cells
+from getcurcur.providers.korea.hana import HanaBankProvider
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "hana_rates_synthetic.html"
+SELECTOR = HanaBankProvider.TABLE_ROWS_SELECTOR
+COLUMNS = HanaBankProvider.TABLE_COLUMNS
+
+
+def _full_soup(html):
+    rows = []
+    for row in BeautifulSoup(html, "html.parser").select(SELECTOR):
+        cells = row.find_all("td")
+        if len(cells) > max(COLUMNS):
+            rows.append([cells[i].text.strip() for i in COLUMNS])
+    return rows
+
+
+def _bench(parse, documents, iterations):
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for html in documents:
+            rows += len(parse(html))
+    elapsed = time.perf_counter() - start
+    return iterations * len(documents) / elapsed, rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", type=Path, default=[DEFAULT_FIXTURE])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    documents = [path.read_text(encoding="utf-8") for path in args.fixtures]
+    size = sum(len(html.encode("utf-8")) for html in documents) / 1024
+    synthetic = " (synthetic)" if DEFAULT_FIXTURE in args.fixtures else ""
+    print(f"{len(documents)} fixture(s){synthetic}, {size:.0f} KiB, {args.iterations} iterations")
+
+    candidates = [("html.parser (full)", _full_soup)]
+    for backend in reversed(available_backends()):
+        candidates.append((backend, lambda html, b=backend: extract_table_cells(html, SELECTOR, COLUMNS, backend=b)))
+
+    for label, parse in candidates:
+        parses, rows = _bench(parse, documents, args.iterations)
+        print(f"{label:<20} {parses:10.1f} parses/s {rows:12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
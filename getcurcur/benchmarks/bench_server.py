@@ -0,0 +1,119 @@
+"""Requests/second of the local rate server under concurrent keep-alive clients.
+
+Usage:
+    python benchmarks/bench_server.py [--clients 8] [--seconds 5] [--gzip] [--etag]
+    python benchmarks/bench_server.py --url http://127.0.0.1:8765 [--provider hana]
+
+Without --url an in-process server is started with the rates of the
+synthetic Hana page fixture (tests/fixtures/hana_rates_synthetic.html)
+published, so no network or browser is needed; clients then share the
+interpreter with the server.
+Point --url at a running `getcurcur serve` to measure it from outside.
+Each client holds one HTTP/1.1 connection and cycles through the full
+table, a single currency and a conversion. --gzip sends
+Accept-Encoding: gzip and --etag revalidates with If-None-Match (304s).
+Prints requests/second and median/p99 latency per endpoint.
+"""
+
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from getcurcur.providers.korea.hana import HanaBankProvider
+from getcurcur.server import RateStore, create_server
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "hana_rates_synthetic.html"
+
+
+def _start_local_server():
+    provider = HanaBankProvider(cache_enabled=False)
+    table = provider._parse_exchange_html(FIXTURE.read_text(encoding="utf-8"))
+    store = RateStore()
+    store.publish("korea.hana", provider.get_provider_name(), table, datetime.now())
+    server = create_server(store, host="127.0.0.1", port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "127.0.0.1", server.server_address[1]
+
+
+def _client(host, port, paths, headers, revalidate, deadline, latencies, errors):
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    etags = {}
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        request_headers = dict(headers)
+        if path in etags:
+            request_headers["If-None-Match"] = etags[path]
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=request_headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies[path].append(time.perf_counter() - start)
+        if revalidate and response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running server (default: start one in-process)")
+    parser.add_argument("--provider", default="hana")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--gzip", action="store_true", help="Accept gzip-encoded responses")
+    parser.add_argument("--etag", action="store_true", help="Revalidate with If-None-Match")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server, host, port = _start_local_server()
+
+    paths = [f"/rates/{args.provider}", f"/rates/{args.provider}/USD",
+             f"/convert?amount=100&from=USD&provider={args.provider}"]
+    headers = {}
+    if args.gzip:
+        headers["Accept-Encoding"] = "gzip"
+
+    latencies = {path: [] for path in paths}
+    errors = []
+    deadline = time.perf_counter() + args.seconds
+    threads = [threading.Thread(target=_client,
+                                args=(host, port, paths, headers, args.etag, deadline, latencies, errors))
+               for _ in range(args.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"{host}:{port}  {args.clients} clients, {elapsed:.1f}s, gzip={args.gzip}, etag={args.etag}")
+    print(f"{total / elapsed:10.0f} req/s   ({total} requests, {len(errors)} errors)")
+    for path, samples in latencies.items():
+        if samples:
+            samples.sort()
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            print(f"  {path:<45} median {statistics.median(samples) * 1000:7.2f} ms   p99 {p99 * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,454 @@
 """Browser management utilities for GetCurCur."""
 
-from typing import Optional, Any
-from contextlib import contextmanager
+from typing import Optional, Any, AsyncIterator, Dict, Iterator, List, Literal, Tuple, Callable
+from contextlib import contextmanager, asynccontextmanager, ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
 from playwright.sync_api import sync_playwright, Browser, BrowserContext
+from playwright.async_api import async_playwright
+import json
+import os
+import threading
 import logging
 
+from getcurcur.context_pool import AsyncContextPool, ContextPool
+from getcurcur.tracing import span
+
 logger = logging.getLogger(__name__)
 
+DAEMON_STATE_FILE = Path.home() / ".getcurcur" / "daemon.json"
+
+# Load states page.goto and page.reload can wait for
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+
+# Analytics, tag manager and ad hosts embedded in bank pages
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "wcs.naver.net",
+    "criteo.com",
+    "hotjar.com",
+    "adobedtm.com",
+)
+
+# Second-level labels under country-code TLDs (e.g. "co" in example.co.kr)
+_SECOND_LEVEL_LABELS = {"co", "or", "go", "ac", "ne", "re", "com", "net", "org"}
+
+
+def _site_of(host: str) -> str:
+    """Approximate registrable domain of a host (kebhana.com, example.co.kr)."""
+    labels = host.lower().rstrip('.').split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+@dataclass(frozen=True)
+class ScrapeProfile:
+    """
+    Lean page profile for scraping contexts.
+    
+    Scrapers only read the DOM, so contexts created with a profile abort
+    requests for non-essential resource types, known tracker domains and
+    (optionally) any third-party host, render at a smaller viewport with
+    reduced motion, and launch Chromium with images disabled. Scripts and
+    XHRs from the page's own site are always let through.
+    """
+    
+    block_resource_types: Tuple[str, ...] = ("image", "media", "font", "stylesheet")
+    block_domains: Tuple[str, ...] = DEFAULT_BLOCKED_DOMAINS
+    block_third_party: bool = True
+    reduced_motion: bool = True
+    viewport: Tuple[int, int] = (1280, 800)
+    
+    @classmethod
+    def from_config(cls, config: Any = None) -> Optional["ScrapeProfile"]:
+        """
+        Build the profile from the browser.lean config section.
+        
+        The profile is opt-in: it has not been measured against the live
+        bank pages, which may need blocked stylesheets or third-party scripts.
+        
+        Returns:
+            ScrapeProfile, or None unless browser.lean.enabled is true
+        """
+        from getcurcur.config import get_config
+        
+        config = config or get_config()
+        if not config.get("browser.lean.enabled", False):
+            return None
+        return cls(
+            block_resource_types=tuple(config.get("browser.lean.block_resource_types", cls.block_resource_types)),
+            block_domains=tuple(config.get("browser.lean.block_domains", cls.block_domains)),
+            block_third_party=bool(config.get("browser.lean.block_third_party", cls.block_third_party)),
+        )
+    
+    def launch_args(self) -> List[str]:
+        """Chromium flags for browsers launched for this profile."""
+        # Also covers data: URLs and CSS images, which routing never sees
+        return ["--blink-settings=imagesEnabled=false"]
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Keyword arguments for browser.new_context."""
+        options: Dict[str, Any] = {
+            'viewport': {'width': self.viewport[0], 'height': self.viewport[1]},
+            # Requests served by a service worker bypass context routes
+            'service_workers': 'block',
+        }
+        if self.reduced_motion:
+            options['reduced_motion'] = 'reduce'
+        return options
+    
+    def should_block(self, resource_type: str, url: str, page_url: str = '',
+                     main_navigation: bool = False) -> bool:
+        """
+        Decide whether a request should be aborted.
+        
+        Args:
+            resource_type: Playwright resource type (image, script, xhr, ...)
+            url: Request URL
+            page_url: URL of the frame that issued the request
+            main_navigation: Whether this is the top-level page navigation
+        """
+        if main_navigation:
+            return False
+        if resource_type in self.block_resource_types:
+            return True
+        
+        host = urlsplit(url).hostname or ''
+        if not host:
+            return False
+        if any(host == domain or host.endswith('.' + domain) for domain in self.block_domains):
+            return True
+        
+        if self.block_third_party:
+            page_host = urlsplit(page_url).hostname
+            if page_host and _site_of(host) != _site_of(page_host):
+                return True
+        return False
+    
+    def _describe(self, request: Any) -> Tuple[str, str, str, bool]:
+        try:
+            frame = request.frame
+            page_url = frame.url
+            main_navigation = request.is_navigation_request() and frame.parent_frame is None
+        except Exception:
+            # Service worker requests have no frame
+            page_url, main_navigation = '', False
+        return request.resource_type, request.url, page_url, main_navigation
+    
+    def route_handler(self) -> Callable[[Any], None]:
+        """Handler for context.route('**/*', ...) in the sync API."""
+        def _handle(route: Any) -> None:
+            if self.should_block(*self._describe(route.request)):
+                route.abort()
+            else:
+                route.fallback()
+        return _handle
+    
+    def async_route_handler(self) -> Callable[[Any], Any]:
+        """Handler for context.route('**/*', ...) in the async API."""
+        async def _handle(route: Any) -> None:
+            if self.should_block(*self._describe(route.request)):
+                await route.abort()
+            else:
+                await route.fallback()
+        return _handle
+
+
+def read_daemon_endpoint(state_file: Optional[Path] = None) -> Optional[str]:
+    """
+    Return the CDP endpoint of a running browser daemon, if any.
+    
+    Stale state files left behind by a daemon that died without cleaning up
+    are removed so the next invocation does not probe them again.
+    
+    Args:
+        state_file: Path to the daemon state file
+        
+    Returns:
+        CDP endpoint URL or None if no daemon is running
+    """
+    state_file = state_file or DAEMON_STATE_FILE
+    
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        pid = int(state['pid'])
+        endpoint = str(state['endpoint'])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable daemon state file: {e}")
+        return None
+    
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        logger.debug(f"Removing stale daemon state file (pid {pid} is gone)")
+        try:
+            state_file.unlink()
+        except OSError:
+            pass
+        return None
+    except PermissionError:
+        # Process exists but belongs to another user
+        pass
+    
+    return endpoint
+
+
+def pool_options(config: Any = None, **overrides: Any) -> Dict[str, Any]:
+    """
+    Context pool settings from the browser.pool config section.
+    
+    Args:
+        config: Config to read (default: the global config)
+        overrides: Settings that take precedence when not None
+    
+    Returns:
+        Keyword arguments for ContextPool / AsyncContextPool
+    """
+    from getcurcur.config import get_config
+    
+    config = config or get_config()
+    options = {
+        'max_size': int(config.get("browser.pool.max_contexts", 4)),
+        'max_idle_seconds': config.get("browser.pool.max_idle_seconds", 300),
+        'max_uses': config.get("browser.pool.max_uses", 50),
+    }
+    options.update((key, value) for key, value in overrides.items() if value is not None)
+    return options
+
+
+class LazyBrowserContext:
+    """
+    Stand-in for a BrowserContext that only starts a browser on first use.
+    
+    Lets callers hand a context to providers that may never need one
+    (e.g. when rates come from cache or an HTTP fast path).
+    """
+    
+    def __init__(self, manager: "BrowserManager", launch_slots: Optional[threading.Semaphore] = None):
+        """
+        Initialize lazy context.
+        
+        Args:
+            manager: Browser manager used to open the real context
+            launch_slots: Semaphore held while the browser is open, capping
+                how many lazy contexts run a browser at once
+        """
+        self._manager = manager
+        self._stack = ExitStack()
+        self._context: Optional[BrowserContext] = None
+        self._launch_slots = launch_slots
+        self._holding_slot = False
+    
+    @property
+    def started(self) -> bool:
+        """Whether the underlying browser context has been opened."""
+        return self._context is not None
+    
+    def _resolve(self) -> BrowserContext:
+        if self._context is None:
+            if self._launch_slots is not None and not self._holding_slot:
+                with span("browser.wait_slot"):
+                    self._launch_slots.acquire()
+                self._holding_slot = True
+            self._context = self._stack.enter_context(self._manager.browser_context())
+        return self._context
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+    
+    def _release(self) -> None:
+        """Close the underlying context and browser if they were opened."""
+        self._context = None
+        try:
+            self._stack.close()
+        finally:
+            if self._holding_slot and self._launch_slots is not None:
+                self._holding_slot = False
+                self._launch_slots.release()
+    
+    def reset(self) -> None:
+        """Close the underlying context and browser; both reopen on next use."""
+        LazyBrowserContext._release(self)
+        self._stack = ExitStack()
+
+
+class ScrapeSession:
+    """
+    Warm page kept open on one URL across fetches.
+    
+    The page keeps its HTTP cache, cookies and connections between
+    fetches, so a refresh is a reload (or a query made from inside the
+    page) instead of a new page, TLS handshakes and script bootstrap. A
+    page that crashed, was closed or no longer answers a liveness probe is
+    recreated on the next use.
+    """
+    
+    def __init__(self, context_factory: Callable[[], BrowserContext], url: str,
+                 wait_until: WaitUntil = "load", timeout: int = 30000):
+        """
+        Initialize scrape session.
+        
+        Args:
+            context_factory: Returns the browser context pages are opened in
+            url: Page URL
+            wait_until: Load state navigation and reloads wait for
+            timeout: Default page timeout in milliseconds
+        """
+        self._context_factory = context_factory
+        self.url = url
+        self.wait_until = wait_until
+        self.timeout = timeout
+        self._page: Optional[Any] = None
+        self._broken = False
+        self.stats = {"opened": 0, "reloaded": 0, "requeried": 0, "recreated": 0}
+    
+    def _mark_broken(self, *_: Any) -> None:
+        self._broken = True
+    
+    def alive(self) -> bool:
+        """Whether the page is open and its renderer still responds."""
+        page = self._page
+        if page is None or self._broken or page.is_closed():
+            return False
+        try:
+            page.evaluate("1")
+        except Exception as e:
+            logger.debug(f"Session page for {self.url} failed its liveness probe: {e}")
+            return False
+        return True
+    
+    def warm_page(self) -> Optional[Any]:
+        """The loaded page if it is alive, without reloading it."""
+        return self._page if self.alive() else None
+    
+    def _open(self) -> Any:
+        if self._page is not None:
+            self.stats["recreated"] += 1
+            self.discard()
+        page = self._context_factory().new_page()
+        page.set_default_timeout(self.timeout)
+        page.on("crash", self._mark_broken)
+        page.on("close", self._mark_broken)
+        self._page = page
+        self._broken = False
+        with span("page.goto", url=self.url, session=True):
+            page.goto(self.url, wait_until=self.wait_until)
+        self.stats["opened"] += 1
+        return page
+    
+    def load(self) -> Any:
+        """
+        Page freshly showing the URL: reloaded if warm, otherwise (re)opened.
+        
+        Raises:
+            Exception: Playwright errors from navigation; the page is
+                discarded so the next use starts over
+        """
+        try:
+            page = self._page
+            if page is None or not self.alive():
+                return self._open()
+            with span("page.reload", url=self.url):
+                page.reload(wait_until=self.wait_until)
+            self.stats["reloaded"] += 1
+            return page
+        except Exception:
+            self.discard()
+            raise
+    
+    def discard(self) -> None:
+        """Close the page; the next use opens a new one."""
+        page, self._page = self._page, None
+        if page is not None:
+            try:
+                page.close()
+            except Exception as e:
+                logger.debug(f"Failed to close session page for {self.url}: {e}")
+
+
+class SessionContext(LazyBrowserContext):
+    """
+    Lazy browser context that also keeps one warm ScrapeSession per key.
+    
+    Providers given a SessionContext fetch through their session (see
+    ExchangeRateProvider.session_for) instead of opening a new page each
+    time. Like every sync Playwright object it must only be used from the
+    thread that opened it.
+    """
+    
+    def __init__(self, manager: "BrowserManager"):
+        """
+        Initialize session context.
+        
+        Args:
+            manager: Browser manager used to open the real context
+        """
+        super().__init__(manager)
+        self._sessions: Dict[str, ScrapeSession] = {}
+    
+    def _session_browser_context(self) -> BrowserContext:
+        context = self._resolve()
+        browser = context.browser
+        if browser is not None and not browser.is_connected():
+            logger.warning("Browser disconnected, relaunching for scrape sessions")
+            self.reset()
+            context = self._resolve()
+        return context
+    
+    def session(self, key: str, url: str, wait_until: WaitUntil = "load", timeout: int = 30000) -> ScrapeSession:
+        """
+        Get or create the session for a key (usually the provider name).
+        
+        Args:
+            key: Session key
+            url: Page URL
+            wait_until: Load state navigation and reloads wait for
+            timeout: Default page timeout in milliseconds
+        
+        Returns:
+            ScrapeSession
+        """
+        session = self._sessions.get(key)
+        if session is None or session.url != url:
+            if session is not None:
+                session.discard()
+            session = ScrapeSession(self._session_browser_context, url, wait_until=wait_until, timeout=timeout)
+            self._sessions[key] = session
+        return session
+    
+    @property
+    def sessions(self) -> Dict[str, ScrapeSession]:
+        """Open sessions by key."""
+        return dict(self._sessions)
+    
+    def reset(self) -> None:
+        """Close every session page and the browser; both reopen on next use."""
+        for session in self._sessions.values():
+            session.discard()
+        super().reset()
+    
+    def _release(self) -> None:
+        for session in self._sessions.values():
+            session.discard()
+        self._sessions.clear()
+        super()._release()
+
 
 class BrowserManager:
     """
@@ -14,28 +456,76 @@ class BrowserManager:
     Provides context managers for efficient resource management.
     """
     
-    def __init__(self, headless: bool = True, user_agent: Optional[str] = None):
+    def __init__(self, headless: bool = True, user_agent: Optional[str] = None,
+                 use_daemon: bool = True, profile: Optional[ScrapeProfile] = None):
         """
         Initialize browser manager.
         
         Args:
             headless: Run browser in headless mode
             user_agent: Custom user agent string
+            use_daemon: Connect to a running `getcurcur daemon` when available
+            profile: Lean scrape profile applied to every context (None: full pages)
         """
         self.headless = headless
-        self.user_agent = user_agent or (
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-            '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        )
+        self.use_daemon = use_daemon
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.profile = profile
         self._browser: Optional[Browser] = None
-        self._playwright = None
+        self._playwright: Any = None
+        self._pool: Optional[ContextPool] = None
+    
+    def _launch_options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {'headless': self.headless}
+        if self.profile is not None:
+            options['args'] = self.profile.launch_args()
+        return options
+    
+    def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a context with the standard GetCurCur settings."""
+        if self.profile is None:
+            return browser.new_context(
+                user_agent=self.user_agent,
+                viewport={'width': 1920, 'height': 1080}
+            )
+        context = browser.new_context(user_agent=self.user_agent, **self.profile.context_options())
+        context.route("**/*", self.profile.route_handler())
+        return context
+    
+    def _connect_daemon(self, p: Any) -> Optional[Browser]:
+        """
+        Connect to the warm browser kept by `getcurcur daemon`.
+        
+        Returns:
+            Connected browser or None if no daemon is reachable
+        """
+        if not self.use_daemon:
+            return None
+        
+        endpoint = read_daemon_endpoint()
+        if endpoint is None:
+            return None
+        
+        try:
+            browser: Browser = p.chromium.connect_over_cdp(endpoint)
+            logger.debug(f"Connected to browser daemon at {endpoint}")
+            return browser
+        except Exception as e:
+            logger.warning(f"Browser daemon at {endpoint} unreachable, launching locally: {e}")
+            return None
     
     @contextmanager
-    def browser_context(self):
+    def browser_context(self, lazy: bool = False,
+                        launch_slots: Optional[threading.Semaphore] = None) -> Iterator[Any]:
         """
         Context manager that provides a browser context.
         Automatically manages browser and context lifecycle.
         
+        Args:
+            lazy: Defer launching the browser until the context is first used
+            launch_slots: With lazy, semaphore capping how many lazy
+                contexts may have a browser open at once
+        
         Yields:
             BrowserContext: Playwright browser context
             
@@ -45,23 +535,35 @@ class BrowserManager:
         """
         from getcurcur.exceptions import NetworkError
         
+        if lazy:
+            lazy_context = LazyBrowserContext(self, launch_slots)
+            try:
+                yield lazy_context
+            finally:
+                lazy_context._release()
+            return
+        
         with sync_playwright() as p:
             self._playwright = p
             browser = None
             context = None
+            from_daemon = False
             
             try:
-                logger.debug(f"Launching browser (headless={self.headless})")
-                try:
-                    browser = p.chromium.launch(headless=self.headless)
-                except Exception as e:
-                    raise NetworkError(f"Failed to launch browser: {e}")
+                with span("browser.launch", headless=self.headless):
+                    browser = self._connect_daemon(p)
+                    from_daemon = browser is not None
+                    
+                    if browser is None:
+                        logger.debug(f"Launching browser (headless={self.headless})")
+                        try:
+                            browser = p.chromium.launch(**self._launch_options())
+                        except Exception as e:
+                            raise NetworkError(f"Failed to launch browser: {e}")
                 
                 try:
-                    context = browser.new_context(
-                        user_agent=self.user_agent,
-                        viewport={'width': 1920, 'height': 1080}
-                    )
+                    with span("browser.new_context"):
+                        context = self._new_context(browser)
                 except Exception as e:
                     raise RuntimeError(f"Failed to create browser context: {e}")
                 
@@ -82,82 +584,360 @@ class BrowserManager:
                 raise RuntimeError(f"Browser context management failed: {e}")
             finally:
                 # Ensure cleanup happens even if there are errors
-                if context:
-                    try:
-                        context.close()
-                        logger.debug("Browser context closed")
-                    except Exception as e:
-                        logger.warning(f"Failed to close browser context: {e}")
-                if browser:
-                    try:
-                        browser.close()
-                        logger.debug("Browser closed")
-                    except Exception as e:
-                        logger.warning(f"Failed to close browser: {e}")
+                with span("browser.close"):
+                    if context:
+                        try:
+                            context.close()
+                            logger.debug("Browser context closed")
+                        except Exception as e:
+                            logger.warning(f"Failed to close browser context: {e}")
+                    # The daemon's browser outlives us; leaving sync_playwright()
+                    # drops the CDP connection without closing it.
+                    if browser and not from_daemon:
+                        try:
+                            browser.close()
+                            logger.debug("Browser closed")
+                        except Exception as e:
+                            logger.warning(f"Failed to close browser: {e}")
     
     @contextmanager
-    def shared_browser_context(self):
+    def session_context(self) -> Iterator[SessionContext]:
+        """
+        Context manager for a long-lived context that keeps warm pages.
+        
+        Providers handed this context reuse one open page each across
+        fetches (see ScrapeSession). Meant for processes that refresh
+        repeatedly, such as `getcurcur serve`; the browser is only launched
+        on first use and relaunched if it disconnects.
+        
+        Yields:
+            SessionContext: Lazy context holding the scrape sessions
+        """
+        session_context = SessionContext(self)
+        try:
+            yield session_context
+        finally:
+            session_context._release()
+    
+    @property
+    def pool(self) -> Optional[ContextPool]:
+        """Context pool of the shared browser, while with_shared_browser is active."""
+        return self._pool
+    
+    def _new_shared_context(self) -> BrowserContext:
+        if self._browser is None:
+            raise RuntimeError("Shared browser not launched")
+        context = self._new_context(self._browser)
+        context.set_default_timeout(30000)
+        context.set_default_navigation_timeout(30000)
+        return context
+    
+    def _shared_browser_alive(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+    
+    def _relaunch_shared_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.debug(f"Failed to close disconnected browser: {e}")
+        self._browser = self._playwright.chromium.launch(**self._launch_options())
+    
+    @contextmanager
+    def shared_browser_context(self) -> Iterator[BrowserContext]:
         """
         Context manager for shared browser instance.
         Useful when multiple operations need the same browser.
         
+        The context is checked out of the shared browser's pool and checked
+        back in afterwards, so consecutive uses reuse open contexts.
+        
         Yields:
             BrowserContext: Shared browser context
         """
-        if self._browser is None:
+        if self._pool is None:
             raise RuntimeError("Shared browser not initialized. Use 'with_shared_browser' first.")
         
-        context = None
-        try:
-            context = self._browser.new_context(
-                user_agent=self.user_agent,
-                viewport={'width': 1920, 'height': 1080}
-            )
-            context.set_default_timeout(30000)
-            context.set_default_navigation_timeout(30000)
-            
+        with self._pool.context() as context:
             yield context
-            
-        finally:
-            if context:
-                context.close()
     
     @contextmanager
-    def with_shared_browser(self):
+    def with_shared_browser(self, max_contexts: Optional[int] = None,
+                            max_idle_seconds: Optional[float] = None,
+                            max_uses: Optional[int] = None) -> Iterator[ContextPool]:
         """
         Context manager for shared browser lifecycle.
         Use this when you need multiple contexts with the same browser.
         
+        Contexts come from a bounded pool (see ContextPool) configured by the
+        browser.pool config section; the arguments override it. A browser
+        that crashed is relaunched on the next checkout.
+        
+        Args:
+            max_contexts: Maximum number of open contexts
+            max_idle_seconds: Close contexts idle for longer
+            max_uses: Close contexts after this many uses
+        
+        Yields:
+            ContextPool: Pool of the shared browser, e.g. for its metrics
+        
         Example:
             with browser_manager.with_shared_browser():
                 with browser_manager.shared_browser_context() as ctx1:
                     # Use context 1
                 with browser_manager.shared_browser_context() as ctx2:
-                    # Use context 2
+                    # Use context 2 (reuses context 1)
         """
+        options = pool_options(max_size=max_contexts, max_idle_seconds=max_idle_seconds, max_uses=max_uses)
         with sync_playwright() as p:
             try:
                 logger.debug(f"Launching shared browser (headless={self.headless})")
-                self._browser = p.chromium.launch(headless=self.headless)
                 self._playwright = p
+                self._browser = p.chromium.launch(**self._launch_options())
+                self._pool = ContextPool(self._new_shared_context, self._shared_browser_alive,
+                                         self._relaunch_shared_browser, **options)
                 
-                yield
+                yield self._pool
                 
             finally:
+                if self._pool:
+                    self._pool.close()
+                    logger.debug(f"Context pool closed: {self._pool.metrics.as_dict()}")
+                    self._pool = None
                 if self._browser:
                     self._browser.close()
                     self._browser = None
                     logger.debug("Shared browser closed")
 
 
-# Global browser manager instance
-_browser_manager = BrowserManager()
+class AsyncBrowserManager:
+    """
+    Asyncio counterpart of BrowserManager built on playwright.async_api.
+    Provides the same lifecycle guarantees without blocking the event loop.
+    """
+    
+    def __init__(self, headless: bool = True, user_agent: Optional[str] = None,
+                 use_daemon: bool = True, profile: Optional[ScrapeProfile] = None):
+        """
+        Initialize async browser manager.
+        
+        Args:
+            headless: Run browser in headless mode
+            user_agent: Custom user agent string
+            use_daemon: Connect to a running `getcurcur daemon` when available
+            profile: Lean scrape profile applied to every context (None: full pages)
+        """
+        self.headless = headless
+        self.use_daemon = use_daemon
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.profile = profile
+        self._browser: Optional[Any] = None
+        self._playwright: Any = None
+        self._pool: Optional[AsyncContextPool] = None
+    
+    async def _connect_daemon(self, p: Any) -> Optional[Any]:
+        """Connect to the warm browser kept by `getcurcur daemon`, if any."""
+        if not self.use_daemon:
+            return None
+        
+        endpoint = read_daemon_endpoint()
+        if endpoint is None:
+            return None
+        
+        try:
+            browser = await p.chromium.connect_over_cdp(endpoint)
+            logger.debug(f"Connected to browser daemon at {endpoint}")
+            return browser
+        except Exception as e:
+            logger.warning(f"Browser daemon at {endpoint} unreachable, launching locally: {e}")
+            return None
+    
+    def _launch_options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {'headless': self.headless}
+        if self.profile is not None:
+            options['args'] = self.profile.launch_args()
+        return options
+    
+    async def _new_context(self, browser: Any) -> Any:
+        """Create a context with the standard GetCurCur settings."""
+        if self.profile is None:
+            context = await browser.new_context(
+                user_agent=self.user_agent,
+                viewport={'width': 1920, 'height': 1080}
+            )
+        else:
+            context = await browser.new_context(user_agent=self.user_agent, **self.profile.context_options())
+            await context.route("**/*", self.profile.async_route_handler())
+        context.set_default_timeout(30000)
+        context.set_default_navigation_timeout(30000)
+        return context
+    
+    @asynccontextmanager
+    async def browser_context(self) -> AsyncIterator[Any]:
+        """
+        Async context manager that provides a browser context.
+        Automatically manages browser and context lifecycle.
+        
+        Yields:
+            BrowserContext: Playwright async browser context
+            
+        Raises:
+            NetworkError: If browser launch fails
+            RuntimeError: If context creation fails
+        """
+        from getcurcur.exceptions import NetworkError
+        
+        async with async_playwright() as p:
+            self._playwright = p
+            browser = None
+            context = None
+            from_daemon = False
+            
+            try:
+                with span("browser.launch", headless=self.headless):
+                    browser = await self._connect_daemon(p)
+                    from_daemon = browser is not None
+                    
+                    if browser is None:
+                        logger.debug(f"Launching browser (headless={self.headless})")
+                        try:
+                            browser = await p.chromium.launch(**self._launch_options())
+                        except Exception as e:
+                            raise NetworkError(f"Failed to launch browser: {e}")
+                
+                try:
+                    with span("browser.new_context"):
+                        context = await self._new_context(browser)
+                except Exception as e:
+                    raise RuntimeError(f"Failed to create browser context: {e}")
+                
+                yield context
+                
+            except (NetworkError, RuntimeError):
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected browser context error: {e}")
+                raise RuntimeError(f"Browser context management failed: {e}")
+            finally:
+                with span("browser.close"):
+                    if context:
+                        try:
+                            await context.close()
+                            logger.debug("Browser context closed")
+                        except Exception as e:
+                            logger.warning(f"Failed to close browser context: {e}")
+                    if browser and not from_daemon:
+                        try:
+                            await browser.close()
+                            logger.debug("Browser closed")
+                        except Exception as e:
+                            logger.warning(f"Failed to close browser: {e}")
+    
+    @property
+    def pool(self) -> Optional[AsyncContextPool]:
+        """Context pool of the shared browser, while with_shared_browser is active."""
+        return self._pool
+    
+    async def _new_shared_context(self) -> Any:
+        return await self._new_context(self._browser)
+    
+    def _shared_browser_alive(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+    
+    async def _relaunch_shared_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Failed to close disconnected browser: {e}")
+        self._browser = await self._playwright.chromium.launch(**self._launch_options())
+    
+    @asynccontextmanager
+    async def shared_browser_context(self) -> AsyncIterator[Any]:
+        """
+        Async context manager for a context on the shared browser instance.
+        Contexts can be opened concurrently from several tasks.
+        
+        The context is checked out of the shared browser's pool; when every
+        context is in use this waits for one to be checked back in.
+        
+        Yields:
+            BrowserContext: Context on the shared browser
+            
+        Raises:
+            TimeoutError: If no context became free within the pool's acquire timeout
+        """
+        if self._pool is None:
+            raise RuntimeError("Shared browser not initialized. Use 'with_shared_browser' first.")
+        
+        async with self._pool.context() as context:
+            yield context
+    
+    @asynccontextmanager
+    async def with_shared_browser(self, max_contexts: Optional[int] = None,
+                                  max_idle_seconds: Optional[float] = None, max_uses: Optional[int] = None,
+                                  acquire_timeout: Optional[float] = None) -> AsyncIterator[AsyncContextPool]:
+        """
+        Async context manager for shared browser lifecycle.
+        
+        Contexts come from a bounded pool (see AsyncContextPool) configured
+        by the browser.pool config section; the arguments override it.
+        
+        Args:
+            max_contexts: Maximum number of open contexts
+            max_idle_seconds: Close contexts idle for longer
+            max_uses: Close contexts after this many uses
+            acquire_timeout: Seconds a checkout waits for a free context
+        
+        Yields:
+            AsyncContextPool: Pool of the shared browser, e.g. for its metrics
+        
+        Example:
+            async with manager.with_shared_browser():
+                async with manager.shared_browser_context() as ctx:
+                    ...
+        """
+        from getcurcur.config import get_config
+        
+        options = pool_options(max_size=max_contexts, max_idle_seconds=max_idle_seconds, max_uses=max_uses)
+        options['acquire_timeout'] = acquire_timeout if acquire_timeout is not None else \
+            get_config().get("browser.pool.acquire_timeout_seconds", 30)
+        async with async_playwright() as p:
+            try:
+                logger.debug(f"Launching shared browser (headless={self.headless})")
+                self._playwright = p
+                self._browser = await p.chromium.launch(**self._launch_options())
+                self._pool = AsyncContextPool(self._new_shared_context, self._shared_browser_alive,
+                                              self._relaunch_shared_browser, **options)
+                
+                yield self._pool
+                
+            finally:
+                if self._pool:
+                    await self._pool.close()
+                    logger.debug(f"Context pool closed: {self._pool.metrics.as_dict()}")
+                    self._pool = None
+                if self._browser:
+                    await self._browser.close()
+                    self._browser = None
+                    logger.debug("Shared browser closed")
+
+
+# Browser managers by (headless, user agent, profile); callers asking for
+# different settings get their own manager instead of replacing the one
+# another caller may be holding a shared browser on
+_browser_managers: Dict[Tuple[bool, str, Optional[ScrapeProfile]], BrowserManager] = {}
+_browser_managers_lock = threading.Lock()
 
 
 def get_browser_manager(headless: bool = True, user_agent: Optional[str] = None) -> BrowserManager:
     """
     Get or create a browser manager instance.
     
+    The lean scrape profile is taken from the browser.lean config section
+    (off by default).
+    One manager is kept per combination of settings.
+    
     Args:
         headless: Run browser in headless mode
         user_agent: Custom user agent string
@@ -165,18 +945,10 @@ def get_browser_manager(headless: bool = True, user_agent: Optional[str] = None)
     Returns:
         BrowserManager instance
     """
-    global _browser_manager
-    
-    # Set default user agent if not provided
-    if user_agent is None:
-        user_agent = (
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-            '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        )
-    
-    # Update settings if they've changed
-    if (_browser_manager.headless != headless or 
-        _browser_manager.user_agent != user_agent):
-        _browser_manager = BrowserManager(headless=headless, user_agent=user_agent)
-    
-    return _browser_manager
\ No newline at end of file
+    key = (headless, user_agent or DEFAULT_USER_AGENT, ScrapeProfile.from_config())
+    with _browser_managers_lock:
+        manager = _browser_managers.get(key)
+        if manager is None:
+            manager = BrowserManager(headless=key[0], user_agent=key[1], profile=key[2])
+            _browser_managers[key] = manager
+    return manager
@@ -0,0 +1,184 @@
+"""Per-provider circuit breaker persisted next to the rate cache."""
+
+from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitState:
+    """Persisted state of one provider's circuit."""
+
+    state: str = CLOSED
+    # Consecutive failed fetches
+    failures: int = 0
+    # Epoch time until which calls fail fast
+    open_until: float = 0.0
+    last_error: Optional[str] = None
+
+
+class CircuitBreaker:
+    """
+    Stops fetching from a provider after repeated failures.
+
+    After `failure_threshold` consecutive failed fetches the circuit opens
+    and `allow()` refuses fetches for `cooldown_seconds`. The first call
+    after the cooldown is let through as a half-open probe, while other
+    callers keep failing fast for another cooldown: a successful probe
+    closes the circuit, a failed one opens it again.
+
+    The state lives in a small JSON file so separate CLI runs share it.
+    Writes are atomic but not serialized across processes; two processes
+    failing at the same moment may count one failure instead of two.
+    """
+
+    def __init__(self, path: Optional[Path] = None, failure_threshold: int = 3,
+                 cooldown_seconds: float = 300.0, serve_last_known_good: bool = True,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            path: State file; None keeps the state in memory only
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: How long an open circuit fails fast
+            serve_last_known_good: Whether callers should fall back to the
+                last rates ever cached while the circuit is open
+            clock: Returns the current epoch time
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown_seconds
+        self.serve_last_known_good = serve_last_known_good
+        self._clock = clock
+        self._memory = CircuitState()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, provider_name: str, path: Optional[Path] = None,
+                    config: Any = None) -> Optional["CircuitBreaker"]:
+        """
+        Breaker from the circuit_breaker config section.
+
+        Settings under circuit_breaker.providers.<provider name> override
+        the section's defaults for that provider.
+
+        Args:
+            provider_name: Provider name as returned by get_provider_name()
+            path: State file
+            config: Config to read (default: the global config)
+
+        Returns:
+            CircuitBreaker, or None if the breaker is disabled
+        """
+        from getcurcur.config import get_config
+
+        config = config or get_config()
+        section: Dict[str, Any] = dict(config.get("circuit_breaker", {}) or {})
+        section.update((section.pop("providers", None) or {}).get(provider_name) or {})
+        if not section.get("enabled", True):
+            return None
+        return cls(
+            path,
+            failure_threshold=int(section.get("failure_threshold", 3)),
+            cooldown_seconds=float(section.get("cooldown_seconds", 300)),
+            serve_last_known_good=bool(section.get("serve_last_known_good", True)),
+        )
+
+    def _load(self) -> CircuitState:
+        if self.path is None:
+            return CircuitState(**asdict(self._memory))
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return CircuitState(**json.load(f))
+        except FileNotFoundError:
+            return CircuitState()
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable circuit state {self.path}: {e}")
+            return CircuitState()
+
+    def _save(self, state: CircuitState) -> None:
+        if self.path is None:
+            self._memory = state
+            return
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(state), f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save circuit state {self.path}: {e}")
+
+    @property
+    def state(self) -> CircuitState:
+        """Current persisted state."""
+        with self._lock:
+            return self._load()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 if closed)."""
+        state = self.state
+        if state.state == CLOSED:
+            return 0.0
+        return max(0.0, state.open_until - self._clock())
+
+    def allow(self) -> bool:
+        """
+        Whether a fetch may be attempted now.
+
+        Returns:
+            True if the circuit is closed or this call is the half-open
+            probe; False if callers should fail fast
+        """
+        with self._lock:
+            state = self._load()
+            if state.state == CLOSED:
+                return True
+            now = self._clock()
+            if now < state.open_until:
+                return False
+            # Let this call probe; everyone else waits another cooldown
+            state.state = HALF_OPEN
+            state.open_until = now + self.cooldown
+            self._save(state)
+        logger.info(f"Circuit half-open, probing ({self.path or 'in memory'})")
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            state = self._load()
+            if state.state == CLOSED and state.failures == 0:
+                return
+            self._save(CircuitState())
+        if state.state != CLOSED:
+            logger.info(f"Circuit closed after a successful probe ({self.path or 'in memory'})")
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count a failed fetch, opening the circuit at the threshold."""
+        with self._lock:
+            state = self._load()
+            state.failures += 1
+            state.last_error = str(error) or type(error).__name__
+            opened = state.state == HALF_OPEN or state.failures >= self.failure_threshold
+            if opened:
+                state.state = OPEN
+                state.open_until = self._clock() + self.cooldown
+            self._save(state)
+        if opened:
+            logger.warning(f"Circuit open for {self.cooldown:.0f}s after {state.failures} "
+                           f"consecutive failures: {state.last_error}")
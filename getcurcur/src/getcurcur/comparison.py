@@ -0,0 +1,158 @@
+"""Rank one currency's rates across providers."""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+import logging
+
+from getcurcur.conversion import split_unit
+from getcurcur.rates import TRANSACTION_TYPES, ExchangeRate, format_decimal
+
+if TYPE_CHECKING:
+    from getcurcur.fetcher import FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Quote:
+    """One provider's rates for a currency, per `unit` of the currency."""
+
+    identifier: str
+    provider_name: str
+    cash_buy: Optional[Decimal]
+    cash_sell: Optional[Decimal]
+
+    def rate(self, transaction_type: str) -> Optional[Decimal]:
+        """Rate for 'cash_buy' or 'cash_sell'."""
+        rate: Optional[Decimal] = getattr(self, transaction_type)
+        return rate
+
+    @property
+    def spread(self) -> Optional[Decimal]:
+        """Difference between the buying and selling rate."""
+        if self.cash_buy is None or self.cash_sell is None:
+            return None
+        return self.cash_buy - self.cash_sell
+
+    @property
+    def spread_percent(self) -> Optional[float]:
+        """Spread as a percentage of the mid rate."""
+        spread = self.spread
+        if spread is None or not self.cash_buy + self.cash_sell:  # type: ignore[operator]
+            return None
+        return float(spread / ((self.cash_buy + self.cash_sell) / 2) * 100)  # type: ignore[operator]
+
+
+@dataclass
+class Comparison:
+    """
+    Providers ranked by their rate for one currency and transaction type.
+
+    'cash_buy' is what the bank charges for the currency, so the lowest
+    rate ranks first; 'cash_sell' is what it pays, so the highest ranks
+    first. Providers that failed, do not quote the currency or have no rate
+    for the transaction type are listed in `skipped` with the reason.
+    """
+
+    currency: str
+    transaction_type: str
+    unit: int = 1
+    quotes: List[Quote] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def best(self) -> Optional[Quote]:
+        """Best quote, if any provider had a rate."""
+        return self.quotes[0] if self.quotes else None
+
+    def difference(self, quote: Quote) -> Decimal:
+        """How much worse a quote's rate is than the best one (always >= 0)."""
+        best = self.best.rate(self.transaction_type)  # type: ignore[union-attr]
+        rate = quote.rate(self.transaction_type)
+        return rate - best if self.transaction_type == "cash_buy" else best - rate  # type: ignore[operator]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form with rates as displayed strings."""
+        return {
+            "currency": self.currency,
+            "transaction_type": self.transaction_type,
+            "unit": self.unit,
+            "quotes": [
+                {
+                    "rank": rank,
+                    "identifier": quote.identifier,
+                    "provider": quote.provider_name,
+                    "cash_buy": format_decimal(quote.cash_buy),
+                    "cash_sell": format_decimal(quote.cash_sell),
+                    "spread": format_decimal(quote.spread),
+                    "spread_percent": None if quote.spread_percent is None else round(quote.spread_percent, 4),
+                    "difference": format_decimal(self.difference(quote)),
+                }
+                for rank, quote in enumerate(self.quotes, start=1)
+            ],
+            "skipped": dict(self.skipped),
+        }
+
+
+def compare_rates(results: Sequence["FetchResult"], currency: str,
+                  transaction_type: str = "cash_buy") -> Comparison:
+    """
+    Rank providers by their rate for one currency.
+
+    Providers may quote a currency per a different number of units (e.g.
+    "JPY (100)" and "JPY"), so every rate is normalized to the largest unit
+    any provider uses before ranking.
+
+    Args:
+        results: Results of fetch_all
+        currency: Currency code (e.g. "USD" or "JPY")
+        transaction_type: 'cash_buy' or 'cash_sell'
+
+    Returns:
+        Comparison with ranked quotes and skipped providers
+
+    Raises:
+        ValueError: If transaction_type is invalid
+    """
+    if transaction_type not in TRANSACTION_TYPES:
+        raise ValueError(f"Invalid transaction_type: {transaction_type}. Must be 'cash_buy' or 'cash_sell'.")
+    currency, _ = split_unit(currency)
+    comparison = Comparison(currency=currency, transaction_type=transaction_type)
+
+    found = []
+    for result in results:
+        if not result.ok:
+            comparison.skipped[result.identifier] = result.error or "failed"
+            continue
+        for row in result.rates:
+            rate = row if isinstance(row, ExchangeRate) else ExchangeRate.from_dict(row)
+            code, unit = split_unit(rate.code or "")
+            if code == currency:
+                found.append((result, rate, unit))
+                break
+        else:
+            comparison.skipped[result.identifier] = f"{currency} not quoted"
+
+    comparison.unit = max((unit for _, _, unit in found), default=1)
+    ranked = []
+    for result, rate, unit in found:
+        scale = Decimal(comparison.unit) / unit
+        quote = Quote(
+            identifier=result.identifier,
+            provider_name=result.provider_name,
+            cash_buy=None if rate.cash_buy is None else rate.cash_buy * scale,
+            cash_sell=None if rate.cash_sell is None else rate.cash_sell * scale,
+        )
+        if quote.rate(transaction_type) is None:
+            comparison.skipped[result.identifier] = f"no {transaction_type} rate for {currency}"
+        else:
+            ranked.append(quote)
+
+    lowest_first = transaction_type == "cash_buy"
+    ranked.sort(key=lambda quote: quote.identifier)
+    ranked.sort(key=lambda quote: quote.rate(transaction_type), reverse=not lowest_first)  # type: ignore[arg-type,return-value]
+    comparison.quotes = ranked
+    logger.debug(f"Ranked {len(ranked)} providers for {currency} {transaction_type}, "
+                 f"skipped {len(comparison.skipped)}")
+    return comparison
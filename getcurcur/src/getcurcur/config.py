@@ -1,5 +1,6 @@
 """Configuration management for getcurcur."""
 
+import copy
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -13,13 +14,64 @@ class Config:
     
     DEFAULT_CONFIG = {
         "default_provider": "korea.hana",
+        "fetch_mode": "browser",
         "cache": {
             "enabled": True,
-            "ttl_minutes": 30
+            "ttl_minutes": 30,
+            "stale_while_revalidate": False,
+            "max_stale_minutes": 5
+        },
+        "history": {
+            "enabled": True,
+            "path": None
         },
         "browser": {
             "headless": True,
-            "timeout": 30000
+            "timeout": 30000,
+            "max_concurrent": 2,
+            "lean": {
+                "enabled": False,
+                "block_resource_types": ["image", "media", "font", "stylesheet"],
+                "block_third_party": True
+            },
+            "pool": {
+                "max_contexts": 4,
+                "max_idle_seconds": 300,
+                "max_uses": 50,
+                "acquire_timeout_seconds": 30
+            }
+        },
+        "parser": {
+            "backend": "auto"
+        },
+        "retry": {
+            "max_attempts": 3,
+            "base_delay_seconds": 0.5,
+            "max_delay_seconds": 8,
+            "jitter_seconds": 0.5,
+            "deadline_seconds": 60,
+            "transient_errors": ["NetworkError", "TimeoutError", "ConnectionError"],
+            "providers": {}
+        },
+        "circuit_breaker": {
+            "enabled": True,
+            "failure_threshold": 3,
+            "cooldown_seconds": 300,
+            "serve_last_known_good": True,
+            "providers": {}
+        },
+        "serve": {
+            "host": "127.0.0.1",
+            "port": 8765,
+            "interval_minutes": 10,
+            "off_hours_interval_minutes": 120,
+            "jitter_seconds": 30,
+            "bank_hours": {
+                "start": "09:00",
+                "end": "20:00",
+                "utc_offset_hours": 9,
+                "weekdays_only": True
+            }
         },
         "output": {
             "default_format": "table",
@@ -57,16 +109,16 @@ class Config:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     user_config = json.load(f)
                 # Merge with defaults
-                config = self.DEFAULT_CONFIG.copy()
+                config = copy.deepcopy(self.DEFAULT_CONFIG)
                 self._deep_merge(config, user_config)
                 return config
             except Exception as e:
                 logger.warning(f"Failed to load config: {e}, using defaults")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
             # Create default config file
             self._save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def _deep_merge(self, base: Dict, override: Dict):
         """
@@ -103,8 +155,6 @@ class Config:
         Note:
             Uses UTF-8 encoding and formatted JSON (2-space indent) for readability.
         """
-        from ..exceptions import ConfigError
-        
         try:
             # Ensure parent directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -113,7 +163,7 @@ class Config:
                 json.dump(config, f, ensure_ascii=False, indent=2)
                 
             logger.debug(f"Configuration saved to {self.config_path}")
-        except (OSError, json.JSONEncodeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             logger.error(f"Failed to save config to {self.config_path}: {e}")
             # Don't raise to avoid breaking the application
         except Exception as e:
@@ -167,7 +217,7 @@ class Config:
     
     def reset(self):
         """Reset configuration to defaults."""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._save_config(self.config)
 
 
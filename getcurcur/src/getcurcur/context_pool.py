@@ -0,0 +1,446 @@
+"""Bounded pools of browser contexts on one shared browser."""
+
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, AsyncIterator
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass, asdict
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """Counters and gauges of a context pool since it was opened."""
+
+    checkouts: int = 0
+    created: int = 0
+    reused: int = 0
+    # Closed for idle time, use count, a failed probe or a dead browser
+    retired: int = 0
+    probe_failures: int = 0
+    relaunches: int = 0
+    # Checkouts that found every context in use
+    saturated: int = 0
+    timeouts: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    in_use: int = 0
+    idle: int = 0
+    peak_in_use: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Metrics with the mean wait per checkout."""
+        data = asdict(self)
+        data["mean_wait_seconds"] = self.wait_seconds / self.checkouts if self.checkouts else 0.0
+        return data
+
+
+@dataclass
+class PooledContext:
+    """A browser context with its pool bookkeeping."""
+
+    context: Any
+    # Browser launch the context belongs to; older ones are retired
+    generation: int
+    created: float
+    last_used: float
+    uses: int = 0
+
+
+class _PoolState:
+    """Bookkeeping shared by the sync and async pools; never calls Playwright."""
+
+    def __init__(self, max_size: int = 4, max_idle_seconds: Optional[float] = 300.0,
+                 max_uses: Optional[int] = 50, clock: Callable[[], float] = time.monotonic):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.max_uses = max_uses
+        self.clock = clock
+        self.generation = 0
+        self.metrics = PoolMetrics()
+        self._idle: List[PooledContext] = []
+        self._leased: Dict[int, PooledContext] = {}
+        self._reserved = 0
+        self._closed = False
+
+    def _expired(self, slot: PooledContext, now: float) -> bool:
+        if slot.generation != self.generation:
+            return True
+        if self.max_idle_seconds is not None and now - slot.last_used > self.max_idle_seconds:
+            return True
+        return self.max_uses is not None and slot.uses >= self.max_uses
+
+    def _take_idle(self, now: float) -> Tuple[Optional[PooledContext], List[PooledContext]]:
+        """Most recently used idle context within its limits, plus expired ones to close."""
+        expired = []
+        while self._idle:
+            slot = self._idle.pop()
+            if self._expired(slot, now):
+                expired.append(slot)
+                continue
+            return slot, expired
+        return None, expired
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Context pool is closed")
+
+    def _reserve(self) -> bool:
+        """Claim room for a new context if the pool is below max_size."""
+        if len(self._leased) + self._reserved >= self.max_size:
+            return False
+        self._reserved += 1
+        return True
+
+    def _lease(self, slot: PooledContext, now: float, waited: float) -> Any:
+        slot.uses += 1
+        slot.last_used = now
+        self._leased[id(slot.context)] = slot
+        metrics = self.metrics
+        metrics.checkouts += 1
+        metrics.wait_seconds += waited
+        metrics.max_wait_seconds = max(metrics.max_wait_seconds, waited)
+        self._update_gauges()
+        return slot.context
+
+    def _give_back(self, context: Any, healthy: bool) -> Optional[PooledContext]:
+        """Return a leased context; the slot is returned if it must be closed instead."""
+        slot = self._leased.pop(id(context), None)
+        if slot is None:
+            raise ValueError("Context was not checked out from this pool")
+        slot.last_used = self.clock()
+        try:
+            if healthy and not self._closed and not self._expired(slot, slot.last_used):
+                self._idle.append(slot)
+                return None
+            return slot
+        finally:
+            self._update_gauges()
+
+    def _browser_restarted(self) -> None:
+        """Retire every context of the previous browser."""
+        self.generation += 1
+        self.metrics.relaunches += 1
+
+    def _update_gauges(self) -> None:
+        metrics = self.metrics
+        metrics.in_use = len(self._leased)
+        metrics.idle = len(self._idle)
+        metrics.peak_in_use = max(metrics.peak_in_use, metrics.in_use)
+
+    def _drain(self) -> List[PooledContext]:
+        self._closed = True
+        slots, self._idle = self._idle, []
+        self._update_gauges()
+        return slots
+
+    def __len__(self) -> int:
+        return len(self._idle) + len(self._leased)
+
+
+class ContextPool(_PoolState):
+    """
+    Bounded pool of browser contexts on one shared browser (sync API).
+
+    Checked-in contexts are reused, most recently used first, until they
+    have been idle longer than `max_idle_seconds` or served `max_uses`
+    checkouts. Each reused context must pass a liveness probe, and a
+    browser that disconnected is relaunched before contexts are handed out.
+
+    Sync Playwright objects belong to the thread that launched the browser,
+    so only that thread can check contexts in; a saturated pool therefore
+    cannot be freed by waiting and checkout raises instead.
+    """
+
+    def __init__(self, create: Callable[[], Any], browser_alive: Callable[[], bool],
+                 relaunch: Callable[[], None], max_size: int = 4,
+                 max_idle_seconds: Optional[float] = 300.0, max_uses: Optional[int] = 50,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize context pool.
+
+        Args:
+            create: Opens a new context on the shared browser
+            browser_alive: Whether the shared browser is still connected
+            relaunch: Replaces a disconnected shared browser
+            max_size: Maximum number of open contexts
+            max_idle_seconds: Close contexts idle for longer (None: never)
+            max_uses: Close contexts after this many checkouts (None: never)
+            clock: Monotonic clock in seconds
+        """
+        super().__init__(max_size, max_idle_seconds, max_uses, clock)
+        self._create = create
+        self._browser_alive = browser_alive
+        self._relaunch = relaunch
+
+    def _probe(self, context: Any) -> bool:
+        try:
+            # Round trip to the browser; fails for closed contexts
+            context.cookies()
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled context failed its liveness probe: {e}")
+            return False
+
+    def _close(self, slots: List[PooledContext]) -> None:
+        for slot in slots:
+            self.metrics.retired += 1
+            try:
+                slot.context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pooled context: {e}")
+
+    def _ensure_browser(self) -> None:
+        if not self._browser_alive():
+            logger.warning("Shared browser disconnected, relaunching")
+            self._relaunch()
+            self._browser_restarted()
+
+    def checkout(self) -> Any:
+        """
+        Check out a context.
+
+        Returns:
+            BrowserContext; give it back with checkin
+
+        Raises:
+            RuntimeError: If the pool is closed or every context is in use
+        """
+        if self._closed:
+            raise RuntimeError("Context pool is closed")
+        self._ensure_browser()
+        now = self.clock()
+
+        while True:
+            slot, expired = self._take_idle(now)
+            self._close(expired)
+            if slot is None:
+                break
+            if self._probe(slot.context):
+                self.metrics.reused += 1
+                return self._lease(slot, now, 0.0)
+            self.metrics.probe_failures += 1
+            self._close([slot])
+
+        if not self._reserve():
+            self.metrics.saturated += 1
+            raise RuntimeError(f"All {self.max_size} pooled browser contexts are in use")
+        try:
+            try:
+                context = self._create()
+            except Exception:
+                if self._browser_alive():
+                    raise
+                # The browser died since the check above
+                self._ensure_browser()
+                context = self._create()
+        finally:
+            self._reserved -= 1
+        self.metrics.created += 1
+        return self._lease(PooledContext(context, self.generation, now, now), now, 0.0)
+
+    def checkin(self, context: Any, healthy: bool = True) -> None:
+        """
+        Return a checked-out context.
+
+        Args:
+            context: Context from checkout
+            healthy: False closes the context instead of keeping it
+        """
+        slot = self._give_back(context, healthy)
+        if slot is not None:
+            self._close([slot])
+
+    @contextmanager
+    def context(self) -> Iterator[Any]:
+        """Check out a context for the duration of a with block."""
+        context = self.checkout()
+        try:
+            yield context
+        finally:
+            self.checkin(context)
+
+    def close(self) -> None:
+        """Close idle contexts; contexts still checked out are closed on checkin."""
+        self._close(self._drain())
+
+
+class AsyncContextPool(_PoolState):
+    """
+    Bounded pool of browser contexts on one shared browser (async API).
+
+    Same reuse, expiry, probing and relaunch rules as ContextPool. Any task
+    on the event loop can check contexts in, so when every context is in
+    use checkout waits up to `acquire_timeout` seconds for one to be
+    returned; the time spent waiting and the number of saturated checkouts
+    are recorded in `metrics`.
+    """
+
+    def __init__(self, create: Callable[[], Awaitable[Any]], browser_alive: Callable[[], bool],
+                 relaunch: Callable[[], Awaitable[None]], max_size: int = 4,
+                 max_idle_seconds: Optional[float] = 300.0, max_uses: Optional[int] = 50,
+                 acquire_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize async context pool.
+
+        Args:
+            create: Coroutine function opening a new context on the shared browser
+            browser_alive: Whether the shared browser is still connected
+            relaunch: Coroutine function replacing a disconnected shared browser
+            max_size: Maximum number of open contexts
+            max_idle_seconds: Close contexts idle for longer (None: never)
+            max_uses: Close contexts after this many checkouts (None: never)
+            acquire_timeout: Seconds checkout waits for a free context
+            clock: Monotonic clock in seconds
+        """
+        super().__init__(max_size, max_idle_seconds, max_uses, clock)
+        self._create = create
+        self._browser_alive = browser_alive
+        self._relaunch = relaunch
+        self.acquire_timeout = acquire_timeout
+        self._available: Optional[asyncio.Condition] = None
+        self._relaunching: Optional[asyncio.Lock] = None
+
+    @property
+    def _condition(self) -> asyncio.Condition:
+        # Created on first use so the pool can be built outside the event loop
+        if self._available is None:
+            self._available = asyncio.Condition()
+            self._relaunching = asyncio.Lock()
+        return self._available
+
+    async def _probe(self, context: Any) -> bool:
+        try:
+            await context.cookies()
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled context failed its liveness probe: {e}")
+            return False
+
+    async def _close(self, slots: List[PooledContext]) -> None:
+        for slot in slots:
+            self.metrics.retired += 1
+            try:
+                await slot.context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pooled context: {e}")
+
+    async def _ensure_browser(self) -> None:
+        async with self._relaunching:  # type: ignore[union-attr]
+            if not self._browser_alive():
+                logger.warning("Shared browser disconnected, relaunching")
+                await self._relaunch()
+                self._browser_restarted()
+
+    async def _notify(self) -> None:
+        async with self._condition:
+            self._condition.notify()
+
+    async def checkout(self) -> Any:
+        """
+        Check out a context, waiting for one if all are in use.
+
+        Returns:
+            BrowserContext; give it back with checkin
+
+        Raises:
+            RuntimeError: If the pool is closed
+            TimeoutError: If no context became free within acquire_timeout
+        """
+        from getcurcur.exceptions import TimeoutError as GetCurCurTimeoutError
+
+        self._check_open()
+        condition = self._condition
+        await self._ensure_browser()
+        start = self.clock()
+        saturated = False
+
+        while True:
+            timed_out = False
+            # Checked under the condition lock so a checkin cannot slip in
+            # between finding the pool full and waiting
+            async with condition:
+                # A checkout woken by close() must not reserve a slot
+                self._check_open()
+                now = self.clock()
+                slot, expired = self._take_idle(now)
+                reserved = slot is None and self._reserve()
+                if slot is None and not reserved:
+                    if not saturated:
+                        saturated = True
+                        self.metrics.saturated += 1
+                    remaining = self.acquire_timeout - (now - start)
+                    try:
+                        await asyncio.wait_for(condition.wait(), max(0.0, remaining))
+                    except asyncio.TimeoutError:
+                        timed_out = True
+            await self._close(expired)
+
+            if timed_out:
+                self.metrics.timeouts += 1
+                raise GetCurCurTimeoutError(
+                    f"No pooled browser context became free within {self.acquire_timeout:g}s")
+            if self._closed:
+                # close() ran while the expired contexts were being closed
+                if reserved:
+                    self._reserved -= 1
+                if slot is not None:
+                    await self._close([slot])
+                raise RuntimeError("Context pool is closed")
+            if slot is not None:
+                if await self._probe(slot.context):
+                    self.metrics.reused += 1
+                    return self._lease(slot, now, now - start)
+                self.metrics.probe_failures += 1
+                await self._close([slot])
+            elif reserved:
+                break
+
+        try:
+            try:
+                context = await self._create()
+            except Exception:
+                if self._browser_alive():
+                    raise
+                await self._ensure_browser()
+                context = await self._create()
+        except Exception:
+            self._reserved -= 1
+            await self._notify()
+            raise
+        self._reserved -= 1
+        self.metrics.created += 1
+        now = self.clock()
+        return self._lease(PooledContext(context, self.generation, now, now), now, now - start)
+
+    async def checkin(self, context: Any, healthy: bool = True) -> None:
+        """
+        Return a checked-out context and wake one waiting checkout.
+
+        Args:
+            context: Context from checkout
+            healthy: False closes the context instead of keeping it
+        """
+        slot = self._give_back(context, healthy)
+        if slot is not None:
+            await self._close([slot])
+        await self._notify()
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[Any]:
+        """Check out a context for the duration of an async with block."""
+        context = await self.checkout()
+        try:
+            yield context
+        finally:
+            await self.checkin(context)
+
+    async def close(self) -> None:
+        """Close idle contexts and wake waiting checkouts, which then fail."""
+        await self._close(self._drain())
+        async with self._condition:
+            self._condition.notify_all()
@@ -0,0 +1,157 @@
+"""Cross-rate conversion between any currencies of one rate snapshot."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import deque
+import re
+import logging
+
+from getcurcur.rates import TRANSACTION_TYPES, RateTable
+
+logger = logging.getLogger(__name__)
+
+# Currency rates are quoted against when a table comes from this country
+COUNTRY_CURRENCIES = {"KR": "KRW"}
+
+# Codes quoted per several units, e.g. "JPY (100)" is the price of 100 yen
+_UNIT_CODE = re.compile(r"^(?P<code>[A-Za-z]{3})\s*\(\s*(?P<unit>\d+)\s*\)$")
+
+DirectRate = Tuple[str, str, str, float]
+
+
+def split_unit(code: str) -> Tuple[str, int]:
+    """
+    Split a quoted currency code into its ISO code and quote unit.
+
+    Returns:
+        ("JPY", 100) for "JPY (100)", ("USD", 1) for "usd"
+    """
+    code = code.strip()
+    match = _UNIT_CODE.match(code)
+    if match:
+        return match.group("code").upper(), int(match.group("unit")) or 1
+    return code.upper(), 1
+
+
+class ConversionEngine:
+    """
+    Conversion rates between every pair of currencies in a rate table.
+
+    Currencies form a graph: each row links its currency with the table's
+    base currency (KRW for Korean banks) at the per-unit rate, so quotes
+    such as "JPY (100)" become rates per single yen. Direct pairs a
+    provider publishes are added as their own edges. The rate between two
+    currencies follows the path with the fewest conversions, so a direct
+    pair is preferred over going through the base currency.
+
+    The same transaction type is used for every leg: with 'cash_buy',
+    100 USD -> JPY is the KRW price of 100 USD divided by the KRW price of
+    one yen. The full matrix for a transaction type is computed on first
+    use, after which every conversion is a dict lookup.
+    """
+
+    def __init__(self, rates: RateTable, base: Optional[str] = None,
+                 direct_rates: Iterable[DirectRate] = ()):
+        """
+        Initialize conversion engine.
+
+        Args:
+            rates: Rate snapshot to convert with
+            base: Currency the rates are quoted in (default: from the table's country, else KRW)
+            direct_rates: Extra (from, to, transaction type, rate) pairs, the rate being
+                the amount of `to` per one unit of `from`
+        """
+        self.rates = rates
+        self.base = (base or COUNTRY_CURRENCIES.get(rates.country.upper(), "KRW")).upper()
+        self.direct_rates = list(direct_rates)
+        self._matrices: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def _edges(self, transaction_type: str) -> Dict[str, Dict[str, float]]:
+        edges: Dict[str, Dict[str, float]] = {self.base: {}}
+        # The first row wins when a currency appears more than once
+        for code, value in zip(self.rates.codes, self.rates.values(transaction_type)):
+            if not code or value is None:
+                continue
+            currency, unit = split_unit(code)
+            if currency == self.base or currency in edges:
+                continue
+            per_unit = value / unit
+            edges[currency] = {self.base: per_unit}
+            edges[self.base][currency] = 1 / per_unit
+
+        for source, target, rate_type, rate in self.direct_rates:
+            if rate_type != transaction_type or not rate or rate <= 0:
+                continue
+            source, target = source.upper(), target.upper()
+            edges.setdefault(source, {})[target] = rate
+            edges.setdefault(target, {})[source] = 1 / rate
+        return edges
+
+    @staticmethod
+    def _check_type(transaction_type: str) -> None:
+        if transaction_type not in TRANSACTION_TYPES:
+            raise ValueError(f"Invalid transaction_type: {transaction_type}. "
+                             f"Must be 'cash_buy' or 'cash_sell'.")
+
+    def base_rates(self, transaction_type: str = "cash_buy") -> Dict[str, float]:
+        """
+        Price in the base currency of one unit of every currency linked to it.
+
+        Returns:
+            {currency: amount of base per one unit}, the base itself being 1
+        """
+        self._check_type(transaction_type)
+        rates = {self.base: 1.0}
+        for currency, targets in self._edges(transaction_type).items():
+            if self.base in targets:
+                rates[currency] = targets[self.base]
+        return rates
+
+    def direct_currencies(self, transaction_type: str = "cash_buy") -> List[str]:
+        """Currencies with a direct pair of this transaction type."""
+        self._check_type(transaction_type)
+        currencies = (code.upper() for source, target, rate_type, rate in self.direct_rates
+                      if rate_type == transaction_type and rate and rate > 0 for code in (source, target))
+        return list(dict.fromkeys(currencies))
+
+    def matrix(self, transaction_type: str = "cash_buy") -> Dict[str, Dict[str, float]]:
+        """
+        Rate from every currency to every reachable currency, computed once.
+
+        Returns:
+            {from: {to: amount of `to` per one `from`}}
+        """
+        matrix = self._matrices.get(transaction_type)
+        if matrix is None:
+            self._check_type(transaction_type)
+            edges = self._edges(transaction_type)
+            matrix = {}
+            for source in edges:
+                # Breadth-first: fewest conversions from the source currency
+                reached = {source: 1.0}
+                queue = deque([source])
+                while queue:
+                    current = queue.popleft()
+                    for target, rate in edges[current].items():
+                        if target not in reached:
+                            reached[target] = reached[current] * rate
+                            queue.append(target)
+                matrix[source] = reached
+            self._matrices[transaction_type] = matrix
+        return matrix
+
+    def currencies(self) -> List[str]:
+        """Every currency the engine can convert, base currency first."""
+        return list(self.matrix("cash_buy")) or [self.base]
+
+    def rate(self, from_currency: str, to_currency: str,
+             transaction_type: str = "cash_buy") -> Optional[float]:
+        """Amount of `to_currency` per one `from_currency`, or None if not convertible."""
+        source, _ = split_unit(from_currency)
+        target, _ = split_unit(to_currency)
+        return self.matrix(transaction_type).get(source, {}).get(target)
+
+    def convert(self, amount: float, from_currency: str, to_currency: str,
+                transaction_type: str = "cash_buy") -> Optional[float]:
+        """Convert an amount, or return None if either currency is missing."""
+        rate = self.rate(from_currency, to_currency, transaction_type)
+        return None if rate is None else amount * rate
@@ -0,0 +1,203 @@
+"""Long-lived browser daemon for GetCurCur."""
+
+from typing import Optional, Any, List
+from pathlib import Path
+import json
+import os
+import shutil
+import signal
+import tempfile
+import time
+import logging
+
+from playwright.sync_api import sync_playwright
+
+from getcurcur.browser_manager import DAEMON_STATE_FILE, ScrapeProfile, read_daemon_endpoint
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserDaemon:
+    """
+    Keeps a warm Chromium instance running and publishes its CDP endpoint.
+
+    CLI invocations find the endpoint through the daemon state file and
+    connect to it instead of launching a browser of their own. By default
+    Chromium picks a free port, so the endpoint is only discoverable through
+    the state file, which is readable by the owner alone.
+    """
+
+    def __init__(self, port: int = 0, headless: bool = True,
+                 state_file: Optional[Path] = None, poll_interval: float = 1.0,
+                 profile: Optional[ScrapeProfile] = None, port_timeout: float = 10.0):
+        """
+        Initialize browser daemon.
+
+        Args:
+            port: Local port for the Chrome DevTools Protocol endpoint (0: any free port)
+            headless: Run browser in headless mode
+            state_file: Path where the daemon endpoint is published
+            poll_interval: Seconds between browser liveness checks
+            profile: Lean scrape profile whose launch args the browser uses
+                (default: the browser.lean config section)
+            port_timeout: Seconds to wait for Chromium to report its port
+        """
+        self.port = port
+        self.headless = headless
+        self.state_file = state_file or DAEMON_STATE_FILE
+        self.poll_interval = poll_interval
+        self.profile = profile if profile is not None else ScrapeProfile.from_config()
+        self.port_timeout = port_timeout
+        self._user_data_dir: Optional[str] = None
+        self._running = False
+
+    @property
+    def endpoint(self) -> str:
+        """CDP endpoint URL served by this daemon."""
+        return f"http://127.0.0.1:{self.port}"
+
+    def launch_args(self) -> List[str]:
+        """Chromium flags for the daemon browser."""
+        args = [
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+        ]
+        if self.profile is not None:
+            args.extend(self.profile.launch_args())
+        return args
+
+    def _launch(self, p: Any) -> Any:
+        """
+        Launch Chromium with the remote debugging endpoint enabled.
+
+        The browser gets a private user data directory so the port Chromium
+        chose can be read back from its DevToolsActivePort file.
+
+        Returns:
+            The launched browser
+        """
+        self._remove_user_data_dir()
+        self._user_data_dir = tempfile.mkdtemp(prefix="getcurcur-daemon-")
+        logger.debug(f"Launching daemon browser (headless={self.headless}, profile={self.profile})")
+        context = p.chromium.launch_persistent_context(
+            self._user_data_dir,
+            headless=self.headless,
+            args=self.launch_args(),
+        )
+        self.port = self._read_active_port(Path(self._user_data_dir) / "DevToolsActivePort")
+        return context.browser
+
+    def _read_active_port(self, port_file: Path) -> int:
+        """
+        Wait for Chromium to report the port it is listening on.
+
+        Raises:
+            RuntimeError: If no port is reported within port_timeout
+        """
+        deadline = time.monotonic() + self.port_timeout
+        while True:
+            try:
+                return int(port_file.read_text(encoding='utf-8').splitlines()[0])
+            except (OSError, ValueError, IndexError):
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Daemon browser did not report its debugging port ({port_file})")
+                time.sleep(0.05)
+
+    def _remove_user_data_dir(self) -> None:
+        """Delete the user data directory of the previous browser."""
+        if self._user_data_dir is not None:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+
+    def _write_state(self) -> None:
+        """Publish the endpoint so clients can discover the daemon."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_suffix('.tmp')
+        # Anyone who can read the endpoint can drive the browser
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(temp_file, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'pid': os.getpid(), 'endpoint': self.endpoint}, f)
+        temp_file.replace(self.state_file)
+
+    def _remove_state(self) -> None:
+        """Remove the state file if it still belongs to this process."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('pid') == os.getpid():
+                self.state_file.unlink()
+        except (OSError, ValueError):
+            pass
+
+    def stop(self, *_: Any) -> None:
+        """Request the serve loop to exit."""
+        self._running = False
+
+    def serve_forever(self) -> None:
+        """
+        Run the daemon until interrupted.
+
+        Relaunches the browser if it crashes so clients keep finding a
+        live endpoint behind the published state file.
+
+        Raises:
+            RuntimeError: If another daemon is already running
+        """
+        if read_daemon_endpoint(self.state_file) is not None:
+            raise RuntimeError(f"Browser daemon already running (state file: {self.state_file})")
+
+        signal.signal(signal.SIGTERM, self.stop)
+        self._running = True
+
+        with sync_playwright() as p:
+            try:
+                browser = self._launch(p)
+            except Exception:
+                self._remove_user_data_dir()
+                raise
+            self._write_state()
+            logger.info(f"Browser daemon listening on {self.endpoint}")
+
+            try:
+                while self._running:
+                    time.sleep(self.poll_interval)
+                    if not browser.is_connected():
+                        logger.warning("Daemon browser disconnected, relaunching")
+                        browser = self._launch(p)
+                        self._write_state()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self._remove_state()
+                try:
+                    browser.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close daemon browser: {e}")
+                self._remove_user_data_dir()
+                logger.info("Browser daemon stopped")
+
+
+def stop_daemon(state_file: Optional[Path] = None) -> bool:
+    """
+    Stop a running browser daemon.
+
+    Args:
+        state_file: Path to the daemon state file
+
+    Returns:
+        True if a daemon was signalled, False if none was running
+    """
+    state_file = state_file or DAEMON_STATE_FILE
+
+    if read_daemon_endpoint(state_file) is None:
+        return False
+
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            pid = int(json.load(f)['pid'])
+        os.kill(pid, signal.SIGTERM)
+    except (OSError, ValueError, KeyError):
+        return False
+
+    return True
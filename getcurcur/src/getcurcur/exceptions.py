@@ -33,4 +33,8 @@ class ConfigError(GetCurCurError):
 
 class CacheError(GetCurCurError):
     """Exception raised for cache-related errors."""
-    pass
\ No newline at end of file
+    pass
+
+class CircuitOpenError(ProviderError):
+    """Exception raised when a provider's circuit breaker is refusing fetches."""
+    pass
@@ -0,0 +1,104 @@
+"""Concurrent multi-provider rate fetching."""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+import threading
+import time
+import logging
+
+from getcurcur.browser_manager import BrowserManager, get_browser_manager, read_daemon_endpoint
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.rates import ExchangeRate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching rates from a single provider."""
+
+    identifier: str
+    provider_name: str
+    rates: Sequence[ExchangeRate] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the provider returned rates."""
+        return self.error is None
+
+
+def fetch_all(providers: Dict[str, ExchangeRateProvider], use_cache: bool = True,
+              timeout: float = 60.0,
+              browser_manager: Optional[BrowserManager] = None,
+              max_browsers: Optional[int] = None) -> List[FetchResult]:
+    """
+    Fetch rates from several providers concurrently.
+
+    Each provider runs in its own worker thread with a lazily opened browser
+    context (Playwright's sync API is bound to the thread that started it),
+    so providers served from cache or an HTTP fast path never start a
+    browser. When `getcurcur daemon` is running every worker attaches to its
+    shared browser instead of launching one; otherwise at most
+    `max_browsers` workers run a browser of their own at a time and the
+    rest wait for one to close. Total wall time is bounded by the slowest
+    provider, capped at `timeout`.
+
+    Args:
+        providers: Provider instances keyed by identifier (e.g. "korea.hana")
+        use_cache: Whether providers may serve cached data
+        timeout: Seconds to wait for each provider before reporting it as timed out
+        browser_manager: Browser manager used to open contexts
+        max_browsers: Browsers launched at once without the daemon
+            (default: browser.max_concurrent from config)
+
+    Returns:
+        One FetchResult per provider, in input order. Failed or timed out
+        providers carry an error message and no rates.
+    """
+    browser_manager = browser_manager or get_browser_manager(headless=True)
+    launch_slots = None
+    if not (browser_manager.use_daemon and read_daemon_endpoint()):
+        if max_browsers is None:
+            from getcurcur.config import get_config
+            max_browsers = get_config().get("browser.max_concurrent", 2)
+        launch_slots = threading.BoundedSemaphore(max(1, int(max_browsers)))
+    results = {
+        identifier: FetchResult(identifier=identifier, provider_name=provider.get_provider_name())
+        for identifier, provider in providers.items()
+    }
+    done = {identifier: threading.Event() for identifier in providers}
+
+    def _worker(identifier: str, provider: ExchangeRateProvider) -> None:
+        result = results[identifier]
+        start = time.perf_counter()
+        try:
+            with browser_manager.browser_context(lazy=True, launch_slots=launch_slots) as context:
+                result.rates = provider.get_rates(context, use_cache=use_cache)
+        except Exception as e:
+            logger.warning(f"Failed to fetch rates from {result.provider_name}: {e}")
+            result.error = str(e) or type(e).__name__
+        finally:
+            result.elapsed = time.perf_counter() - start
+            done[identifier].set()
+
+    for identifier, provider in providers.items():
+        # Daemon threads so a hung provider cannot keep the process alive
+        threading.Thread(
+            target=_worker, args=(identifier, provider),
+            name=f"getcurcur-fetch-{identifier}", daemon=True,
+        ).start()
+
+    deadline = time.monotonic() + timeout
+    for identifier, event in done.items():
+        if not event.wait(max(0.0, deadline - time.monotonic())):
+            logger.warning(f"Timed out fetching rates from {identifier}")
+            results[identifier] = FetchResult(
+                identifier=identifier,
+                provider_name=results[identifier].provider_name,
+                error=f"Timed out after {timeout:g}s",
+                elapsed=timeout,
+            )
+
+    return [results[identifier] for identifier in providers]
@@ -0,0 +1,235 @@
+"""Append-only local history of fetched exchange rates."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import logging
+
+from getcurcur.conversion import split_unit
+from getcurcur.rates import ExchangeRate, RateTable, parse_decimal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_PATH = Path.home() / ".getcurcur" / "history.db"
+
+# base_code is the code without its quote unit ("JPY" for "JPY (100)"), so
+# lookups by currency are plain equality matches the indexes can serve
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rates (
+    provider  TEXT NOT NULL,
+    code      TEXT NOT NULL,
+    ts        REAL NOT NULL,
+    currency  TEXT NOT NULL,
+    cash_buy  TEXT,
+    cash_sell TEXT,
+    country   TEXT NOT NULL,
+    base_code TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rates_provider_base_code_ts ON rates (provider, base_code, ts);
+CREATE INDEX IF NOT EXISTS idx_rates_base_code_ts ON rates (base_code, ts);
+"""
+
+_DURATION = re.compile(r"^(?P<count>\d+)\s*(?P<unit>[mhdw])$")
+_DURATION_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_time_spec(value: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Parse a relative duration ("30m", "12h", "7d", "2w") or an ISO date/time.
+
+    Args:
+        value: Duration before now, or an ISO 8601 date or datetime
+        now: Reference time for durations (default: datetime.now())
+
+    Returns:
+        Naive local datetime
+
+    Raises:
+        ValueError: If the value is neither a duration nor an ISO timestamp
+    """
+    text = value.strip().lower()
+    match = _DURATION.match(text)
+    if match:
+        delta = timedelta(**{_DURATION_UNITS[match.group("unit")]: int(match.group("count"))})
+        return (now or datetime.now()) - delta
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise ValueError(f"Invalid time '{value}': use e.g. 7d, 12h, 2024-01-31 or 2024-01-31T09:00")
+
+
+@dataclass(frozen=True)
+class HistoryPoint:
+    """An exchange rate as recorded at one point in time."""
+
+    timestamp: datetime
+    rate: ExchangeRate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the point as a dict of displayed strings."""
+        data = self.rate.to_dict()
+        data["timestamp"] = self.timestamp.isoformat(timespec="seconds")
+        return data
+
+
+class RateHistory:
+    """
+    SQLite store of every freshly fetched rate snapshot.
+
+    Rows are only ever appended. Range and as-of queries go through an index
+    on (provider, unit-free code, timestamp), or (unit-free code, timestamp)
+    across providers. A short-lived connection is opened per operation, so
+    one instance can be shared between threads and processes.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize rate history.
+
+        Args:
+            db_path: SQLite database file (default: ~/.getcurcur/history.db)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_HISTORY_PATH
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def record(self, rates: RateTable, timestamp: Optional[datetime] = None) -> int:
+        """
+        Append a snapshot of rates.
+
+        Args:
+            rates: Rates to store; each row keeps the table's provider
+            timestamp: Snapshot time (default: now)
+
+        Returns:
+            Number of rows written
+        """
+        ts = (timestamp or datetime.now()).timestamp()
+        rows = [
+            (rates.provider, code, ts, currency,
+             None if buy is None else str(buy), None if sell is None else str(sell), rates.country,
+             split_unit(code)[0])
+            for currency, code, buy, sell in zip(rates.currencies, rates.codes, rates.cash_buy, rates.cash_sell)
+            if code
+        ]
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO rates (provider, code, ts, currency, cash_buy, cash_sell, country, base_code) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        finally:
+            conn.close()
+        logger.debug(f"Recorded {len(rows)} rates from {rates.provider} in history")
+        return len(rows)
+
+    @staticmethod
+    def _where(code: str, provider: Optional[str]) -> Tuple[str, List[Any]]:
+        # Unit-quoted codes such as "JPY (100)" also match a plain "JPY" query
+        clauses = ["base_code = ?"]
+        params: List[Any] = [split_unit(code)[0]]
+        if provider:
+            clauses.insert(0, "provider = ?")
+            params.insert(0, provider)
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _to_point(row: Tuple[Any, ...]) -> HistoryPoint:
+        provider, code, ts, currency, cash_buy, cash_sell, country = row
+        rate = ExchangeRate(currency, code, parse_decimal(cash_buy or ""), parse_decimal(cash_sell or ""),
+                            provider, country)
+        return HistoryPoint(timestamp=datetime.fromtimestamp(ts), rate=rate)
+
+    def range(self, code: str, since: Optional[datetime] = None, until: Optional[datetime] = None,
+              provider: Optional[str] = None) -> List[HistoryPoint]:
+        """
+        Return recorded rates for a currency within a time range.
+
+        Args:
+            code: Currency code (e.g., USD)
+            since: Earliest timestamp, inclusive
+            until: Latest timestamp, inclusive
+            provider: Provider name; all providers if None
+
+        Returns:
+            History points ordered by time
+        """
+        where, params = self._where(code, provider)
+        if since is not None:
+            where += " AND ts >= ?"
+            params.append(since.timestamp())
+        if until is not None:
+            where += " AND ts <= ?"
+            params.append(until.timestamp())
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT provider, code, ts, currency, cash_buy, cash_sell, country "
+                f"FROM rates WHERE {where} ORDER BY ts, provider",
+                params,
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self._to_point(row) for row in rows]
+
+    def as_of(self, code: str, when: datetime, provider: Optional[str] = None) -> Optional[HistoryPoint]:
+        """
+        Return the last rate recorded for a currency at or before a time.
+
+        Args:
+            code: Currency code (e.g., USD)
+            when: Point in time to look up
+            provider: Provider name; the latest from any provider if None
+
+        Returns:
+            History point, or None if nothing was recorded before `when`
+        """
+        where, params = self._where(code, provider)
+        params.append(when.timestamp())
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT provider, code, ts, currency, cash_buy, cash_sell, country "
+                f"FROM rates WHERE {where} AND ts <= ? ORDER BY ts DESC LIMIT 1",
+                params,
+            ).fetchone()
+        finally:
+            conn.close()
+        return None if row is None else self._to_point(row)
+
+
+# Global history instance
+_rate_history: Optional[RateHistory] = None
+
+
+def get_rate_history() -> RateHistory:
+    """Get the shared rate history (path from history.path in the config)."""
+    global _rate_history
+    if _rate_history is None:
+        from getcurcur.config import get_config
+
+        path = get_config().get("history.path")
+        _rate_history = RateHistory(Path(path).expanduser() if path else None)
+    return _rate_history
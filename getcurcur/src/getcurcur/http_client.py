@@ -0,0 +1,212 @@
+"""Pooled HTTP client for providers that can skip the browser."""
+
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+import gzip
+import http.client
+import threading
+import zlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HttpResponse:
+    """Fully read HTTP response."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        """
+        Initialize response.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers with lower-cased names
+            body: Decoded (decompressed) response body
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def charset(self) -> str:
+        """Charset declared in the Content-Type header (default: utf-8)."""
+        content_type = self.headers.get('content-type', '')
+        for part in content_type.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return 'utf-8'
+
+    def text(self) -> str:
+        """Return the body decoded with the declared charset."""
+        try:
+            return self.body.decode(self.charset, errors='replace')
+        except LookupError:
+            return self.body.decode('utf-8', errors='replace')
+
+
+class HttpClient:
+    """
+    Minimal HTTP/1.1 client with per-host keep-alive connection pooling.
+
+    Connections are reused across requests so repeated fetches skip the TCP
+    and TLS handshakes. Safe to share between threads.
+    """
+
+    def __init__(self, timeout: float = 10.0, max_idle_per_host: int = 4,
+                 user_agent: Optional[str] = None):
+        """
+        Initialize HTTP client.
+
+        Args:
+            timeout: Socket timeout in seconds
+            max_idle_per_host: Maximum idle connections kept per host
+            user_agent: User agent sent with every request
+        """
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection for the host, or a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _checkin(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            body: Request body
+            headers: Extra request headers
+
+        Returns:
+            HttpResponse with the decompressed body
+
+        Raises:
+            NetworkError: If the request fails or the status is not 2xx
+        """
+        from getcurcur.exceptions import NetworkError
+
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname or '', port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+        }
+        request_headers.update(headers or {})
+
+        # A reused connection may have been closed by the server while idle;
+        # retry once on a fresh connection in that case.
+        for _ in range(2):
+            conn, reused = self._checkout(key)
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                response = conn.getresponse()
+                raw = response.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused:
+                    logger.debug(f"Pooled connection to {key[1]} went stale, reconnecting")
+                    continue
+                raise NetworkError(f"Request to {url} failed: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise NetworkError(f"Request to {url} failed: {e}")
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+
+            if response_headers.get('content-encoding') == 'gzip':
+                try:
+                    raw = gzip.decompress(raw)
+                except (OSError, EOFError, zlib.error) as e:
+                    raise NetworkError(f"Request to {url} returned an invalid gzip body: {e}")
+
+            if not 200 <= response.status < 300:
+                raise NetworkError(f"Request to {url} returned HTTP {response.status}")
+
+            return HttpResponse(response.status, response_headers, raw)
+
+        raise NetworkError(f"Request to {url} failed: connection closed by server")
+
+    def post_form(self, url: str, data: Dict[str, str],
+                  headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """
+        POST url-encoded form data.
+
+        Args:
+            url: Absolute URL
+            data: Form fields
+            headers: Extra request headers
+
+        Returns:
+            HttpResponse
+        """
+        request_headers = {'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'}
+        request_headers.update(headers or {})
+        return self.request('POST', url, body=urlencode(data).encode('utf-8'), headers=request_headers)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+
+# Global HTTP client instance
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """Get the shared HTTP client instance."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
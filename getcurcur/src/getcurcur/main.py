@@ -1,19 +1,29 @@
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from typing_extensions import Annotated
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import csv
 import json
 import logging
+import math
 
 from pathlib import Path
 import shutil
+from contextlib import nullcontext
 from enum import Enum
-from getcurcur.providers.korea import HanaBankProvider
-from getcurcur.providers.base import ExchangeRateProvider
 from getcurcur.exceptions import ProviderError, NetworkError
-from getcurcur.browser_manager import get_browser_manager
+from getcurcur.rates import as_dicts
+from getcurcur.registry import get_provider_registry
+
+# Providers, Playwright and the browser manager are imported by the commands
+# that fetch rates, so --version, --help and list-providers start quickly
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from getcurcur.browser_manager import BrowserManager
+    from getcurcur.fetcher import FetchResult
+    from getcurcur.providers.base import ExchangeRateProvider
+    from getcurcur.rates import ExchangeRate
+    from getcurcur.tracing import Tracer
 
 
 # Setup logging
@@ -22,7 +32,30 @@ logger = logging.getLogger(__name__)
 
 # Typer 애플리케이션 생성
 app = typer.Typer(help="Get current currency exchange rates from various banks.")
-console = Console()
+
+
+class _DeferredConsole:
+    """Rich console that imports rich and is created on first use."""
+    
+    def __init__(self, **options: Any):
+        self._options = options
+        self._console: Optional["Console"] = None
+    
+    @property
+    def console(self) -> "Console":
+        if self._console is None:
+            from rich.console import Console
+            
+            self._console = Console(**self._options)
+        return self._console
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.console, name)
+
+
+console = _DeferredConsole()
+# Status notes go to stderr so JSON/CSV output on stdout stays parseable
+err_console = _DeferredConsole(stderr=True)
 
 
 class OutputFormat(str, Enum):
@@ -32,29 +65,46 @@ class OutputFormat(str, Enum):
     csv = "csv"
 
 
-# Provider registry - will be expanded as more providers are added
-PROVIDERS = {
-    "korea": {
-        "hana": HanaBankProvider,
-        # Future: "kb": KBBankProvider,
-        # Future: "shinhan": ShinhanBankProvider,
-    },
-    # Future: "usa": {...},
-    # Future: "japan": {...},
-}
+class BatchFormat(str, Enum):
+    """Output format options for batch conversion."""
+    csv = "csv"
+    jsonl = "jsonl"
+
+
+class MatrixFormat(str, Enum):
+    """Output format options for the conversion matrix."""
+    csv = "csv"
+    json = "json"
+    npy = "npy"
+
+
+def get_all_providers() -> Dict[str, str]:
+    """Get the import paths of all available providers keyed by identifier (e.g. "korea.hana")."""
+    return dict(get_provider_registry().paths)
+
+
+def load_provider_class(identifier: str) -> type:
+    """Import the provider class registered for an identifier."""
+    return get_provider_registry().load(identifier)
 
 
-def get_all_providers() -> dict:
-    """Get all available providers organized by country."""
-    result = {}
-    for country, banks in PROVIDERS.items():
-        for bank_name, provider_class in banks.items():
-            key = f"{country}.{bank_name}"
-            result[key] = provider_class
-    return result
+def resolve_provider(identifier: str) -> str:
+    """
+    Resolve a provider identifier to its registry key.
+    
+    Args:
+        identifier: Provider identifier (e.g., "hana" or "korea.hana")
+    
+    Returns:
+        Registry key (e.g., "korea.hana")
+    
+    Raises:
+        ValueError: If provider not found
+    """
+    return get_provider_registry().resolve(identifier)
 
 
-def get_provider(identifier: str) -> ExchangeRateProvider:
+def get_provider(identifier: str) -> "ExchangeRateProvider":
     """
     Get a provider instance by identifier.
     
@@ -66,72 +116,185 @@ def get_provider(identifier: str) -> ExchangeRateProvider:
     
     Raises:
         ValueError: If provider not found
+        ProviderError: If the provider's module cannot be imported
     """
-    all_providers = get_all_providers()
+    provider: "ExchangeRateProvider" = load_provider_class(identifier)()
+    return provider
+
+
+def get_browser_manager(headless: bool = True) -> "BrowserManager":
+    """Get the shared browser manager, importing Playwright on first use."""
+    from getcurcur.browser_manager import get_browser_manager as get_shared_browser_manager
     
-    # Try direct match first
-    if identifier in all_providers:
-        return all_providers[identifier]()
+    return get_shared_browser_manager(headless=headless)
+
+
+def _spinner() -> "Progress":
+    """Transient spinner shown while rates are fetched."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
-    # Try adding default country prefix
-    if "korea." + identifier in all_providers:
-        return all_providers["korea." + identifier]()
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console.console,
+        transient=True,
+    )
+
+
+def _report_stale(provider: "ExchangeRateProvider") -> None:
+    """Tell the user when rates came from a stale cache entry or the last known good rates."""
+    from getcurcur.providers.base import CacheEntry
+    
+    entry = getattr(provider, "last_cache_entry", None)
+    if isinstance(entry, CacheEntry) and entry.last_known_good:
+        err_console.print(f"[yellow]{provider.get_provider_name()} is currently unavailable; showing the "
+                          f"last known rates from {entry.timestamp:%Y-%m-%d %H:%M}.[/yellow]")
+    elif isinstance(entry, CacheEntry) and entry.stale:
+        minutes = int(entry.age.total_seconds() // 60)
+        err_console.print(f"[dim]Showing rates cached {minutes} minutes ago; "
+                          f"refreshing in the background.[/dim]")
+
+
+def _print_timings(tracer: "Tracer") -> None:
+    """Per-phase breakdown of a trace, nested phases indented, on stderr."""
+    from rich.table import Table
     
-    # Try matching just the bank name (backwards compatibility)
-    for key, provider_class in all_providers.items():
-        if key.split(".")[-1] == identifier:
-            return provider_class()
+    wall = tracer.elapsed
+    table = Table(title=f"Timings (wall {wall * 1000:.1f} ms)")
+    table.add_column("Phase", style="cyan", no_wrap=True)
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right", style="green")
+    table.add_column("Max ms", justify="right")
+    table.add_column("% wall", justify="right", style="yellow")
+    for phase in tracer.phases():
+        table.add_row(
+            "  " * phase.depth + phase.name,
+            str(phase.calls),
+            f"{phase.total * 1000:.1f}",
+            f"{phase.max * 1000:.1f}",
+            f"{phase.total / wall * 100:.1f}" if wall else "-",
+        )
+    err_console.print(table)
+
+
+def _enable_timings(ctx: typer.Context, timings: bool, trace: Optional[Path]) -> None:
+    """Trace the command and report when it finishes, however it exits."""
+    if not timings and trace is None:
+        return
+    from getcurcur.tracing import start_tracing, stop_tracing
     
-    raise ValueError(f"Provider '{identifier}' not found")
+    start_tracing()
+    
+    def _report() -> None:
+        tracer = stop_tracing()
+        if tracer is None:
+            return
+        if timings:
+            _print_timings(tracer)
+        if trace is not None:
+            try:
+                tracer.write_chrome_trace(trace)
+                err_console.print(f"[dim]Trace with {len(tracer.spans)} spans written to {trace}[/dim]")
+            except OSError as e:
+                err_console.print(f"[bold red]Failed to write trace: {e}[/bold red]")
+    
+    ctx.call_on_close(_report)
+
+
+def _load_all_providers() -> Dict[str, "ExchangeRateProvider"]:
+    """Instantiate every registered provider, skipping plugins that fail to import."""
+    providers = {}
+    for key in sorted(get_all_providers()):
+        try:
+            providers[key] = get_provider(key)
+        except ProviderError as e:
+            err_console.print(f"[yellow]Skipped {key}: {e}[/yellow]")
+    return providers
+
+
+def _fetch_all_results(no_cache: bool, timeout: float) -> List["FetchResult"]:
+    """Fetch rates from every registered provider concurrently, one FetchResult each."""
+    from getcurcur.fetcher import fetch_all
+
+    providers = _load_all_providers()
+
+    with _spinner() as progress:
+        progress.add_task(f"Fetching rates from {len(providers)} providers...", total=None)
+        return fetch_all(providers, use_cache=not no_cache, timeout=timeout)
+
+
+def _fetch_all_rates(no_cache: bool, timeout: float) -> List["ExchangeRate"]:
+    """Fetch rates from every registered provider concurrently."""
+    results = _fetch_all_results(no_cache, timeout)
+
+    rates: List["ExchangeRate"] = []
+    for result in results:
+        if result.ok:
+            rates.extend(result.rates)
+        else:
+            err_console.print(f"[yellow]Skipped {result.identifier}: {result.error}[/yellow]")
+
+    if not any(result.ok for result in results):
+        err_console.print("[bold red]Error: all providers failed[/bold red]")
+        raise typer.Exit(code=1)
+
+    return rates
 
 
 @app.command()
 def show(
-    bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider (e.g., 'hana' or 'korea.hana')")] = "hana",
+    ctx: typer.Context,
+    bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider (e.g., 'hana', 'korea.hana' or 'all')")] = "hana",
     currency: Annotated[Optional[str], typer.Option("--currency", "-c", help="Filter by currency code (e.g., USD, EUR)")] = None,
     format: Annotated[OutputFormat, typer.Option("--format", "-f", help="Output format")] = OutputFormat.table,
     no_cache: Annotated[bool, typer.Option("--no-cache", help="Disable cache and fetch fresh data")] = False,
+    timeout: Annotated[float, typer.Option("--timeout", help="Per-provider timeout in seconds for '--bank all'")] = 60.0,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose logging")] = False,
-):
+    timings: Annotated[bool, typer.Option("--timings", help="Print how long each phase of the fetch took")] = False,
+    trace: Annotated[Optional[Path], typer.Option("--trace", help="Write a Chrome trace-event JSON file of the fetch")] = None,
+) -> None:
     """
     Display current exchange rates from specified bank.
     """
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+    _enable_timings(ctx, timings, trace)
     
-    try:
-        provider = get_provider(bank)
-    except ValueError as e:
-        console.print(f"[bold red]Error: {e}[/bold red]")
-        console.print("\nAvailable providers:")
-        for key in get_all_providers().keys():
-            console.print(f"  - {key}")
-        raise typer.Exit(code=1)
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task(f"Fetching rates from {provider.get_provider_name()}...", total=None)
-        
-        rates = []
-        browser_manager = get_browser_manager(headless=True)
-        
+    rates: Sequence["ExchangeRate"]
+    if bank == "all":
+        rates = _fetch_all_rates(no_cache, timeout)
+        title = "Exchange Rates from All Providers"
+    else:
         try:
-            with browser_manager.browser_context() as context:
-                rates = provider.get_rates(context, use_cache=not no_cache)
-        except NetworkError as e:
-            console.print(f"[bold red]Network error: {e}[/bold red]")
-            raise typer.Exit(code=1)
-        except ProviderError as e:
-            console.print(f"[bold red]Provider error: {e}[/bold red]")
-            raise typer.Exit(code=1)
-        except Exception as e:
-            console.print(f"[bold red]Unexpected error: {e}[/bold red]")
-            logger.exception("Unexpected error occurred")
+            provider = get_provider(bank)
+        except (ValueError, ProviderError) as e:
+            console.print(f"[bold red]Error: {e}[/bold red]")
+            console.print("\nAvailable providers:")
+            for key in get_all_providers().keys():
+                console.print(f"  - {key}")
             raise typer.Exit(code=1)
+        
+        title = f"Exchange Rates from {provider.get_provider_name()}"
+        
+        with _spinner() as progress:
+            task = progress.add_task(f"Fetching rates from {provider.get_provider_name()}...", total=None)
+            
+            browser_manager = get_browser_manager(headless=True)
+            
+            try:
+                with browser_manager.browser_context(lazy=True) as context:
+                    rates = provider.get_rates(context, use_cache=not no_cache)
+                _report_stale(provider)
+            except NetworkError as e:
+                console.print(f"[bold red]Network error: {e}[/bold red]")
+                raise typer.Exit(code=1)
+            except ProviderError as e:
+                console.print(f"[bold red]Provider error: {e}[/bold red]")
+                raise typer.Exit(code=1)
+            except Exception as e:
+                console.print(f"[bold red]Unexpected error: {e}[/bold red]")
+                logger.exception("Unexpected error occurred")
+                raise typer.Exit(code=1)
     
     if not rates:
         console.print("[yellow]No exchange rate data found.[/yellow]")
@@ -147,7 +310,7 @@ def show(
     
     # Output in requested format
     if format == OutputFormat.json:
-        console.print(json.dumps(rates, ensure_ascii=False, indent=2))
+        console.print(json.dumps(as_dicts(rates), ensure_ascii=False, indent=2))
     elif format == OutputFormat.csv:
         # CSV header
         console.print("Currency,Code,Cash Buy,Cash Sell,Provider,Country")
@@ -155,61 +318,188 @@ def show(
             console.print(f"{rate['currency']},{rate['code']},{rate['cash_buy']},{rate['cash_sell']},"
                         f"{rate.get('provider', '')},{rate.get('country', '')}")
     else:  # table format
-        table = Table(title=f"Exchange Rates from {provider.get_provider_name()}")
+        from rich.table import Table
+        
+        show_provider = bank == "all"
+        table = Table(title=title)
+        if show_provider:
+            table.add_column("Provider", style="blue")
         table.add_column("Currency", justify="left", style="cyan", no_wrap=True)
         table.add_column("Code", style="magenta")
         table.add_column("Cash Buy", justify="right", style="green")
         table.add_column("Cash Sell", justify="right", style="yellow")
         
         for rate in rates:
-            table.add_row(
+            row = [
                 rate["currency"],
                 rate["code"],
                 rate["cash_buy"],
                 rate["cash_sell"]
-            )
+            ]
+            if show_provider:
+                row.insert(0, rate.get("provider", ""))
+            table.add_row(*row)
         
         console.print(table)
 
 
+def _read_batch_rows(lines: Iterable[str]) -> Iterator[Tuple[float, str, Optional[str]]]:
+    """Yield (amount, currency, transaction type) tuples from CSV lines."""
+    for line_no, row in enumerate(csv.reader(lines), start=1):
+        if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+            continue
+        try:
+            amount = float(row[0].replace(",", ""))
+        except ValueError:
+            if line_no == 1:
+                continue  # Header row
+            raise ValueError(f"line {line_no}: invalid amount {row[0]!r}")
+        if not math.isfinite(amount):
+            # NaN and Infinity would also make the JSONL output invalid JSON
+            raise ValueError(f"line {line_no}: invalid amount {row[0]!r}")
+        if len(row) < 2:
+            raise ValueError(f"line {line_no}: missing currency")
+        
+        row_type = None
+        if len(row) > 2 and row[2].strip():
+            row_type = row[2].strip().lower()
+            row_type = {"buy": "cash_buy", "sell": "cash_sell"}.get(row_type, row_type)
+        yield amount, row[1], row_type
+
+
+def _convert_batch(provider: "ExchangeRateProvider", browser_manager: "BrowserManager", source: str,
+                   batch_format: "BatchFormat", transaction_type: str, to_currency: str = "KRW") -> None:
+    """Stream conversions for every row of a CSV file or stdin."""
+    import sys
+    
+    try:
+        infile = sys.stdin if source == "-" else open(source, "r", encoding="utf-8", newline="")
+    except OSError as e:
+        console.print(f"[bold red]Error: cannot read {source}: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    out = sys.stdout
+    writer = csv.writer(out) if batch_format == BatchFormat.csv else None
+    if writer:
+        writer.writerow(["amount", "currency", "transaction_type", "rate", "result", "error"])
+    
+    try:
+        with browser_manager.browser_context(lazy=True) as context:
+            results = provider.convert_batch(_read_batch_rows(infile), context,
+                                             transaction_type=transaction_type, to_currency=to_currency)
+            for result in results:
+                if writer:
+                    writer.writerow([result["amount"], result["currency"], result["transaction_type"],
+                                     "" if result["rate"] is None else result["rate"],
+                                     "" if result["result"] is None else result["result"],
+                                     result["error"] or ""])
+                else:
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    except ProviderError as e:
+        err_console.print(f"[bold red]Provider error: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    except ValueError as e:
+        err_console.print(f"[bold red]Invalid input: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        out.flush()
+
+
+def _convert_as_of(provider: "ExchangeRateProvider", amount: float, from_currency: str,
+                   to_currency: str, transaction_type: str, as_of: str) -> None:
+    """Convert using the rate recorded in the local history at a past time."""
+    from getcurcur.history import get_rate_history, parse_time_spec
+    from getcurcur.conversion import split_unit
+    from getcurcur.rates import RateTable
+    
+    try:
+        when = parse_time_spec(as_of)
+    except ValueError as e:
+        console.print(f"[bold red]Invalid input: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    points = []
+    for code in dict.fromkeys(split_unit(c)[0] for c in (from_currency, to_currency)):
+        if code == "KRW":
+            continue
+        point = get_rate_history().as_of(code, when, provider=provider.get_provider_name())
+        if point is None or point.rate.value(transaction_type) is None:
+            console.print(f"[yellow]No {code} rate recorded at or before {when:%Y-%m-%d %H:%M}[/yellow]")
+            raise typer.Exit(code=1)
+        points.append(point)
+    
+    rates = RateTable(provider.get_provider_name(), points[0].rate.country if points else "",
+                      [p.rate.currency for p in points], [p.rate.code for p in points],
+                      [p.rate.cash_buy for p in points], [p.rate.cash_sell for p in points])
+    result = rates.converter().convert(amount, from_currency, to_currency, transaction_type)
+    if result is None:
+        console.print(f"[yellow]Cannot convert {from_currency} to {to_currency}[/yellow]")
+        raise typer.Exit(code=1)
+    
+    recorded = min((p.timestamp for p in points), default=when)
+    console.print(f"[bold green]{amount:,.2f} {from_currency} = {result:,.2f} {to_currency}[/bold green]")
+    console.print(f"[dim]Rate type: Cash {'Buy' if transaction_type == 'cash_buy' else 'Sell'}[/dim]")
+    console.print(f"[dim]Provider: {provider.get_provider_name()} (recorded {recorded:%Y-%m-%d %H:%M})[/dim]")
+
+
 @app.command()
 def convert(
-    amount: Annotated[float, typer.Argument(help="Amount to convert")],
-    from_currency: Annotated[str, typer.Argument(help="Source currency code (e.g., USD)")],
+    amount: Annotated[Optional[float], typer.Argument(help="Amount to convert")] = None,
+    from_currency: Annotated[Optional[str], typer.Argument(help="Source currency code (e.g., USD)")] = None,
     to_currency: Annotated[str, typer.Option("--to", "-t", help="Target currency code")] = "KRW",
     bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider")] = "hana",
     transaction: Annotated[str, typer.Option("--type", help="Transaction type: buy or sell")] = "buy",
-):
+    batch: Annotated[Optional[str], typer.Option("--batch", help="CSV of amount,currency[,type] rows to convert to --to ('-' for stdin)")] = None,
+    batch_format: Annotated[BatchFormat, typer.Option("--format", "-f", help="Output format for --batch")] = BatchFormat.csv,
+    as_of: Annotated[Optional[str], typer.Option("--as-of", help="Use the rate recorded at this time (e.g., 2024-01-31, 3d) instead of fetching")] = None,
+) -> None:
     """
     Convert amount between currencies using current exchange rates.
     """
+    if as_of is not None and batch is not None:
+        console.print("[bold red]Error: --as-of cannot be combined with --batch[/bold red]")
+        raise typer.Exit(code=1)
+    
     try:
         provider = get_provider(bank)
-    except ValueError as e:
+    except (ValueError, ProviderError) as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
         raise typer.Exit(code=1)
     
     transaction_type = "cash_buy" if transaction.lower() == "buy" else "cash_sell"
     
+    if batch is not None:
+        _convert_batch(provider, get_browser_manager(headless=True), batch, batch_format, transaction_type,
+                       to_currency)
+        return
+    
+    if amount is None or from_currency is None:
+        console.print("[bold red]Error: provide AMOUNT and FROM_CURRENCY, or --batch FILE[/bold red]")
+        raise typer.Exit(code=1)
+    from_currency = from_currency.upper()
+    to_currency = to_currency.upper()
+    
+    if as_of is not None:
+        _convert_as_of(provider, amount, from_currency, to_currency, transaction_type, as_of)
+        return
+    
     browser_manager = get_browser_manager(headless=True)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
+    with _spinner() as progress:
         progress.add_task("Calculating...", total=None)
         
         try:
-            with browser_manager.browser_context() as context:
+            with browser_manager.browser_context(lazy=True) as context:
                 result = provider.convert_amount(
                     amount=amount,
-                    from_currency=from_currency.upper(),
+                    from_currency=from_currency,
                     context=context,
-                    to_currency=to_currency.upper(),
+                    to_currency=to_currency,
                     transaction_type=transaction_type
                 )
+            _report_stale(provider)
         except NetworkError as e:
             console.print(f"[bold red]Network error: {e}[/bold red]")
             raise typer.Exit(code=1)
@@ -228,16 +518,225 @@ def convert(
         console.print(f"[yellow]Cannot convert {from_currency} to {to_currency}[/yellow]")
         raise typer.Exit(code=1)
     
-    console.print(f"[bold green]{amount:,.2f} {from_currency.upper()} = {result:,.2f} {to_currency.upper()}[/bold green]")
+    console.print(f"[bold green]{amount:,.2f} {from_currency} = {result:,.2f} {to_currency}[/bold green]")
     console.print(f"[dim]Rate type: Cash {transaction.capitalize()}[/dim]")
     console.print(f"[dim]Provider: {provider.get_provider_name()}[/dim]")
 
 
 @app.command()
-def list_providers():
+def best(
+    currency: Annotated[str, typer.Option("--currency", "-c", help="Currency code (e.g., USD, JPY)")],
+    transaction: Annotated[str, typer.Option("--type", help="Transaction type: buy or sell")] = "buy",
+    format: Annotated[OutputFormat, typer.Option("--format", "-f", help="Output format")] = OutputFormat.table,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Disable cache and fetch fresh data")] = False,
+    timeout: Annotated[float, typer.Option("--timeout", help="Per-provider timeout in seconds")] = 60.0,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose logging")] = False,
+) -> None:
+    """
+    Rank every bank by its rate for one currency.
+    """
+    from getcurcur.comparison import compare_rates
+    
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    transaction_type = {"buy": "cash_buy", "sell": "cash_sell"}.get(transaction.lower())
+    if transaction_type is None:
+        console.print("[bold red]Invalid input: --type must be buy or sell[/bold red]")
+        raise typer.Exit(code=1)
+    
+    comparison = compare_rates(_fetch_all_results(no_cache, timeout), currency, transaction_type)
+    for identifier, reason in comparison.skipped.items():
+        err_console.print(f"[yellow]Skipped {identifier}: {reason}[/yellow]")
+    
+    if not comparison.quotes:
+        console.print(f"[bold red]Error: no provider has a {transaction} rate for {comparison.currency}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    data = comparison.to_dict()
+    if format == OutputFormat.json:
+        console.print(json.dumps(data, ensure_ascii=False, indent=2))
+    elif format == OutputFormat.csv:
+        import sys
+        
+        fields = ["rank", "identifier", "provider", "cash_buy", "cash_sell", "spread", "spread_percent", "difference"]
+        writer = csv.DictWriter(sys.stdout, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(data["quotes"])
+    else:  # table format
+        from rich.table import Table
+        
+        code = comparison.currency if comparison.unit == 1 else f"{comparison.currency} ({comparison.unit})"
+        table = Table(title=f"Best {transaction} rate for {code}")
+        table.add_column("#", justify="right")
+        table.add_column("Provider", style="blue")
+        table.add_column("Cash Buy", justify="right", style="green")
+        table.add_column("Cash Sell", justify="right", style="yellow")
+        table.add_column("Spread", justify="right")
+        table.add_column("Spread %", justify="right")
+        table.add_column("vs Best", justify="right", style="red")
+        
+        for quote in data["quotes"]:
+            spread_percent = quote["spread_percent"]
+            table.add_row(
+                str(quote["rank"]),
+                quote["provider"],
+                quote["cash_buy"],
+                quote["cash_sell"],
+                quote["spread"],
+                "" if spread_percent is None else f"{spread_percent:.2f}%",
+                "-" if quote["rank"] == 1 else f"+{quote['difference']}",
+                style="bold" if quote["rank"] == 1 else None,
+            )
+        
+        console.print(table)
+
+
+@app.command()
+def matrix(
+    bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider")] = "hana",
+    format: Annotated[MatrixFormat, typer.Option("--format", "-f", help="Output format")] = MatrixFormat.csv,
+    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="Write to a file instead of stdout")] = None,
+    transaction: Annotated[str, typer.Option("--type", help="Transaction type: buy, sell or both")] = "both",
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Disable cache and fetch fresh data")] = False,
+) -> None:
+    """
+    Export the conversion rate between every pair of currencies.
+    """
+    import sys
+    from getcurcur.matrix import RateMatrix
+    
+    transaction_types = {"buy": ("cash_buy",), "sell": ("cash_sell",),
+                         "both": ("cash_buy", "cash_sell")}.get(transaction.lower())
+    if transaction_types is None:
+        console.print("[bold red]Invalid input: --type must be buy, sell or both[/bold red]")
+        raise typer.Exit(code=1)
+    
+    try:
+        provider = get_provider(bank)
+    except (ValueError, ProviderError) as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    with _spinner() as progress:
+        progress.add_task(f"Fetching rates from {provider.get_provider_name()}...", total=None)
+        try:
+            with get_browser_manager(headless=True).browser_context(lazy=True) as context:
+                rates = provider.get_rates(context, use_cache=not no_cache)
+            _report_stale(provider)
+        except NetworkError as e:
+            console.print(f"[bold red]Network error: {e}[/bold red]")
+            raise typer.Exit(code=1)
+        except ProviderError as e:
+            console.print(f"[bold red]Provider error: {e}[/bold red]")
+            raise typer.Exit(code=1)
+        except Exception as e:
+            console.print(f"[bold red]Unexpected error: {e}[/bold red]")
+            logger.exception("Unexpected error occurred")
+            raise typer.Exit(code=1)
+    
+    if not rates:
+        console.print("[yellow]No exchange rate data found.[/yellow]")
+        raise typer.Exit(code=1)
+    
+    try:
+        rate_matrix = RateMatrix.from_table(rates, transaction_types)
+    except ValueError as e:
+        console.print(f"[bold red]Invalid input: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    if format == MatrixFormat.npy and output is None and sys.stdout.isatty():
+        console.print("[bold red]Error: use --output FILE for npy output[/bold red]")
+        raise typer.Exit(code=1)
+    
+    try:
+        if format == MatrixFormat.npy:
+            with (open(output, "wb") if output else nullcontext(sys.stdout.buffer)) as out:
+                rate_matrix.write_npy(out)
+            # The array has no labels; report its axes
+            err_console.print(f"[dim]Axes: {', '.join(rate_matrix.transaction_types)} × "
+                              f"{len(rate_matrix)} × {len(rate_matrix)} ({', '.join(rate_matrix.currencies)})[/dim]")
+            return
+        
+        with (open(output, "w", encoding="utf-8", newline="") if output else nullcontext(sys.stdout)) as out:
+            if format == MatrixFormat.json:
+                json.dump(rate_matrix.to_dict(), out, ensure_ascii=False)
+                out.write("\n")
+            else:
+                rate_matrix.write_csv(out)
+    except OSError as e:
+        console.print(f"[bold red]Error: cannot write {output}: {e}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def history(
+    currency: Annotated[str, typer.Option("--currency", "-c", help="Currency code (e.g., USD)")],
+    bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider (e.g., 'hana' or 'all')")] = "hana",
+    since: Annotated[str, typer.Option("--since", help="Start of the range: duration (7d, 12h) or ISO date")] = "7d",
+    until: Annotated[Optional[str], typer.Option("--until", help="End of the range: duration or ISO date")] = None,
+    format: Annotated[OutputFormat, typer.Option("--format", "-f", help="Output format")] = OutputFormat.table,
+) -> None:
+    """
+    Show recorded exchange rates for a currency over time.
+    """
+    from getcurcur.history import get_rate_history, parse_time_spec
+    
+    provider_name = None
+    if bank != "all":
+        try:
+            provider_name = get_provider(bank).get_provider_name()
+        except (ValueError, ProviderError) as e:
+            console.print(f"[bold red]Error: {e}[/bold red]")
+            raise typer.Exit(code=1)
+    
+    try:
+        start = parse_time_spec(since)
+        end = parse_time_spec(until) if until else None
+    except ValueError as e:
+        console.print(f"[bold red]Invalid input: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    currency = currency.upper()
+    points = get_rate_history().range(currency, since=start, until=end, provider=provider_name)
+    if not points:
+        console.print(f"[yellow]No history recorded for {currency} since {start:%Y-%m-%d %H:%M}[/yellow]")
+        return
+    
+    if format == OutputFormat.json:
+        console.print(json.dumps([point.to_dict() for point in points], ensure_ascii=False, indent=2))
+    elif format == OutputFormat.csv:
+        console.print("Timestamp,Code,Cash Buy,Cash Sell,Provider")
+        for point in points:
+            rate = point.rate
+            console.print(f"{point.timestamp.isoformat(timespec='seconds')},{rate['code']},"
+                          f"{rate['cash_buy']},{rate['cash_sell']},{rate['provider']}")
+    else:
+        from rich.table import Table
+        
+        table = Table(title=f"{currency} History")
+        table.add_column("Time", style="cyan", no_wrap=True)
+        if provider_name is None:
+            table.add_column("Provider", style="blue")
+        table.add_column("Cash Buy", justify="right", style="green")
+        table.add_column("Cash Sell", justify="right", style="yellow")
+        
+        for point in points:
+            row = [point.timestamp.strftime("%Y-%m-%d %H:%M"), point.rate["cash_buy"], point.rate["cash_sell"]]
+            if provider_name is None:
+                row.insert(1, point.rate["provider"])
+            table.add_row(*row)
+        
+        console.print(table)
+
+
+@app.command()
+def list_providers() -> None:
     """
     List all available exchange rate providers.
     """
+    from rich.table import Table
+    
     table = Table(title="Available Providers")
     table.add_column("Identifier", style="cyan")
     table.add_column("Country", style="magenta")
@@ -251,7 +750,7 @@ def list_providers():
 
 
 @app.command()
-def clear_cache():
+def clear_cache() -> None:
     """
     Clear all cached exchange rate data.
     """
@@ -270,7 +769,111 @@ def clear_cache():
 
 
 @app.command()
-def install_browsers():
+def daemon(
+    port: Annotated[int, typer.Option("--port", "-p", help="Local port for the browser's CDP endpoint (0: any free port)")] = 0,
+    stop: Annotated[bool, typer.Option("--stop", help="Stop the running daemon")] = False,
+    status: Annotated[bool, typer.Option("--status", help="Show whether a daemon is running")] = False,
+) -> None:
+    """
+    Keep a warm browser running so other commands skip browser start-up.
+    """
+    from getcurcur.daemon import BrowserDaemon, stop_daemon
+    from getcurcur.browser_manager import read_daemon_endpoint
+
+    if status:
+        endpoint = read_daemon_endpoint()
+        if endpoint:
+            console.print(f"[bold green]Browser daemon running at {endpoint}[/bold green]")
+        else:
+            console.print("[yellow]No browser daemon running.[/yellow]")
+        return
+
+    if stop:
+        if stop_daemon():
+            console.print("[bold green]Browser daemon stopped.[/bold green]")
+        else:
+            console.print("[yellow]No browser daemon running.[/yellow]")
+        return
+
+    browser_daemon = BrowserDaemon(port=port)
+    console.print("[bold green]Starting browser daemon (Ctrl+C to stop)[/bold green]")
+
+    try:
+        browser_daemon.serve_forever()
+    except RuntimeError as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        console.print(f"[bold red]Failed to start browser daemon: {e}[/bold red]")
+        logger.exception("Browser daemon failed")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    host: Annotated[Optional[str], typer.Option("--host", help="Address to listen on (default: serve.host config)")] = None,
+    port: Annotated[Optional[int], typer.Option("--port", "-p", help="Port to listen on (default: serve.port config)")] = None,
+    socket_path: Annotated[Optional[Path], typer.Option("--socket", help="Listen on a Unix domain socket instead of TCP")] = None,
+    interval: Annotated[Optional[float], typer.Option("--interval", help="Refresh interval in minutes during bank hours")] = None,
+    off_hours_interval: Annotated[Optional[float], typer.Option("--off-hours-interval", help="Refresh interval in minutes outside bank hours")] = None,
+    bank: Annotated[str, typer.Option("--bank", "-b", help="Bank provider to refresh (e.g., 'hana' or 'all')")] = "all",
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose logging")] = False,
+) -> None:
+    """
+    Refresh rates on a schedule and answer lookups over a local HTTP API.
+    """
+    from getcurcur.config import get_config
+    from getcurcur.server import BankHours, RateStore, RefreshScheduler, create_server
+    from getcurcur.server import serve as run_server
+    
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    config = get_config()
+    try:
+        if bank == "all":
+            providers = _load_all_providers()
+        else:
+            providers = {resolve_provider(bank): get_provider(bank)}
+        bank_hours = BankHours.from_config(config)
+    except (ValueError, ProviderError) as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    store = RateStore()
+    scheduler = RefreshScheduler(
+        providers,
+        store,
+        interval_minutes=interval if interval is not None else config.get("serve.interval_minutes", 10),
+        off_hours_interval_minutes=(off_hours_interval if off_hours_interval is not None
+                                    else config.get("serve.off_hours_interval_minutes", 120)),
+        jitter_seconds=config.get("serve.jitter_seconds", 30),
+        bank_hours=bank_hours,
+    )
+    
+    try:
+        server = create_server(
+            store,
+            host=host or config.get("serve.host", "127.0.0.1"),
+            port=port if port is not None else config.get("serve.port", 8765),
+            socket_path=socket_path,
+            scheduler=scheduler,
+        )
+    except (OSError, RuntimeError) as e:
+        console.print(f"[bold red]Failed to start server: {e}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    if socket_path is not None:
+        address = f"unix:{socket_path}"
+    else:
+        # TCP servers are bound to a (host, port) address
+        address = "http://{}:{}".format(*server.server_address[:2])  # type: ignore[index]
+    console.print(f"[bold green]Serving rates for {', '.join(providers)} at {address} (Ctrl+C to stop)[/bold green]")
+    run_server(server, scheduler)
+
+
+@app.command()
+def install_browsers() -> None:
     """
     Install Playwright browsers required for web scraping.
     """
@@ -297,11 +900,11 @@ def install_browsers():
         raise typer.Exit(code=1)
 
 
-def version_callback(value: bool):
+def version_callback(value: bool) -> None:
     """Show version information."""
     if value:
         from getcurcur.__about__ import __version__
-        console.print(f"getcurcur version {__version__}")
+        typer.echo(f"getcurcur version {__version__}")
         raise typer.Exit()
 
 
@@ -313,7 +916,7 @@ def main(
         is_eager=True,
         help="Show version information"
     )] = None,
-):
+) -> None:
     """
     GetCurCur - Get current currency exchange rates from various banks.
     
@@ -321,8 +924,16 @@ def main(
         getcurcur show                     # Show rates from default bank (Hana)
         getcurcur show -b hana -c USD      # Show only USD rate from Hana Bank
         getcurcur show -f json              # Output as JSON
+        getcurcur show -b all -c USD       # USD rates from every bank
         getcurcur convert 100 USD           # Convert 100 USD to KRW
+        getcurcur convert 100 USD --to JPY  # Cross rate via KRW
+        getcurcur matrix -f json            # Every currency pair at once
+        getcurcur best -c USD --type sell   # Bank paying the most for USD
+        getcurcur convert --batch rows.csv  # Convert every row of a CSV file
+        getcurcur history -c USD --since 7d # USD rates recorded over the last week
         getcurcur list-providers            # List all available providers
+        getcurcur daemon                    # Keep a warm browser for faster lookups
+        getcurcur serve                     # Refresh on a schedule, serve rates on :8765
     """
     pass
 
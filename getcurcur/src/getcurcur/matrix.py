@@ -0,0 +1,207 @@
+"""Full currency-pair conversion matrices for a rate snapshot."""
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Sequence, TextIO, Tuple
+from array import array
+import csv
+import math
+import sys
+import logging
+
+from getcurcur.conversion import split_unit
+from getcurcur.rates import TRANSACTION_TYPES, RateTable
+
+if TYPE_CHECKING:
+    from getcurcur.conversion import ConversionEngine
+
+logger = logging.getLogger(__name__)
+
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+def numpy_available() -> bool:
+    """Whether NumPy is installed."""
+    try:
+        import numpy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class RateMatrix:
+    """
+    Conversion rate between every pair of currencies of one snapshot.
+
+    `values[t][i][j]` is the amount of currency j per one unit of currency
+    i for transaction type t; pairs without a usable rate are NaN. Values
+    match the snapshot's ConversionEngine, so per-unit quotes and direct
+    pairs are handled exactly as in single conversions. With NumPy the
+    values are one float64 array of shape (types, N, N): every pair through
+    the base currency is one broadcast division of the engine's base
+    rates, and only the rows and columns of currencies with direct pairs
+    are taken from the engine's matrix. Without NumPy, nested lists of
+    floats read from the engine's matrix.
+    """
+
+    def __init__(self, provider: str, base: str, currencies: List[str],
+                 transaction_types: Sequence[str], values: Any):
+        """
+        Initialize rate matrix.
+
+        Args:
+            provider: Provider name
+            base: Base currency of the snapshot
+            currencies: Currency codes along both matrix axes
+            transaction_types: Transaction types along the first axis
+            values: Array or nested lists of shape (types, N, N)
+        """
+        self.provider = provider
+        self.base = base
+        self.currencies = currencies
+        self.transaction_types = tuple(transaction_types)
+        self.values = values
+        self._positions = {code: i for i, code in enumerate(currencies)}
+
+    @classmethod
+    def from_table(cls, rates: RateTable, transaction_types: Sequence[str] = TRANSACTION_TYPES,
+                   use_numpy: Optional[bool] = None) -> "RateMatrix":
+        """
+        Compute the matrix of one rate snapshot.
+
+        Args:
+            rates: Rates from get_rates
+            transaction_types: Transaction types to include
+            use_numpy: Force (True) or avoid (False) NumPy; default: use it if installed
+
+        Returns:
+            RateMatrix over the base currency and every currency in the table
+
+        Raises:
+            ValueError: If a transaction type is not 'cash_buy' or 'cash_sell'
+        """
+        return cls.from_engine(rates.converter(), transaction_types, use_numpy)
+
+    @classmethod
+    def from_engine(cls, engine: "ConversionEngine", transaction_types: Sequence[str] = TRANSACTION_TYPES,
+                    use_numpy: Optional[bool] = None) -> "RateMatrix":
+        """
+        Compute the matrix of a conversion engine, including its direct pairs.
+
+        Args:
+            engine: Conversion engine of a rate snapshot
+            transaction_types: Transaction types to include
+            use_numpy: Force (True) or avoid (False) NumPy; default: use it if installed
+
+        Returns:
+            RateMatrix over the base currency and every currency the engine knows
+
+        Raises:
+            ValueError: If a transaction type is not 'cash_buy' or 'cash_sell'
+        """
+        base_rates = [engine.base_rates(transaction_type) for transaction_type in transaction_types]
+        direct = [engine.direct_currencies(transaction_type) for transaction_type in transaction_types]
+        # Table order; currencies without a rate for some type still get a (NaN) row
+        codes = (split_unit(code)[0] for code in engine.rates.codes if code)
+        currencies = list(dict.fromkeys([engine.base, *codes, *(c for d in direct for c in d)]))
+
+        if use_numpy is None:
+            use_numpy = numpy_available()
+        values: Any
+        if use_numpy:
+            values = cls._pivot_values(engine, currencies, transaction_types, base_rates, direct)
+        else:
+            matrices = [engine.matrix(transaction_type) for transaction_type in transaction_types]
+            values = [[[matrix.get(source, {}).get(target, math.nan) for target in currencies]
+                       for source in currencies] for matrix in matrices]
+        return cls(engine.rates.provider, engine.base, currencies, transaction_types, values)
+
+    @staticmethod
+    def _pivot_values(engine: "ConversionEngine", currencies: List[str], transaction_types: Sequence[str],
+                      base_rates: List[Dict[str, float]], direct: List[List[str]]) -> Any:
+        """
+        Matrix values as a float64 array, vectorized over the base currency.
+
+        Without direct pairs, the only path between two currencies goes
+        through the base, so rate(i, j) = base(i) / base(j). A direct pair
+        can only change paths starting or ending at one of its currencies,
+        so those rows and columns are overwritten from the engine's matrix.
+        """
+        import numpy as np
+
+        size = len(currencies)
+        values = np.empty((len(transaction_types), size, size), dtype=np.float64)
+        positions = {code: i for i, code in enumerate(currencies)}
+        for t, transaction_type in enumerate(transaction_types):
+            in_base = np.array([base_rates[t].get(code, math.nan) for code in currencies], dtype=np.float64)
+            np.divide(in_base[:, None], in_base[None, :], out=values[t])
+            if not direct[t]:
+                continue
+            matrix = engine.matrix(transaction_type)
+            for code in direct[t]:
+                i = positions[code]
+                reached = matrix.get(code, {})
+                values[t, i, :] = [reached.get(target, math.nan) for target in currencies]
+                values[t, :, i] = [matrix.get(source, {}).get(code, math.nan) for source in currencies]
+        return values
+
+    def __len__(self) -> int:
+        return len(self.currencies)
+
+    def rate(self, from_currency: str, to_currency: str,
+             transaction_type: str = "cash_buy") -> Optional[float]:
+        """Amount of `to_currency` per one `from_currency`, or None if not available."""
+        i = self._positions.get(split_unit(from_currency)[0])
+        j = self._positions.get(split_unit(to_currency)[0])
+        if i is None or j is None or transaction_type not in self.transaction_types:
+            return None
+        value = float(self.values[self.transaction_types.index(transaction_type)][i][j])
+        return None if math.isnan(value) else value
+
+    def tolist(self) -> List[List[List[Optional[float]]]]:
+        """Values as nested lists with None for missing rates."""
+        values = self.values.tolist() if hasattr(self.values, "tolist") else self.values
+        return [[[None if math.isnan(v) else v for v in row] for row in matrix] for matrix in values]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form: currencies plus one N×N matrix per transaction type."""
+        data: Dict[str, Any] = {"provider": self.provider, "base": self.base, "currencies": self.currencies}
+        data.update(zip(self.transaction_types, self.tolist()))
+        return data
+
+    def write_csv(self, out: TextIO) -> None:
+        """Write one row per (transaction type, from currency); columns are the target currencies."""
+        writer = csv.writer(out)
+        writer.writerow(["transaction_type", "from", *self.currencies])
+        for transaction_type, matrix in zip(self.transaction_types, self.tolist()):
+            for currency, row in zip(self.currencies, matrix):
+                writer.writerow([transaction_type, currency, *("" if v is None else repr(v) for v in row)])
+
+    def write_npy(self, out: BinaryIO) -> None:
+        """Write the values as a float64 .npy array of shape (types, N, N)."""
+        if hasattr(self.values, "dtype"):
+            import numpy as np
+
+            np.save(out, self.values, allow_pickle=False)
+            return
+        write_npy(out, [v for matrix in self.values for row in matrix for v in row],
+                  (len(self.transaction_types), len(self.currencies), len(self.currencies)))
+
+
+def write_npy(out: BinaryIO, values: Sequence[float], shape: Tuple[int, ...]) -> None:
+    """
+    Write float64 values in NumPy's .npy format (version 1.0) without NumPy.
+
+    Args:
+        out: Binary file
+        values: Values in C order
+        shape: Array shape
+    """
+    header = repr({"descr": "<f8", "fortran_order": False, "shape": shape}).encode("latin1")
+    # Magic, version, header length and header are padded to a multiple of 64 bytes
+    padding = 64 - (len(_NPY_MAGIC) + 2 + 2 + len(header) + 1) % 64
+    header += b" " * (padding % 64) + b"\n"
+    data = array("d", values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    out.write(_NPY_MAGIC + b"\x01\x00" + len(header).to_bytes(2, "little") + header)
+    out.write(data.tobytes())
+
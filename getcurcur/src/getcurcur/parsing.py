@@ -0,0 +1,161 @@
+"""HTML table extraction with pluggable parser backends."""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+from functools import lru_cache
+import re
+import logging
+
+from getcurcur.tracing import span
+
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer  # type: ignore[attr-defined]
+
+logger = logging.getLogger(__name__)
+
+# Preferred order when the backend is "auto"
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+# First compound selector of a CSS selector: tag, #id and/or .class
+_FIRST_COMPOUND = re.compile(r"^\s*(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?:\.(?P<cls>[\w-]+))?")
+
+CellExtractor = Callable[[str, str, Sequence[int], str], List[List[str]]]
+
+
+def _selectolax_cells(html: str, row_selector: str, columns: Sequence[int], separator: str) -> List[List[str]]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    wanted = max(columns)
+    rows = []
+    for row in tree.css(row_selector):
+        cells = row.css("td")
+        if len(cells) > wanted:
+            rows.append([cells[i].text(deep=True, separator=separator).strip() for i in columns])
+    return rows
+
+
+@lru_cache(maxsize=32)
+def _lxml_selector(row_selector: str) -> Any:
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(row_selector)
+
+
+def _lxml_cells(html: str, row_selector: str, columns: Sequence[int], separator: str) -> List[List[str]]:
+    import lxml.html
+
+    tree = lxml.html.fromstring(html)
+    wanted = max(columns)
+    rows = []
+    for row in _lxml_selector(row_selector)(tree):
+        cells = list(row.iter("td"))
+        if len(cells) > wanted:
+            rows.append([separator.join(cells[i].itertext()).strip() for i in columns])
+    return rows
+
+
+def _strainer_for(row_selector: str) -> Optional["SoupStrainer"]:
+    """
+    SoupStrainer limited to the element named by the selector's first part.
+
+    Only that element's subtree is built, e.g. just the rates table for
+    "#p_grid1_tb > tbody > tr". None if the selector cannot be narrowed.
+    """
+    from bs4 import SoupStrainer  # type: ignore[attr-defined]
+
+    match = _FIRST_COMPOUND.match(row_selector)
+    if not match or not any(match.groupdict().values()):
+        return None
+    attrs = {}
+    if match.group("id"):
+        attrs["id"] = match.group("id")
+    if match.group("cls"):
+        attrs["class"] = match.group("cls")
+    return SoupStrainer(match.group("tag") or True, attrs=attrs)
+
+
+def _html_parser_cells(html: str, row_selector: str, columns: Sequence[int], separator: str) -> List[List[str]]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser", parse_only=_strainer_for(row_selector))
+    wanted = max(columns)
+    rows = []
+    for row in soup.select(row_selector):
+        cells = row.find_all("td")
+        if len(cells) > wanted:
+            rows.append([cells[i].get_text(separator).strip() for i in columns])
+    return rows
+
+
+_EXTRACTORS: Dict[str, CellExtractor] = {
+    "selectolax": _selectolax_cells,
+    "lxml": _lxml_cells,
+    "html.parser": _html_parser_cells,
+}
+
+
+def _is_installed(backend: str) -> bool:
+    try:
+        if backend == "selectolax":
+            import selectolax.lexbor  # noqa: F401
+        elif backend == "lxml":
+            import lxml.html  # noqa: F401
+            import cssselect  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def available_backends() -> List[str]:
+    """Installed parser backends, fastest first."""
+    return [backend for backend in BACKENDS if _is_installed(backend)]
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """
+    Pick the parser backend to use.
+
+    Args:
+        name: Backend name, "auto" or None (use parser.backend from the config)
+
+    Returns:
+        Name of an installed backend; "auto" and unavailable backends fall
+        back to the fastest installed one
+
+    Raises:
+        ValueError: If the name is not a known backend
+    """
+    if name is None:
+        from getcurcur.config import get_config
+
+        name = get_config().get("parser.backend", "auto")
+    if name != "auto" and name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name}. Must be 'auto' or one of {', '.join(BACKENDS)}.")
+
+    available = available_backends()
+    if name != "auto" and name not in available:
+        logger.warning(f"Parser backend {name} is not installed, using {available[0]}")
+        return available[0]
+    return available[0] if name == "auto" else name
+
+
+def extract_table_cells(html: str, row_selector: str, columns: Sequence[int],
+                        backend: Optional[str] = None, separator: str = "") -> List[List[str]]:
+    """
+    Read selected cells from the rows of an HTML table.
+
+    Args:
+        html: HTML document or fragment
+        row_selector: CSS selector matching the table rows
+        columns: Indexes of the <td> cells to read from each row
+        backend: Parser backend name or "auto" (default: parser.backend config)
+        separator: String placed between the text of a cell's child nodes
+
+    Returns:
+        One list of stripped cell texts per row; rows with too few cells
+        are skipped
+    """
+    backend = resolve_backend(backend)
+    with span("parse.html", backend=backend, size=len(html)):
+        return _EXTRACTORS[backend](html, row_selector, columns, separator)
@@ -1,45 +1,201 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any, Union
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Set, Union, Iterable, Iterator, Tuple, Callable
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from tenacity import retry, stop_after_attempt, wait_fixed
 from playwright.sync_api import BrowserContext
 
+import asyncio
 import json
 import hashlib
+import math
+import os
+import sys
+import threading
 from pathlib import Path
 import logging
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+from ..config import get_config
+from ..rates import RateTable, as_dicts
+from ..conversion import split_unit
+from ..retry import RetryPolicy
+from ..circuit import CircuitBreaker
+from ..tracing import span
+
+if TYPE_CHECKING:
+    from ..browser_manager import WaitUntil
+
 logger = logging.getLogger(__name__)
 
+# Marks lazily created provider attributes that were not created yet
+_UNSET = object()
+
+
+@dataclass
+class CacheEntry:
+    """Cached exchange rate data together with its freshness."""
+    
+    data: Union[RateTable, List[Dict[str, Any]]]
+    timestamp: datetime
+    stale: bool = False
+    # Served because the provider's circuit is open, however old it is
+    last_known_good: bool = False
+    
+    @property
+    def age(self) -> timedelta:
+        """Time elapsed since the data was cached."""
+        return datetime.now() - self.timestamp
+
+
+class MemoryCache:
+    """Bounded, thread-safe LRU of cache entries kept in process memory."""
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize memory cache.
+        
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[CacheEntry]:
+        """Return the entry for key and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: Any, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used one if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key: Any) -> None:
+        """Drop the entry for key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across CacheManager instances so every provider object in the
+# process sees the same in-memory tier
+_memory_cache = MemoryCache()
+
+# In-process half of the single-flight lock, keyed by lock file path
+_fetch_locks: Dict[str, threading.Lock] = {}
+_fetch_locks_guard = threading.Lock()
+
+
+def _lock_fd(fd: int) -> None:
+    """Block until an exclusive lock on the open file is held."""
+    if sys.platform == "win32":
+        while True:
+            try:
+                # LK_LOCK gives up after ~10 seconds; keep waiting
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_fd(fd: int) -> None:
+    if sys.platform == "win32":
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
 
 class CacheManager:
-    """Simple cache manager for exchange rates."""
+    """
+    Two-tier cache manager for exchange rates.
+    An in-process LRU sits in front of the JSON files on disk.
+    """
     
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_minutes: int = 30):
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_minutes: int = 30,
+                 max_stale_minutes: int = 0, memory: bool = True,
+                 decoder: Optional[Callable[[List[Dict[str, Any]]], Any]] = None):
         """
         Initialize cache manager.
         
         Args:
             cache_dir: Directory to store cache files
             ttl_minutes: Cache time-to-live in minutes
+            max_stale_minutes: How long past the TTL an entry may still be
+                served as stale while it is revalidated (0 disables this)
+            memory: Keep entries in the shared in-process LRU as well
+            decoder: Converts data read from disk (e.g. RateTable.from_dicts)
+                so the memory tier holds parsed objects
         """
         self.cache_dir = cache_dir or Path.home() / ".getcurcur" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(minutes=ttl_minutes)
+        self.max_stale = timedelta(minutes=max_stale_minutes)
+        self.memory = _memory_cache if memory else None
+        self.decoder = decoder
+        self.stats = {"memory_hits": 0, "memory_misses": 0, "disk_hits": 0, "disk_misses": 0, "coalesced": 0}
     
-    def _get_cache_key(self, provider_name: str, **kwargs) -> str:
+    def _memory_key(self, provider_name: str, **kwargs: Any) -> Any:
+        """Key for the in-memory tier; avoids hashing for the common case."""
+        if not kwargs:
+            return (str(self.cache_dir), provider_name)
+        return (str(self.cache_dir), provider_name, json.dumps(kwargs, sort_keys=True))
+    
+    def _get_cache_key(self, provider_name: str, **kwargs: Any) -> str:
         """Generate cache key based on provider and parameters."""
         key_data = f"{provider_name}_{json.dumps(kwargs, sort_keys=True)}"
         return hashlib.md5(key_data.encode()).hexdigest()
     
-    def get(self, provider_name: str, **kwargs) -> Optional[List[Dict[str, Any]]]:
-        """Get cached data if available and not expired."""
+    def path_for(self, provider_name: str, suffix: str = ".json", **kwargs: Any) -> Path:
+        """File of a cache entry, or of state kept next to it (e.g. '.lock')."""
+        return self.cache_dir / f"{self._get_cache_key(provider_name, **kwargs)}{suffix}"
+    
+    def get_entry(self, provider_name: str, **kwargs: Any) -> Optional[CacheEntry]:
+        """
+        Get cached data with its freshness.
+        
+        Entries past the TTL are returned flagged as stale while they are
+        within the max-staleness window, and removed once beyond it.
+        The in-memory tier is consulted first; disk is only read on a miss.
+        """
         from ..exceptions import CacheError
         
-        cache_key = self._get_cache_key(provider_name, **kwargs)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        if self.memory is not None:
+            memory_key = self._memory_key(provider_name, **kwargs)
+            cached = self.memory.get(memory_key)
+            if cached is not None:
+                age = datetime.now() - cached.timestamp
+                if age <= self.ttl + self.max_stale:
+                    self.stats["memory_hits"] += 1
+                    return CacheEntry(data=cached.data, timestamp=cached.timestamp, stale=age > self.ttl)
+                self.memory.invalidate(memory_key)
+            self.stats["memory_misses"] += 1
+        
+        cache_file = self.path_for(provider_name, **kwargs)
         
         if not cache_file.exists():
+            self.stats["disk_misses"] += 1
             return None
         
         try:
@@ -59,16 +215,27 @@ class CacheManager:
                 cache_file.unlink()  # Remove corrupted cache
                 return None
             
-            if datetime.now() - cached_time > self.ttl:
+            age = datetime.now() - cached_time
+            if age > self.ttl + self.max_stale:
                 logger.debug(f"Cache expired for {provider_name}")
+                self.stats["disk_misses"] += 1
+                # Set aside as the last known good rates
                 try:
-                    cache_file.unlink()
+                    os.replace(cache_file, self.path_for(provider_name, ".last.json", **kwargs))
                 except OSError as e:
-                    logger.warning(f"Failed to remove expired cache file: {e}")
+                    logger.warning(f"Failed to move expired cache file: {e}")
                 return None
             
-            logger.debug(f"Cache hit for {provider_name}")
-            return cache_data['data']
+            stale = age > self.ttl
+            logger.debug(f"Cache {'stale hit' if stale else 'hit'} for {provider_name}")
+            self.stats["disk_hits"] += 1
+            data = cache_data['data']
+            if self.decoder is not None:
+                data = self.decoder(data)
+            entry = CacheEntry(data=data, timestamp=cached_time, stale=stale)
+            if self.memory is not None:
+                self.memory.set(self._memory_key(provider_name, **kwargs), entry)
+            return entry
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Failed to read cache for {provider_name}: {e}")
             try:
@@ -80,40 +247,112 @@ class CacheManager:
             # For unexpected errors, raise CacheError
             raise CacheError(f"Unexpected error reading cache for {provider_name}: {e}")
     
-    def set(self, provider_name: str, data: List[Dict[str, Any]], **kwargs):
-        """Save data to cache."""
+    def get_last_good(self, provider_name: str, **kwargs: Any) -> Optional[CacheEntry]:
+        """
+        Most recent rates cached for a provider, however old.
+        
+        Reads the current entry, or the expired one get_entry set aside.
+        Used as a fallback while the provider is down.
+        
+        Returns:
+            Stale CacheEntry flagged last_known_good, or None
+        """
+        for path in (self.path_for(provider_name, **kwargs), self.path_for(provider_name, ".last.json", **kwargs)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cache_data = json.load(f)
+                timestamp = datetime.fromisoformat(cache_data['timestamp'])
+                data = cache_data['data']
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Failed to read last known good rates for {provider_name}: {e}")
+                continue
+            if not data:
+                continue
+            if self.decoder is not None:
+                data = self.decoder(data)
+            return CacheEntry(data=data, timestamp=timestamp, stale=True, last_known_good=True)
+        return None
+    
+    def get(self, provider_name: str, **kwargs: Any) -> Optional[Union[RateTable, List[Dict[str, Any]]]]:
+        """Get cached data if available and not expired."""
+        entry = self.get_entry(provider_name, **kwargs)
+        if entry is None or entry.stale:
+            return None
+        return entry.data
+    
+    @contextmanager
+    def lock(self, provider_name: str, **kwargs: Any) -> Iterator[None]:
+        """
+        Hold the single-flight lock for a cache entry.
+        
+        Combines a per-entry thread lock with an exclusive lock on a
+        `<key>.lock` file next to the entry, so only one thread across all
+        processes sharing the cache directory refreshes it at a time.
+        Lock files are left in place; deleting them would let two
+        processes lock different files for the same entry.
+        """
+        lock_file = self.path_for(provider_name, ".lock", **kwargs)
+        with _fetch_locks_guard:
+            thread_lock = _fetch_locks.setdefault(str(lock_file), threading.Lock())
+        
+        with thread_lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_fd(fd)
+                try:
+                    yield
+                finally:
+                    _unlock_fd(fd)
+            finally:
+                os.close(fd)
+    
+    def set(self, provider_name: str, data: Union[RateTable, List[Dict[str, Any]]], **kwargs: Any) -> None:
+        """
+        Save data to cache.
+        
+        RateTables are written to disk as dict records and kept as-is in the
+        memory tier, so memory hits need no parsing.
+        """
         from ..exceptions import CacheError
         
         if not data:
             logger.warning(f"Attempted to cache empty data for {provider_name}")
             return
         
-        cache_key = self._get_cache_key(provider_name, **kwargs)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self.path_for(provider_name, **kwargs)
+        # Unique per writer so a background refresh and a foreground fetch
+        # never interleave writes to the same temporary file
+        temp_file = cache_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
         
         try:
             # Ensure cache directory exists
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             
+            now = datetime.now()
             cache_data = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'provider': provider_name,
-                'data': data
+                'data': as_dicts(data)
             }
             
             # Write to temporary file first, then atomic move
-            temp_file = cache_file.with_suffix('.tmp')
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
             
             # Atomic move to prevent corrupted cache files
-            temp_file.rename(cache_file)
+            os.replace(temp_file, cache_file)
             logger.debug(f"Cached data for {provider_name}")
             
-        except (OSError, json.JSONEncodeError) as e:
+            if self.memory is not None:
+                self.memory.set(self._memory_key(provider_name, **kwargs),
+                                CacheEntry(data=data, timestamp=now))
+            
+        except (OSError, TypeError, ValueError) as e:
             logger.warning(f"Failed to write cache for {provider_name}: {e}")
             # Clean up temp file if it exists
-            temp_file = cache_file.with_suffix('.tmp')
             if temp_file.exists():
                 try:
                     temp_file.unlink()
@@ -130,16 +369,90 @@ class ExchangeRateProvider(ABC):
     Supports caching, retry logic, and country-specific information.
     """
 
-    def __init__(self, cache_enabled: bool = True, cache_ttl: int = 30):
+    FETCH_MODES = ("auto", "http", "browser")
+    
+    # Page readiness for browser fetches: the load state page.goto waits
+    # for, then a selector that appears once the rates are rendered
+    WAIT_UNTIL: "WaitUntil" = "networkidle"
+    READY_SELECTOR: Optional[str] = None
+    
+    # Runs inside the page: text of the requested cells of each matched
+    # row, or null for rows with too few cells
+    EXTRACT_CELLS_SCRIPT = """(rows, columns) => rows.map(row => {
+        const cells = row.querySelectorAll('td');
+        if (cells.length <= Math.max(...columns)) return null;
+        return columns.map(i => cells[i].textContent.trim());
+    })"""
+
+    # Providers with a background revalidation in flight
+    _refreshing: Set[str] = set()
+    _refreshing_lock = threading.Lock()
+
+    def __init__(self, cache_enabled: bool = True, cache_ttl: Optional[int] = None,
+                 fetch_mode: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None):
         """
         Initialize provider with optional caching.
         
         Args:
             cache_enabled: Enable caching of exchange rates
-            cache_ttl: Cache time-to-live in minutes
+            cache_ttl: Cache time-to-live in minutes (default: cache.ttl_minutes)
+            fetch_mode: 'browser' fetches with Playwright only, 'auto' tries the
+                HTTP fast path before the browser, 'http' uses only the fast
+                path (default: fetch_mode config, 'browser')
+            retry_policy: Retry policy for fresh fetches (default: the retry
+                config section, with this provider's overrides)
         """
+        config = get_config()
+        if fetch_mode is None:
+            fetch_mode = config.get("fetch_mode", "browser")
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Invalid fetch_mode: {fetch_mode}. Must be one of {', '.join(self.FETCH_MODES)}.")
+        
+        if cache_ttl is None:
+            cache_ttl = config.get("cache.ttl_minutes", 30)
+        max_stale = config.get("cache.max_stale_minutes", 0) if config.get("cache.stale_while_revalidate", False) else 0
+        
+        self.fetch_mode = fetch_mode
+        self.history_enabled = config.get("history.enabled", True)
         self.cache_enabled = cache_enabled
-        self.cache_manager = CacheManager(ttl_minutes=cache_ttl) if cache_enabled else None
+        self.cache_manager = CacheManager(
+            ttl_minutes=cache_ttl, max_stale_minutes=max_stale, decoder=RateTable.from_dicts,
+        ) if cache_enabled else None
+        # Cache entry that served the last get_rates call (None if fetched fresh)
+        self.last_cache_entry: Optional[CacheEntry] = None
+        self._retry_policy = retry_policy
+        self._circuit_breaker: Any = _UNSET
+    
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy of fresh fetches, read from config on first use."""
+        if self._retry_policy is None:
+            self._retry_policy = RetryPolicy.from_config(self.get_provider_name())
+        return self._retry_policy
+    
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy) -> None:
+        self._retry_policy = policy
+    
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        Circuit breaker of fresh fetches, read from config on first use.
+        
+        Its state is kept next to the provider's cache entry so CLI runs
+        share it; with caching disabled it only lives in this object.
+        None if circuit_breaker.enabled is off.
+        """
+        if self._circuit_breaker is _UNSET:
+            name = self.get_provider_name()
+            path = self.cache_manager.path_for(name, ".circuit") if self.cache_manager else None
+            self._circuit_breaker = CircuitBreaker.from_config(name, path)
+        breaker: Optional[CircuitBreaker] = self._circuit_breaker
+        return breaker
+    
+    @circuit_breaker.setter
+    def circuit_breaker(self, breaker: Optional[CircuitBreaker]) -> None:
+        self._circuit_breaker = breaker
     
     @abstractmethod
     def get_provider_name(self) -> str:
@@ -152,22 +465,115 @@ class ExchangeRateProvider(ABC):
         pass
     
     @abstractmethod
-    def fetch_rates(self, context: BrowserContext) -> List[Dict[str, str]]:
+    def fetch_rates(self, context: BrowserContext) -> Union[RateTable, List[Dict[str, str]]]:
         """
         Fetch exchange rates from the provider.
         
         Returns:
-            List of dictionaries containing exchange rate information:
-            - currency: Currency name
-            - code: Currency code (e.g., USD, EUR)
-            - cash_buy: Buying rate for cash
-            - cash_sell: Selling rate for cash
-            - provider: Provider name
-            - country: Country code
+            RateTable with currency name, code, cash buy and cash sell rates.
+            A list of dicts with the keys currency, code, cash_buy, cash_sell,
+            provider and country is also accepted and converted.
         """
         pass
     
-    def get_rates(self, context: BrowserContext, use_cache: bool = True) -> List[Dict[str, str]]:
+    def fetch_rates_http(self) -> Optional[Union[RateTable, List[Dict[str, str]]]]:
+        """
+        Fetch exchange rates without a browser.
+        
+        Providers whose site exposes the rate table through a plain HTTP
+        request override this; the default means no fast path is available.
+        
+        Returns:
+            Same structure as fetch_rates, or None if unsupported
+            
+        Raises:
+            ProviderError: If the request fails or the response is invalid
+        """
+        return None
+    
+    @staticmethod
+    def _valid_cells(cells: Any) -> Optional[List[List[str]]]:
+        """Drop null rows; None if the result is not a list of string lists."""
+        if not isinstance(cells, list):
+            return None
+        rows = [row for row in cells if row is not None]
+        if not all(isinstance(row, list) and all(isinstance(cell, str) for cell in row) for row in rows):
+            return None
+        return rows
+    
+    def extract_cells(self, page: Any, selector: str, columns: Tuple[int, ...]) -> Optional[List[List[str]]]:
+        """
+        Read selected cells of table rows inside the page.
+        
+        Only the requested cell texts cross the Playwright pipe, instead of
+        the whole serialized DOM, so the cost does not grow with page size.
+        
+        Args:
+            page: Playwright page
+            selector: Selector matching the table rows
+            columns: Indexes of the <td> cells to read from each row
+        
+        Returns:
+            One list of cell texts per row (rows with too few cells are
+            skipped), or None if in-page extraction failed and the caller
+            should fall back to parsing page.content()
+        """
+        try:
+            with span("page.extract", selector=selector):
+                cells = page.locator(selector).evaluate_all(self.EXTRACT_CELLS_SCRIPT, list(columns))
+        except Exception as e:
+            logger.debug(f"In-page extraction failed for {self.get_provider_name()}: {e}")
+            return None
+        return self._valid_cells(cells)
+    
+    def session_for(self, context: Any, url: str) -> Optional[Any]:
+        """
+        Warm page session of this provider, if the context keeps sessions.
+        
+        Contexts from BrowserManager.session_context keep one page open per
+        provider across fetches; providers that support it check this in
+        fetch_rates and fall back to a new page when it returns None.
+        
+        Args:
+            context: Context passed to fetch_rates
+            url: Page the session stays on
+        
+        Returns:
+            ScrapeSession, or None for a plain browser context
+        """
+        from ..browser_manager import SessionContext
+        
+        if not isinstance(context, SessionContext):
+            return None
+        return context.session(self.get_provider_name(), url, wait_until=self.WAIT_UNTIL)
+    
+    def _as_table(self, rates: Union[RateTable, List[Dict[str, str]]]) -> RateTable:
+        """Normalize provider output into a RateTable."""
+        return RateTable.coerce(rates, provider=self.get_provider_name(), country=self.get_country())
+    
+    def _fetch(self, context: BrowserContext) -> Union[RateTable, List[Dict[str, str]]]:
+        """Fetch rates via the HTTP fast path, falling back to the browser."""
+        from ..exceptions import ProviderError
+        
+        if self.fetch_mode != "browser":
+            try:
+                with span("fetch.http", provider=self.get_provider_name()):
+                    rates = self.fetch_rates_http()
+            except ProviderError as e:
+                if self.fetch_mode == "http":
+                    raise
+                logger.info(f"HTTP fast path failed for {self.get_provider_name()}, using browser: {e}")
+                rates = None
+            
+            if rates:
+                return rates
+            if self.fetch_mode == "http":
+                raise ProviderError(f"{self.get_provider_name()} does not support HTTP-only fetching")
+        
+        with span("fetch.browser", provider=self.get_provider_name()):
+            return self.fetch_rates(context)
+    
+    def get_rates(self, context: BrowserContext, use_cache: bool = True) -> RateTable:
         """
         Get exchange rates with optional caching.
         
@@ -176,29 +582,186 @@ class ExchangeRateProvider(ABC):
             use_cache: Whether to use cached data if available
         
         Returns:
-            List of exchange rate dictionaries
+            RateTable of exchange rates. Stale cached data may be
+            returned while a background refresh runs; check last_cache_entry.
         """
+        self.last_cache_entry = None
         if use_cache and self.cache_enabled and self.cache_manager:
-            cached_data = self.cache_manager.get(self.get_provider_name())
-            if cached_data:
-                return cached_data
+            with span("cache.read", provider=self.get_provider_name()):
+                entry = self.cache_manager.get_entry(self.get_provider_name())
+            if entry and entry.data:
+                self.last_cache_entry = entry
+                if entry.stale:
+                    self._refresh_in_background()
+                return self._as_table(entry.data)
+            return self._fetch_coalesced(context)
         
-        # Fetch fresh data with retry logic
-        @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-        def _fetch_with_retry():
-            return self.fetch_rates(context)
+        return self._fetch_fresh(context)
+    
+    def _fetch_coalesced(self, context: BrowserContext) -> RateTable:
+        """
+        Fetch fresh rates unless a concurrent caller already did.
         
+        Callers queue on the cache entry's single-flight lock; whoever gets
+        it re-checks the cache, so only the first of a burst of concurrent
+        misses (threads or processes) actually scrapes and the rest are
+        served the rates it cached.
+        """
+        cache = self.cache_manager
+        if cache is None:
+            return self._fetch_fresh(context)
+        name = self.get_provider_name()
+        with cache.lock(name):
+            entry = cache.get_entry(name)
+            if entry and entry.data and not entry.stale:
+                logger.debug(f"Rates for {name} were refreshed by a concurrent fetch")
+                cache.stats["coalesced"] += 1
+                return self._as_table(entry.data)
+            return self._fetch_fresh(context)
+    
+    def _can_retry(self, context: BrowserContext) -> bool:
+        """
+        Whether a failed fetch can be retried with this context.
+        
+        A lazy context can always be relaunched. A plain context that was
+        closed cannot be replaced here; retrying on it would only fail
+        again, so the error is raised instead.
+        """
+        from ..browser_manager import LazyBrowserContext
+        
+        if isinstance(context, LazyBrowserContext) or self._context_alive(context):
+            return True
+        logger.warning(f"Browser context of {self.get_provider_name()} is closed, not retrying")
+        return False
+    
+    def _prepare_retry(self, context: BrowserContext) -> None:
+        """
+        Give the next attempt a fresh page and a working context.
+        
+        The provider's warm session page is dropped, and a lazy context
+        whose browser went away is reset so the retry relaunches it. Runs
+        only once another attempt is certain, never after the last one.
+        """
+        from ..browser_manager import LazyBrowserContext, SessionContext
+        
+        if isinstance(context, SessionContext):
+            session = context.sessions.get(self.get_provider_name())
+            if session is not None:
+                session.discard()
+        if isinstance(context, LazyBrowserContext):
+            if context.started and not self._context_alive(context._context):
+                logger.warning(f"Browser context of {self.get_provider_name()} is gone, relaunching for retry")
+                context.reset()
+    
+    @staticmethod
+    def _context_alive(context: Any) -> bool:
+        """Whether a browser context still answers a cheap probe."""
         try:
-            rates = _fetch_with_retry()
-            
-            # Cache the results
-            if self.cache_enabled and self.cache_manager and rates:
-                self.cache_manager.set(self.get_provider_name(), rates)
-            
-            return rates
+            context.cookies()
+        except Exception as e:
+            logger.debug(f"Browser context failed its liveness probe: {e}")
+            return False
+        return True
+    
+    def _last_known_good(self, breaker: CircuitBreaker) -> RateTable:
+        """
+        Rates to serve while the provider's circuit is open.
+        
+        Returns:
+            The last rates ever cached, recorded in last_cache_entry
+        
+        Raises:
+            CircuitOpenError: If there are none or the fallback is disabled
+        """
+        from ..exceptions import CircuitOpenError
+        
+        name = self.get_provider_name()
+        state = breaker.state
+        message = (f"{name} is unavailable after {state.failures} failed fetches "
+                   f"(last error: {state.last_error}); retrying in {breaker.retry_after():.0f}s")
+        entry = None
+        if breaker.serve_last_known_good and self.cache_enabled and self.cache_manager:
+            entry = self.cache_manager.get_last_good(name)
+        if entry is None:
+            raise CircuitOpenError(message)
+        
+        logger.warning(f"{message}; serving rates from {entry.timestamp:%Y-%m-%d %H:%M}")
+        self.last_cache_entry = entry
+        return self._as_table(entry.data)
+    
+    def _fetch_fresh(self, context: BrowserContext) -> RateTable:
+        """Fetch rates bypassing the cache and store the result."""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            return self._last_known_good(breaker)
+        
+        try:
+            retrying = self.retry_policy.retrying(retry_if=lambda _: self._can_retry(context),
+                                                  before_sleep=lambda _: self._prepare_retry(context))
+            for attempt in retrying:
+                with attempt, span("fetch.attempt", attempt=attempt.retry_state.attempt_number):
+                    fetched = self._fetch(context)
+            rates = self._as_table(fetched)
         except Exception as e:
             logger.error(f"Failed to fetch rates from {self.get_provider_name()}: {e}")
+            if breaker is not None:
+                breaker.record_failure(e)
             raise
+        if breaker is not None:
+            breaker.record_success()
+        
+        # Cache the results
+        if self.cache_enabled and self.cache_manager and rates:
+            with span("cache.write", provider=self.get_provider_name()):
+                self.cache_manager.set(self.get_provider_name(), rates)
+        self._record_history(rates)
+        
+        return rates
+    
+    def _record_history(self, rates: RateTable) -> None:
+        """Append freshly fetched rates to the local rate history."""
+        if not self.history_enabled or not rates:
+            return
+        from ..history import get_rate_history
+        
+        try:
+            with span("history.write", rates=len(rates)):
+                get_rate_history().record(rates)
+        except Exception as e:
+            # History is best effort; never fail a fetch because of it
+            logger.warning(f"Failed to record rate history for {self.get_provider_name()}: {e}")
+    
+    def _refresh_in_background(self) -> None:
+        """
+        Revalidate stale cached rates on a separate thread.
+        
+        The thread opens its own lazy browser context because Playwright's
+        sync API cannot share one across threads. It is a daemon thread, so
+        it never holds up process exit; a one-shot CLI run may exit before
+        the refresh finishes, leaving it to the next call.
+        """
+        name = self.get_provider_name()
+        with self._refreshing_lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+        
+        def _revalidate() -> None:
+            from ..browser_manager import BrowserManager, ScrapeProfile
+            
+            try:
+                manager = BrowserManager(headless=True, profile=ScrapeProfile.from_config())
+                with manager.browser_context(lazy=True) as context:
+                    self._fetch_coalesced(context)
+                logger.debug(f"Background refresh finished for {name}")
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {name}: {e}")
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(name)
+        
+        logger.debug(f"Serving stale cache for {name}, refreshing in background")
+        threading.Thread(target=_revalidate, name=f"getcurcur-refresh-{name}", daemon=True).start()
     
     def convert_amount(self, amount: float, from_currency: str, 
                       context: BrowserContext, to_currency: str = "KRW", 
@@ -228,49 +791,252 @@ class ExchangeRateProvider(ABC):
         to_currency = to_currency.upper()
 
         try:
-            rates = self.get_rates(context)
+            rates = self._as_table(self.get_rates(context))
         except Exception as e:
             raise ProviderError(f"Failed to fetch exchange rates: {e}")
         
+        return self.convert_with_rates(amount, from_currency, rates, to_currency, transaction_type)
+    
+    @staticmethod
+    def convert_with_rates(amount: float, from_currency: str, rates: RateTable,
+                           to_currency: str = "KRW", transaction_type: str = "cash_buy") -> Optional[float]:
+        """
+        Convert amount between currencies using already fetched rates.
+        
+        Any two currencies in the table can be converted; cross rates go
+        through the table's base currency (KRW) and per-unit quotes such as
+        "JPY (100)" are normalized. See ConversionEngine.
+        
+        Args:
+            amount: Amount to convert
+            from_currency: Source currency code
+            rates: Rates to convert with
+            to_currency: Target currency code (default: KRW)
+            transaction_type: Either 'cash_buy' or 'cash_sell'
+        
+        Returns:
+            Converted amount or None if conversion not possible
+        """
         if not rates:
             logger.warning("No exchange rates available")
             return None
         
-        # Find the exchange rate for the source currency
+        converter = rates.converter()
+        result = converter.convert(amount, from_currency, to_currency, transaction_type)
+        if result is None:
+            matrix = converter.matrix(transaction_type)
+            for currency in (from_currency, to_currency):
+                code, _ = split_unit(currency)
+                if code not in matrix:
+                    logger.warning(f"Currency {code} not found in available rates")
+            return None
+        
+        logger.debug(f"Converted {amount} {from_currency} to {result} {to_currency}")
+        return result
+    
+    @staticmethod
+    def parse_rate(value: Any) -> Optional[float]:
+        """
+        Parse a displayed rate such as "1,300.00" into a float.
+        
+        Returns:
+            Positive rate value, or None for blank, '-' or unparseable values
+        """
+        rate_str = str(value).strip()
+        if not rate_str or rate_str == '-':
+            return None
+        try:
+            rate_value = float(rate_str.replace(',', '').replace(' ', ''))
+        except ValueError:
+            return None
+        return rate_value if rate_value > 0 else None
+    
+    @classmethod
+    def build_rate_index(cls, rates: Union[RateTable, List[Dict[str, str]]],
+                         transaction_type: str = "cash_buy") -> Dict[str, float]:
+        """
+        Build a currency code -> parsed rate lookup for one transaction type.
+        
+        Currencies without a usable rate are left out of the index.
+        RateTables return their memoized index.
+        """
+        if isinstance(rates, RateTable):
+            return rates.index(transaction_type)
+        index = {}
         for rate in rates:
-            if rate.get('code', '').upper() == from_currency:
-                try:
-                    # Validate rate data structure
-                    if transaction_type not in rate:
-                        logger.error(f"Transaction type '{transaction_type}' not found in rate data")
-                        return None
-                    
-                    rate_str = str(rate[transaction_type]).strip()
-                    if not rate_str or rate_str == '-':
-                        logger.warning(f"Invalid rate value for {from_currency}: {rate_str}")
-                        return None
-                    
-                    # Parse the rate (remove commas and handle various formats)
-                    cleaned_rate = rate_str.replace(',', '').replace(' ', '')
-                    rate_value = float(cleaned_rate)
-                    
-                    if rate_value <= 0:
-                        logger.warning(f"Invalid rate value for {from_currency}: {rate_value}")
-                        return None
-                    
-                    if to_currency == "KRW":
-                        # Convert foreign currency to KRW
-                        result = amount * rate_value
-                        logger.debug(f"Converted {amount} {from_currency} to {result} {to_currency}")
-                        return result
-                    else:
-                        # For other conversions, would need more complex logic
-                        logger.warning(f"Conversion to {to_currency} not yet supported")
-                        return None
-                        
-                except (ValueError, TypeError) as e:
-                    logger.error(f"Failed to parse rate for {from_currency}: {e}")
-                    return None
-        
-        logger.warning(f"Currency {from_currency} not found in available rates")
-        return None
+            code = rate.get('code', '').upper()
+            if not code or code in index:
+                continue
+            value = cls.parse_rate(rate.get(transaction_type, ''))
+            if value is not None:
+                index[code] = value
+        return index
+    
+    def convert_batch(self, rows: Iterable[Tuple[float, str, Optional[str]]],
+                      context: BrowserContext,
+                      transaction_type: str = "cash_buy",
+                      to_currency: str = "KRW") -> Iterator[Dict[str, Any]]:
+        """
+        Convert many amounts using a single rate lookup.
+        
+        Rates are fetched once on the first row; conversions go through the
+        table's ConversionEngine, so per-unit quotes such as "JPY (100)" are
+        normalized and each row costs one dict lookup in its memoized
+        matrix. Results are yielded as rows are consumed, so arbitrarily
+        large inputs can be streamed.
+        
+        Args:
+            rows: Iterable of (amount, currency code, transaction type or None);
+                a None type falls back to `transaction_type`
+            context: Browser context for rate fetching
+            transaction_type: Default transaction type, 'cash_buy' or 'cash_sell'
+            to_currency: Target currency code (default: KRW)
+        
+        Yields:
+            Dicts with amount, currency, transaction_type, rate, result and
+            error (result and rate are None when the row cannot be converted)
+        """
+        from ..exceptions import ProviderError
+        
+        if transaction_type not in ["cash_buy", "cash_sell"]:
+            raise ValueError(f"Invalid transaction_type: {transaction_type}. Must be 'cash_buy' or 'cash_sell'.")
+        
+        to_currency = to_currency.strip().upper()
+        rates = None
+        
+        for amount, currency, row_type in rows:
+            row_type = row_type or transaction_type
+            code = currency.strip().upper()
+            result = {"amount": amount, "currency": code, "transaction_type": row_type,
+                      "rate": None, "result": None, "error": None}
+            
+            if row_type not in ("cash_buy", "cash_sell"):
+                result["error"] = f"invalid transaction type: {row_type}"
+            elif not math.isfinite(amount):
+                result["error"] = "invalid amount"
+            elif amount < 0:
+                result["error"] = "negative amount"
+            else:
+                if rates is None:
+                    try:
+                        rates = self._as_table(self.get_rates(context))
+                    except Exception as e:
+                        raise ProviderError(f"Failed to fetch exchange rates: {e}")
+                
+                converter = rates.converter()
+                rate_value = converter.rate(code, to_currency, row_type)
+                if rate_value is None:
+                    matrix = converter.matrix(row_type)
+                    missing = code if split_unit(code)[0] not in matrix else to_currency
+                    result["error"] = f"no rate for {missing}"
+                elif not math.isfinite(amount * rate_value):
+                    result["error"] = "result out of range"
+                else:
+                    result["rate"] = rate_value
+                    result["result"] = amount * rate_value
+            
+            yield result
+
+
+class AsyncExchangeRateProvider(ExchangeRateProvider):
+    """
+    Provider that can also be driven from asyncio code.
+    Adds awaitable counterparts of fetch_rates and get_rates that share the
+    same cache, fetch modes and retry policy as the synchronous API.
+    """
+    
+    @abstractmethod
+    async def fetch_rates_async(self, context: Any) -> Union[RateTable, List[Dict[str, str]]]:
+        """
+        Fetch exchange rates using a playwright.async_api browser context.
+        
+        Returns:
+            Same structure as fetch_rates
+        """
+        pass
+    
+    async def extract_cells_async(self, page: Any, selector: str,
+                                  columns: Tuple[int, ...]) -> Optional[List[List[str]]]:
+        """Async counterpart of extract_cells for playwright.async_api pages."""
+        try:
+            with span("page.extract", selector=selector):
+                cells = await page.locator(selector).evaluate_all(self.EXTRACT_CELLS_SCRIPT, list(columns))
+        except Exception as e:
+            logger.debug(f"In-page extraction failed for {self.get_provider_name()}: {e}")
+            return None
+        return self._valid_cells(cells)
+    
+    async def _fetch_async(self, context: Any) -> Union[RateTable, List[Dict[str, str]]]:
+        """Async counterpart of _fetch; the HTTP fast path runs in a worker thread."""
+        from ..exceptions import ProviderError
+        
+        if self.fetch_mode != "browser":
+            try:
+                with span("fetch.http", provider=self.get_provider_name()):
+                    rates = await asyncio.to_thread(self.fetch_rates_http)
+            except ProviderError as e:
+                if self.fetch_mode == "http":
+                    raise
+                logger.info(f"HTTP fast path failed for {self.get_provider_name()}, using browser: {e}")
+                rates = None
+            
+            if rates:
+                return rates
+            if self.fetch_mode == "http":
+                raise ProviderError(f"{self.get_provider_name()} does not support HTTP-only fetching")
+        
+        with span("fetch.browser", provider=self.get_provider_name()):
+            return await self.fetch_rates_async(context)
+    
+    async def _can_retry_async(self, context: Any) -> bool:
+        """Async counterpart of _can_retry; async contexts are never lazy."""
+        try:
+            await context.cookies()
+        except Exception as e:
+            logger.warning(f"Browser context of {self.get_provider_name()} is closed, not retrying: {e}")
+            return False
+        return True
+    
+    async def get_rates_async(self, context: Any, use_cache: bool = True) -> RateTable:
+        """
+        Get exchange rates with optional caching without blocking the event loop.
+        
+        Args:
+            context: Playwright async browser context
+            use_cache: Whether to use cached data if available
+        
+        Returns:
+            RateTable of exchange rates
+        """
+        self.last_cache_entry = None
+        if use_cache and self.cache_enabled and self.cache_manager:
+            with span("cache.read", provider=self.get_provider_name()):
+                entry = await asyncio.to_thread(self.cache_manager.get_entry, self.get_provider_name())
+            if entry and entry.data:
+                self.last_cache_entry = entry
+                if entry.stale:
+                    self._refresh_in_background()
+                return self._as_table(entry.data)
+        
+        breaker = self.circuit_breaker
+        if breaker is not None and not await asyncio.to_thread(breaker.allow):
+            return await asyncio.to_thread(self._last_known_good, breaker)
+        
+        try:
+            async for attempt in self.retry_policy.async_retrying(retry_if=lambda _: self._can_retry_async(context)):
+                with attempt, span("fetch.attempt", attempt=attempt.retry_state.attempt_number):
+                    rates = self._as_table(await self._fetch_async(context))
+        except Exception as e:
+            logger.error(f"Failed to fetch rates from {self.get_provider_name()}: {e}")
+            if breaker is not None:
+                await asyncio.to_thread(breaker.record_failure, e)
+            raise
+        if breaker is not None:
+            await asyncio.to_thread(breaker.record_success)
+        
+        if self.cache_enabled and self.cache_manager and rates:
+            with span("cache.write", provider=self.get_provider_name()):
+                await asyncio.to_thread(self.cache_manager.set, self.get_provider_name(), rates)
+        await asyncio.to_thread(self._record_history, rates)
+        
+        return rates
@@ -1,19 +1,50 @@
-from typing import List, Dict
+from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
 from playwright.sync_api import Page, BrowserContext
-from bs4 import BeautifulSoup
 import logging
+import re
 
-from ..base import ExchangeRateProvider
+from ..base import AsyncExchangeRateProvider
+from ...rates import RateTable
+from ...http_client import get_http_client
+from ...parsing import extract_table_cells
+from ...tracing import span
 
 logger = logging.getLogger(__name__)
 
 
-class HanaBankProvider(ExchangeRateProvider):
+class HanaBankProvider(AsyncExchangeRateProvider):
     """하나은행 웹사이트에서 환율 정보를 가져오는 Provider입니다."""
     
     URL = "https://www.kebhana.com/cont/mall/mall15/mall1501/index.jsp"
+    # Endpoint the rate page calls via XHR to render its table
+    RATE_API_URL = "https://www.kebhana.com/cms/rate/wpfxd651_01i_01.do"
+    TABLE_ROWS_SELECTOR = "#p_grid1_tb > tbody > tr"
+    # The table is filled by an XHR after DOMContentLoaded; waiting for its
+    # rows avoids waiting for every tracker and image to go quiet
+    WAIT_UNTIL = "domcontentloaded"
+    READY_SELECTOR = TABLE_ROWS_SELECTOR
+    # Currency name, code, cash buy, cash sell
+    TABLE_COLUMNS = (0, 1, 2, 4)
+    # Runs inside a warm session page: posts the rate form the way the
+    # page does and returns the HTML fragment
+    REQUERY_SCRIPT = """async ([url, form]) => {
+        const response = await fetch(url, {
+            method: 'POST',
+            body: new URLSearchParams(form),
+            headers: {'X-Requested-With': 'XMLHttpRequest'},
+            credentials: 'same-origin',
+        });
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return await response.text();
+    }"""
     
-    def __init__(self, headless: bool = True, timeout: int = 30000, cache_enabled: bool = True):
+    KST = timezone(timedelta(hours=9))
+    # e.g. "미국 USD", "일본 JPY (100)"
+    _CURRENCY_CELL = re.compile(r"^(?P<name>.*?)\s*(?P<code>[A-Z]{3}(?:\s*\(\d+\))?)$")
+    
+    def __init__(self, headless: bool = True, timeout: int = 30000, cache_enabled: bool = True,
+                 fetch_mode: Optional[str] = None):
         """
         Initialize HanaBankProvider.
         
@@ -21,8 +52,9 @@ class HanaBankProvider(ExchangeRateProvider):
             headless: Run browser in headless mode
             timeout: Page load timeout in milliseconds
             cache_enabled: Enable caching of exchange rates
+            fetch_mode: 'browser', 'auto' or 'http' (see ExchangeRateProvider)
         """
-        super().__init__(cache_enabled=cache_enabled)
+        super().__init__(cache_enabled=cache_enabled, fetch_mode=fetch_mode)
         self.headless = headless
         self.timeout = timeout
 
@@ -32,48 +64,110 @@ class HanaBankProvider(ExchangeRateProvider):
     def get_country(self) -> str:
         return "KR"
     
-    def _parse_exchange_table(self, page: Page) -> List[Dict[str, str]]:
-        """Parse exchange rate table from the page."""
-        html_content = page.content()
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _parse_exchange_table(self, page: Page) -> RateTable:
+        """Parse exchange rate table from the page, reading cells in-page when possible."""
+        cells = self.extract_cells(page, self.TABLE_ROWS_SELECTOR, self.TABLE_COLUMNS)
+        if cells is None:
+            with span("page.content"):
+                html_content = page.content()
+            return self._parse_exchange_html(html_content)
+        return self._table_from_cells(cells)
+    
+    async def _parse_exchange_table_async(self, page: Any) -> RateTable:
+        """Async counterpart of _parse_exchange_table."""
+        cells = await self.extract_cells_async(page, self.TABLE_ROWS_SELECTOR, self.TABLE_COLUMNS)
+        if cells is None:
+            with span("page.content"):
+                html_content = await page.content()
+            return self._parse_exchange_html(html_content)
+        return self._table_from_cells(cells)
+    
+    def _table_from_cells(self, cells: List[List[str]]) -> RateTable:
+        """Build rates from (name, code, cash buy, cash sell) cell rows."""
+        # Skip rows without a currency code
+        rows = (row for row in cells if row[1] and row[1] != "-")
+        return RateTable.from_rows(self.get_provider_name(), self.get_country(), rows)
+    
+    def _parse_exchange_html(self, html_content: str) -> RateTable:
+        """Parse exchange rate table from saved or rendered page HTML."""
+        cells = extract_table_cells(html_content, self.TABLE_ROWS_SELECTOR, self.TABLE_COLUMNS)
+        return self._table_from_cells(cells)
+
+    def _parse_rate_fragment(self, html_content: str) -> RateTable:
+        """
+        Parse the HTML fragment returned by the rate XHR endpoint.
         
+        Each row is expected to start with a combined "name CODE" cell
+        followed by the cash buy rate, its spread, the cash sell rate and
+        its spread. This layout has not been checked against a captured
+        endpoint response, so the fast path is opt-in (fetch_mode).
+        """
         results = []
-        rows = soup.select("#p_grid1_tb > tbody > tr")
-        
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) >= 5:
-                try:
-                    # Extract and clean data
-                    currency_name = cols[0].text.strip()
-                    currency_code = cols[1].text.strip()
-                    cash_buy = cols[2].text.strip()
-                    cash_sell = cols[4].text.strip()
-                    
-                    # Skip if no valid data
-                    if not currency_code or currency_code == "-":
-                        continue
-                        
-                    results.append({
-                        "currency": currency_name,
-                        "code": currency_code,
-                        "cash_buy": cash_buy,
-                        "cash_sell": cash_sell,
-                        "provider": self.get_provider_name(),
-                        "country": self.get_country()
-                    })
-                except (IndexError, AttributeError) as e:
-                    logger.warning(f"Failed to parse row: {e}")
-                    continue
+        for name_code, cash_buy, cash_sell in extract_table_cells(
+                html_content, "table tbody tr", (0, 1, 3), separator=" "):
+            match = self._CURRENCY_CELL.match(" ".join(name_code.split()))
+            if not match:
+                continue
+            
+            results.append((match.group("name"), match.group("code"), cash_buy, cash_sell))
+        
+        return RateTable.from_rows(self.get_provider_name(), self.get_country(), results)
+    
+    @staticmethod
+    def _looks_valid(rates: RateTable) -> bool:
+        """Check that parsed rates contain at least one numeric cash rate."""
+        return any(value is not None for value in rates.cash_buy)
+    
+    def _rate_form(self) -> Dict[str, str]:
+        """Form the rate page posts to RATE_API_URL for today's rates."""
+        today = datetime.now(self.KST)
+        return {
+            "ajax": "true",
+            "curCd": "",
+            "tmpInqStrDt": today.strftime("%Y-%m-%d"),
+            "pbldDvCd": "3",
+            "pbldSqn": "",
+            "hid_key_data": "",
+            "inqStrDt": today.strftime("%Y%m%d"),
+            "inqKindCd": "1",
+            "hid_enc_data": "",
+            "requestTarget": "searchContentDiv",
+        }
+    
+    def fetch_rates_http(self) -> Optional[RateTable]:
+        """Fetch exchange rates by calling the page's rate endpoint directly."""
+        from ...exceptions import ParseError
+        
+        headers = {
+            "Referer": self.URL,
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        
+        logger.info(f"Fetching rates from {self.RATE_API_URL}")
+        with span("http.post", url=self.RATE_API_URL):
+            response = get_http_client().post_form(self.RATE_API_URL, self._rate_form(), headers=headers)
         
+        try:
+            results = self._parse_rate_fragment(response.text())
+        except Exception as e:
+            raise ParseError(f"Failed to parse exchange rate fragment: {e}")
+        
+        if not results or not self._looks_valid(results):
+            raise ParseError("Rate endpoint returned no usable exchange rate data")
+        
+        logger.info(f"Successfully fetched {len(results)} exchange rates over HTTP")
         return results
 
-    def fetch_rates(self, context: BrowserContext) -> List[Dict[str, str]]:
+    def fetch_rates(self, context: BrowserContext) -> RateTable:
         """Fetch exchange rates using a given Playwright context."""
-        from ...exceptions import NetworkError, ParseError, TimeoutError as GetCurCurTimeoutError
+        from ...exceptions import NetworkError
         
-        results = []
-        page = context.new_page()
+        session = self.session_for(context, self.URL)
+        if session is not None:
+            return self._fetch_rates_session(session)
+        
+        with span("page.new"):
+            page = context.new_page()
         try:
             # Set timeout
             page.set_default_timeout(self.timeout)
@@ -81,19 +175,102 @@ class HanaBankProvider(ExchangeRateProvider):
             # Navigate to the page
             logger.info(f"Fetching rates from {self.URL}")
             try:
-                page.goto(self.URL, wait_until="networkidle")
+                with span("page.goto", url=self.URL):
+                    page.goto(self.URL, wait_until=self.WAIT_UNTIL)
+            except Exception as e:
+                raise NetworkError(f"Failed to navigate to {self.URL}: {e}")
+            
+            return self._read_page(page)
+        finally:
+            page.close()
+    
+    def _read_page(self, page: Page) -> RateTable:
+        """Wait for the rate table of a loaded page and parse it."""
+        from ...exceptions import ParseError, TimeoutError as GetCurCurTimeoutError
+        
+        # Wait for the exchange rate table to load
+        try:
+            with span("page.wait_for_selector", selector=self.READY_SELECTOR):
+                page.wait_for_selector(self.READY_SELECTOR, state="attached", timeout=10000)
+        except Exception as e:
+            raise GetCurCurTimeoutError(f"Timeout waiting for exchange rate table: {e}")
+        
+        # Parse the exchange table
+        try:
+            with span("parse.table"):
+                results = self._parse_exchange_table(page)
+        except Exception as e:
+            raise ParseError(f"Failed to parse exchange rate data: {e}")
+        
+        if not results:
+            raise ParseError("No exchange rate data found")
+        
+        logger.info(f"Successfully fetched {len(results)} exchange rates")
+        return results
+    
+    def _fetch_rates_session(self, session: Any) -> RateTable:
+        """
+        Fetch exchange rates through a warm page kept by a ScrapeSession.
+        
+        With the HTTP fast path enabled (fetch_mode 'auto' or 'http'), a
+        warm page re-queries the rate endpoint from inside the page, with
+        its cookies and open connections, instead of reloading; otherwise,
+        and for a cold, crashed or failing page, the page is (re)loaded and
+        its table read.
+        """
+        from ...exceptions import NetworkError
+        
+        page = session.warm_page() if self.fetch_mode != "browser" else None
+        if page is not None:
+            try:
+                with span("page.requery", url=self.RATE_API_URL):
+                    fragment = page.evaluate(self.REQUERY_SCRIPT, [self.RATE_API_URL, self._rate_form()])
+                results = self._parse_rate_fragment(fragment)
+                if results and self._looks_valid(results):
+                    session.stats["requeried"] += 1
+                    logger.info(f"Re-queried {len(results)} exchange rates in the session page")
+                    return results
+                logger.debug("In-page re-query returned no usable rates, reloading")
+            except Exception as e:
+                logger.debug(f"In-page re-query failed, reloading: {e}")
+        
+        logger.info(f"Loading session page {self.URL}")
+        try:
+            page = session.load()
+        except Exception as e:
+            raise NetworkError(f"Failed to navigate to {self.URL}: {e}")
+        try:
+            return self._read_page(page)
+        except Exception:
+            # Start from a new page next time
+            session.discard()
+            raise
+    
+    async def fetch_rates_async(self, context: Any) -> RateTable:
+        """Fetch exchange rates using a playwright.async_api context."""
+        from ...exceptions import NetworkError, ParseError, TimeoutError as GetCurCurTimeoutError
+        
+        with span("page.new"):
+            page = await context.new_page()
+        try:
+            page.set_default_timeout(self.timeout)
+            
+            logger.info(f"Fetching rates from {self.URL}")
+            try:
+                with span("page.goto", url=self.URL):
+                    await page.goto(self.URL, wait_until=self.WAIT_UNTIL)
             except Exception as e:
                 raise NetworkError(f"Failed to navigate to {self.URL}: {e}")
             
-            # Wait for the exchange rate table to load
             try:
-                page.wait_for_selector("#p_grid1_tb > tbody > tr", timeout=10000)
+                with span("page.wait_for_selector", selector=self.READY_SELECTOR):
+                    await page.wait_for_selector(self.READY_SELECTOR, state="attached", timeout=10000)
             except Exception as e:
                 raise GetCurCurTimeoutError(f"Timeout waiting for exchange rate table: {e}")
             
-            # Parse the exchange table
             try:
-                results = self._parse_exchange_table(page)
+                with span("parse.table"):
+                    results = await self._parse_exchange_table_async(page)
             except Exception as e:
                 raise ParseError(f"Failed to parse exchange rate data: {e}")
             
@@ -102,6 +279,6 @@ class HanaBankProvider(ExchangeRateProvider):
             
             logger.info(f"Successfully fetched {len(results)} exchange rates")
         finally:
-            page.close()
+            await page.close()
 
         return results
@@ -0,0 +1,295 @@
+"""Typed exchange rate records and columnar rate tables."""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+from collections.abc import Mapping, Sequence as SequenceABC
+from decimal import Decimal, InvalidOperation
+import sys
+
+if TYPE_CHECKING:
+    from getcurcur.conversion import ConversionEngine
+
+RATE_FIELDS = ("currency", "code", "cash_buy", "cash_sell", "provider", "country")
+TRANSACTION_TYPES = ("cash_buy", "cash_sell")
+
+
+def parse_decimal(value: Any) -> Optional[Decimal]:
+    """
+    Parse a displayed rate such as "1,300.00" into a Decimal.
+
+    Returns:
+        Positive Decimal, or None for blank, '-' or unparseable values
+    """
+    if isinstance(value, Decimal):
+        return value if value > 0 else None
+    text = str(value).strip().replace(',', '').replace(' ', '')
+    if not text or text == '-':
+        return None
+    try:
+        number = Decimal(text)
+    except InvalidOperation:
+        return None
+    return number if number.is_finite() and number > 0 else None
+
+
+def format_decimal(value: Optional[Decimal]) -> str:
+    """Format a rate the way banks display it ("1,300.00"), '-' if missing."""
+    return '-' if value is None else f"{value:,}"
+
+
+def _intern(value: Any) -> str:
+    return sys.intern(str(value)) if value else ''
+
+
+class ExchangeRate(Mapping[str, str]):
+    """
+    Immutable exchange rate record with pre-parsed rates.
+
+    Buy/sell rates are stored as Decimal; string fields are interned so
+    records from many snapshots share their code, provider and country
+    strings. Mapping access (`rate["cash_buy"]`) returns the displayed
+    string form for compatibility with the former dict records.
+    """
+
+    __slots__ = RATE_FIELDS
+
+    currency: str
+    code: str
+    cash_buy: Optional[Decimal]
+    cash_sell: Optional[Decimal]
+    provider: str
+    country: str
+
+    def __init__(self, currency: str, code: str, cash_buy: Optional[Decimal],
+                 cash_sell: Optional[Decimal], provider: str = '', country: str = ''):
+        """
+        Initialize exchange rate record.
+
+        Args:
+            currency: Currency name
+            code: Currency code (e.g., USD)
+            cash_buy: Buying rate for cash
+            cash_sell: Selling rate for cash
+            provider: Provider name
+            country: Country code
+        """
+        set_field = object.__setattr__
+        set_field(self, 'currency', _intern(currency))
+        set_field(self, 'code', _intern(code))
+        set_field(self, 'cash_buy', cash_buy)
+        set_field(self, 'cash_sell', cash_sell)
+        set_field(self, 'provider', _intern(provider))
+        set_field(self, 'country', _intern(country))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ExchangeRate is immutable")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], provider: str = '', country: str = '') -> "ExchangeRate":
+        """Build a record from a dict of displayed strings."""
+        return cls(
+            currency=data.get('currency', ''),
+            code=data.get('code', ''),
+            cash_buy=parse_decimal(data.get('cash_buy', '')),
+            cash_sell=parse_decimal(data.get('cash_sell', '')),
+            provider=data.get('provider') or provider,
+            country=data.get('country') or country,
+        )
+
+    def value(self, transaction_type: str) -> Optional[float]:
+        """Return the rate for 'cash_buy' or 'cash_sell' as a float."""
+        rate = getattr(self, transaction_type)
+        return None if rate is None else float(rate)
+
+    def __getitem__(self, key: str) -> str:
+        if key not in RATE_FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        return format_decimal(value) if key in TRANSACTION_TYPES else value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RATE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(RATE_FIELDS)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the record as a dict of displayed strings."""
+        return {key: self[key] for key in RATE_FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ExchangeRate):
+            return all(getattr(self, key) == getattr(other, key) for key in RATE_FIELDS)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, key) for key in RATE_FIELDS))
+
+    def __repr__(self) -> str:
+        return (f"ExchangeRate(code={self.code!r}, cash_buy={self['cash_buy']!r}, "
+                f"cash_sell={self['cash_sell']!r}, provider={self.provider!r})")
+
+
+class RateTable(SequenceABC[ExchangeRate]):
+    """
+    Columnar table of exchange rates from one provider snapshot.
+
+    Each field is stored as one tuple instead of a dict per row, and the
+    provider/country strings are held once for the whole table. Rows are
+    materialized as ExchangeRate records on access. Float views of the rates,
+    the code -> rate index and the conversion engine are computed once and
+    memoized.
+    """
+
+    __slots__ = ("provider", "country", "currencies", "codes", "cash_buy", "cash_sell",
+                 "_floats", "_indexes", "_positions", "_converter")
+
+    def __init__(self, provider: str, country: str, currencies: Sequence[str],
+                 codes: Sequence[str], cash_buy: Sequence[Optional[Decimal]],
+                 cash_sell: Sequence[Optional[Decimal]]):
+        """
+        Initialize rate table.
+
+        Args:
+            provider: Provider name
+            country: Country code
+            currencies: Currency names, one per row
+            codes: Currency codes, one per row
+            cash_buy: Cash buying rates, one per row
+            cash_sell: Cash selling rates, one per row
+        """
+        if not len(currencies) == len(codes) == len(cash_buy) == len(cash_sell):
+            raise ValueError("RateTable columns must have the same length")
+        self.provider = _intern(provider)
+        self.country = _intern(country)
+        self.currencies = tuple(_intern(c) for c in currencies)
+        self.codes = tuple(_intern(c) for c in codes)
+        self.cash_buy = tuple(cash_buy)
+        self.cash_sell = tuple(cash_sell)
+        self._floats: Dict[str, List[Optional[float]]] = {}
+        self._indexes: Dict[str, Dict[str, float]] = {}
+        self._positions: Optional[Dict[str, int]] = None
+        self._converter: Optional["ConversionEngine"] = None
+
+    @classmethod
+    def from_rows(cls, provider: str, country: str,
+                  rows: Iterable[Sequence[str]]) -> "RateTable":
+        """Build a table from (currency, code, cash_buy, cash_sell) display strings."""
+        currencies, codes, buys, sells = [], [], [], []
+        for currency, code, cash_buy, cash_sell in rows:
+            currencies.append(currency)
+            codes.append(code)
+            buys.append(parse_decimal(cash_buy))
+            sells.append(parse_decimal(cash_sell))
+        return cls(provider, country, currencies, codes, buys, sells)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping[str, Any]], provider: str = '',
+                   country: str = '') -> "RateTable":
+        """Build a table from dict records (e.g. cached JSON)."""
+        rows = list(rows)
+        if rows:
+            provider = rows[0].get('provider') or provider
+            country = rows[0].get('country') or country
+        return cls.from_rows(provider, country, (
+            (row.get('currency', ''), row.get('code', ''), row.get('cash_buy', ''), row.get('cash_sell', ''))
+            for row in rows
+        ))
+
+    @classmethod
+    def coerce(cls, rates: Union["RateTable", Iterable[Mapping[str, Any]]], provider: str = '',
+               country: str = '') -> "RateTable":
+        """Return rates as a RateTable, converting dict records if needed."""
+        if isinstance(rates, RateTable):
+            return rates
+        return cls.from_dicts(rates, provider=provider, country=country)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> ExchangeRate: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RateTable": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ExchangeRate, "RateTable"]:
+        if isinstance(index, slice):
+            return RateTable(self.provider, self.country, self.currencies[index], self.codes[index],
+                             self.cash_buy[index], self.cash_sell[index])
+        return ExchangeRate(self.currencies[index], self.codes[index], self.cash_buy[index],
+                            self.cash_sell[index], self.provider, self.country)
+
+    def __iter__(self) -> Iterator[ExchangeRate]:
+        for i in range(len(self.codes)):
+            yield self[i]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RateTable):
+            return (self.provider, self.country, self.currencies, self.codes, self.cash_buy, self.cash_sell) == \
+                   (other.provider, other.country, other.currencies, other.codes, other.cash_buy, other.cash_sell)
+        if isinstance(other, list):
+            return self.to_dicts() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RateTable(provider={self.provider!r}, rows={len(self)})"
+
+    def values(self, transaction_type: str) -> List[Optional[float]]:
+        """Float view of one rate column, computed once."""
+        values = self._floats.get(transaction_type)
+        if values is None:
+            if transaction_type not in TRANSACTION_TYPES:
+                raise ValueError(f"Invalid transaction_type: {transaction_type}")
+            column = getattr(self, transaction_type)
+            values = self._floats[transaction_type] = [None if v is None else float(v) for v in column]
+        return values
+
+    def index(self, transaction_type: str = "cash_buy") -> Dict[str, float]:  # type: ignore[override]
+        """
+        Currency code -> float rate lookup for one transaction type.
+
+        Currencies without a usable rate are left out. The first row wins
+        when a code appears more than once.
+        """
+        index = self._indexes.get(transaction_type)
+        if index is None:
+            index = {}
+            for code, value in zip(self.codes, self.values(transaction_type)):
+                code = code.upper()
+                if value is not None and code not in index:
+                    index[code] = value
+            self._indexes[transaction_type] = index
+        return index
+
+    def find(self, code: str) -> Optional[ExchangeRate]:
+        """Return the first row for a currency code, or None."""
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for i, row_code in enumerate(self.codes):
+                positions.setdefault(row_code.upper(), i)
+            self._positions = positions
+        position = self._positions.get(code.upper())
+        return None if position is None else self[position]
+
+    def converter(self) -> "ConversionEngine":
+        """Cross-rate conversion engine for this snapshot, built once."""
+        if self._converter is None:
+            from getcurcur.conversion import ConversionEngine
+
+            self._converter = ConversionEngine(self)
+        return self._converter
+
+    def to_dicts(self) -> List[Dict[str, str]]:
+        """Return rows as dicts of displayed strings (JSON/CSV/cache format)."""
+        return [rate.to_dict() for rate in self]
+
+
+def as_dicts(rates: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Convert RateTables, ExchangeRate records or dicts into plain dicts."""
+    if isinstance(rates, RateTable):
+        return rates.to_dicts()
+    return [rate.to_dict() if isinstance(rate, ExchangeRate) else rate for rate in rates]
@@ -0,0 +1,203 @@
+"""Provider registry with entry-point plugin discovery."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from importlib import import_module
+import hashlib
+import json
+import os
+import sys
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Entry-point group third-party packages register providers under, e.g.
+#   [project.entry-points."getcurcur.providers"]
+#   "korea.kb" = "getcurcur_kb:KBBankProvider"
+ENTRY_POINT_GROUP = "getcurcur.providers"
+
+# Providers shipped with getcurcur; also found when it is not installed
+BUILTIN_PROVIDERS = {
+    "korea.hana": "getcurcur.providers.korea.hana:HanaBankProvider",
+}
+
+# Country tried first when a bare bank name is ambiguous
+DEFAULT_COUNTRY = "korea"
+
+DEFAULT_REGISTRY_CACHE = Path.home() / ".getcurcur" / "providers.json"
+
+
+def _metadata_fingerprint() -> str:
+    """
+    Fingerprint of the installed distributions.
+
+    Installing, upgrading or removing a distribution adds or removes its
+    .dist-info directory, which changes the modification time of the
+    sys.path directory holding it, so the directory mtimes stand in for
+    reading every distribution's metadata.
+    """
+    from getcurcur.__about__ import __version__
+
+    parts = [sys.version, __version__]
+    for entry in sys.path:
+        # The working directory changes too often to be part of the key
+        if not entry:
+            continue
+        try:
+            parts.append(f"{entry}:{os.stat(entry).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{entry}:-")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _scan_entry_points() -> List[Tuple[str, str]]:
+    """(name, "module:Class") pairs registered under ENTRY_POINT_GROUP."""
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        group: Iterable[Any] = entry_points.select(group=ENTRY_POINT_GROUP)
+    else:  # Python 3.9
+        group = entry_points.get(ENTRY_POINT_GROUP, [])
+    return [(entry_point.name, entry_point.value) for entry_point in group]
+
+
+class ProviderRegistry:
+    """
+    Provider import paths keyed by identifier (e.g. "korea.hana").
+
+    Built-in providers are merged with those registered under the
+    `getcurcur.providers` entry-point group. The discovered entry points
+    are cached on disk with a fingerprint of the installed distributions,
+    so importlib.metadata is only scanned after packages change. Provider
+    classes are imported when first loaded.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, use_cache: bool = True):
+        """
+        Initialize registry.
+
+        Args:
+            cache_path: Discovery cache file (default: ~/.getcurcur/providers.json)
+            use_cache: Read and write the discovery cache
+        """
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_REGISTRY_CACHE
+        self.use_cache = use_cache
+        self._paths: Optional[Dict[str, str]] = None
+        self._aliases: Dict[str, str] = {}
+        self._classes: Dict[str, type] = {}
+        self._lock = threading.Lock()
+
+    def _read_cache(self, fingerprint: str) -> Optional[List[Tuple[str, str]]]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return [(name, value) for name, value in cached["entry_points"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_cache(self, fingerprint: str, entry_points: List[Tuple[str, str]]) -> None:
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "entry_points": entry_points}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write provider registry cache: {e}")
+
+    def _discover(self) -> List[Tuple[str, str]]:
+        if not self.use_cache:
+            return _scan_entry_points()
+        fingerprint = _metadata_fingerprint()
+        entry_points = self._read_cache(fingerprint)
+        if entry_points is None:
+            logger.debug("Scanning installed distributions for provider entry points")
+            entry_points = _scan_entry_points()
+            self._write_cache(fingerprint, entry_points)
+        return entry_points
+
+    def _build(self) -> None:
+        paths = dict(BUILTIN_PROVIDERS)
+        for name, value in self._discover():
+            if "." not in name or ":" not in value:
+                logger.warning(f"Ignoring provider entry point '{name} = {value}': "
+                               "use 'country.bank = module:Class'")
+            elif paths.setdefault(name, value) != value:
+                logger.warning(f"Ignoring provider entry point '{name} = {value}': "
+                               f"'{name}' is already registered")
+
+        # Bare bank names resolve to the default country first, then in sorted order
+        aliases = {key: key for key in paths}
+        for key in sorted(paths, key=lambda key: (not key.startswith(f"{DEFAULT_COUNTRY}."), key)):
+            aliases.setdefault(key.split(".")[-1], key)
+        self._aliases = aliases
+        self._paths = paths
+
+    def _ensure_built(self) -> None:
+        if self._paths is None:
+            with self._lock:
+                if self._paths is None:
+                    self._build()
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        """Import paths ("module:Class") keyed by provider identifier."""
+        self._ensure_built()
+        return self._paths  # type: ignore[return-value]
+
+    def resolve(self, identifier: str) -> str:
+        """
+        Resolve "hana" or "korea.hana" to the registered identifier.
+
+        Raises:
+            ValueError: If provider not found
+        """
+        self._ensure_built()
+        key = self._aliases.get(identifier)
+        if key is None:
+            raise ValueError(f"Provider '{identifier}' not found")
+        return key
+
+    def load(self, identifier: str) -> type:
+        """
+        Import the provider class for an identifier or alias.
+
+        Raises:
+            ValueError: If provider not found
+            ProviderError: If the provider cannot be imported
+        """
+        from getcurcur.exceptions import ProviderError
+
+        key = self.resolve(identifier)
+        provider_class = self._classes.get(key)
+        if provider_class is None:
+            module_name, _, class_name = self.paths[key].partition(":")
+            try:
+                provider_class = getattr(import_module(module_name), class_name)
+            except (ImportError, AttributeError) as e:
+                raise ProviderError(f"Failed to load provider '{key}' from {self.paths[key]}: {e}")
+            self._classes[key] = provider_class
+        return provider_class
+
+    def __contains__(self, identifier: str) -> bool:
+        self._ensure_built()
+        return identifier in self._aliases
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+# Global registry instance
+_provider_registry: Optional[ProviderRegistry] = None
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Get the shared provider registry."""
+    global _provider_registry
+    if _provider_registry is None:
+        _provider_registry = ProviderRegistry()
+    return _provider_registry
@@ -0,0 +1,176 @@
+"""Retry policy for provider fetches."""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, fields
+import inspect
+import logging
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_before_delay,
+    wait_exponential,
+    wait_random,
+)
+from tenacity.asyncio import retry_all as async_retry_all, retry_if_exception as async_retry_if_exception
+from tenacity.retry import retry_base
+from tenacity.stop import stop_base
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Which fetch errors are retried, how often and how long to wait.
+
+    An error is transient if its class, or any base class, is named in
+    `transient_errors`; by default NetworkError and TimeoutError (ours,
+    Playwright's and the builtin) and ConnectionError. Anything else, such
+    as a ParseError, fails on the first attempt because scraping the same
+    page again would give the same result. Playwright's own errors (a
+    closed page or context) are transient as well; callers renew the
+    context in `before_sleep`, which only runs when another attempt follows.
+
+    The n-th retry waits base_delay * 2 ** (n - 1) seconds, capped at
+    max_delay, plus up to `jitter` random seconds so fetches that failed
+    together do not retry in lockstep. No retry starts if its wait would
+    end past `deadline` seconds after the first attempt.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    jitter: float = 0.5
+    deadline: Optional[float] = 60.0
+    transient_errors: Tuple[str, ...] = ("NetworkError", "TimeoutError", "ConnectionError")
+
+    # Config keys of the retry section, by field
+    CONFIG_KEYS = {
+        "max_attempts": "max_attempts",
+        "base_delay": "base_delay_seconds",
+        "max_delay": "max_delay_seconds",
+        "jitter": "jitter_seconds",
+        "deadline": "deadline_seconds",
+        "transient_errors": "transient_errors",
+    }
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+        object.__setattr__(self, "transient_errors", tuple(self.transient_errors))
+
+    @classmethod
+    def from_config(cls, provider_name: Optional[str] = None, config: Any = None) -> "RetryPolicy":
+        """
+        Policy from the retry config section.
+
+        Settings under retry.providers.<provider name> override the
+        section's defaults for that provider.
+
+        Args:
+            provider_name: Provider name as returned by get_provider_name()
+            config: Config to read (default: the global config)
+
+        Returns:
+            RetryPolicy
+        """
+        from getcurcur.config import get_config
+
+        config = config or get_config()
+        section: Dict[str, Any] = dict(config.get("retry", {}) or {})
+        overrides = (section.pop("providers", None) or {}).get(provider_name) if provider_name else None
+        section.update(overrides or {})
+
+        values = {}
+        for field in fields(cls):
+            key = cls.CONFIG_KEYS[field.name]
+            if key in section:
+                values[field.name] = section[key]
+        return cls(**values)
+
+    def is_transient(self, error: BaseException) -> bool:
+        """Whether a fetch that raised error is worth another attempt."""
+        from playwright.sync_api import Error as PlaywrightError
+
+        if isinstance(error, PlaywrightError):
+            return True
+        return any(klass.__name__ in self.transient_errors for klass in type(error).__mro__)
+
+    def _retrying_options(self, retry: Any, before_sleep: Callable[[RetryCallState], Any]) -> Dict[str, Any]:
+        stop: stop_base = stop_after_attempt(self.max_attempts)
+        if self.deadline is not None:
+            stop = stop | stop_before_delay(self.deadline)
+        return {
+            "stop": stop,
+            "wait": wait_exponential(multiplier=self.base_delay, max=self.max_delay) + wait_random(0, self.jitter),
+            "retry": retry,
+            "before_sleep": before_sleep,
+            # Give callers the provider's own error, not tenacity's RetryError
+            "reraise": True,
+        }
+
+    def retrying(self, retry_if: Optional[Callable[[BaseException], bool]] = None,
+                 before_sleep: Optional[Callable[[RetryCallState], Any]] = None,
+                 **kwargs: Any) -> Retrying:
+        """
+        Tenacity controller applying this policy.
+
+        Args:
+            retry_if: Extra check a transient error must also pass to be
+                retried (e.g. that the browser context can be renewed); it
+                also runs after the last attempt, so it must not tear
+                anything down
+            before_sleep: Called after the failure is logged, only when
+                another attempt follows (e.g. to renew the browser context)
+            kwargs: Passed on to tenacity.Retrying (e.g. sleep in tests)
+
+        Returns:
+            tenacity.Retrying
+        """
+        retry: retry_base = retry_if_exception(self.is_transient)
+        if retry_if is not None:
+            retry = retry & retry_if_exception(retry_if)
+
+        def log_and_prepare(retry_state: RetryCallState) -> None:
+            _log_retry(retry_state)
+            if before_sleep is not None:
+                before_sleep(retry_state)
+
+        return Retrying(**self._retrying_options(retry, log_and_prepare), **kwargs)
+
+    def async_retrying(self, retry_if: Optional[Callable[[BaseException], Awaitable[bool]]] = None,
+                       before_sleep: Optional[Callable[[RetryCallState], Any]] = None,
+                       **kwargs: Any) -> AsyncRetrying:
+        """
+        Async counterpart of retrying, for `async for attempt in ...` loops.
+
+        Args:
+            retry_if: Coroutine function making the extra check of retrying
+            before_sleep: Function or coroutine function called like retrying's
+            kwargs: Passed on to tenacity.AsyncRetrying
+
+        Returns:
+            tenacity.AsyncRetrying
+        """
+        retry: Any = retry_if_exception(self.is_transient)
+        if retry_if is not None:
+            retry = async_retry_all(retry, async_retry_if_exception(retry_if))
+
+        async def log_and_prepare(retry_state: RetryCallState) -> None:
+            _log_retry(retry_state)
+            if before_sleep is not None:
+                result = before_sleep(retry_state)
+                if inspect.isawaitable(result):
+                    await result
+
+        return AsyncRetrying(**self._retrying_options(retry, log_and_prepare), **kwargs)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    wait = retry_state.next_action.sleep if retry_state.next_action else 0.0
+    logger.info(f"Attempt {retry_state.attempt_number} failed ({error}), retrying in {wait:.2f}s")
@@ -0,0 +1,588 @@
+"""Background rate refresher and local lookup server (`getcurcur serve`)."""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import datetime, time as dt_time, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+import gzip
+import json
+import math
+import os
+import random
+import signal
+import socket
+import socketserver
+import threading
+import time
+import logging
+
+from getcurcur.__about__ import __version__
+from getcurcur.browser_manager import BrowserManager, get_browser_manager
+from getcurcur.conversion import split_unit
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.rates import ExchangeRate, RateTable
+
+logger = logging.getLogger(__name__)
+
+
+# Bodies smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
+
+def _gzip(body: bytes) -> Optional[bytes]:
+    return gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Latest rates of one provider with their pre-encoded JSON body."""
+
+    identifier: str
+    provider_name: str
+    table: RateTable
+    fetched_at: datetime
+    stale: bool
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+
+
+class RateStore:
+    """
+    Latest rate table per provider, held in memory.
+
+    Response bodies (and their gzip encodings) are built once when a table
+    is published, so lookups only copy bytes to the socket. Each snapshot's
+    ETag is derived from the time its rates were fetched.
+
+    Snapshots are immutable and publish never mutates the snapshot dict:
+    it builds a new one under the lock and swaps it in with one
+    assignment. Lookups read the dict once and need no lock, so they
+    never see it change while they iterate over it.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._index: Tuple[bytes, Optional[bytes], str] = (b"{}", None, 'W/"empty"')
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _etag(identifier: str, fetched_at: datetime, stale: bool) -> str:
+        # Weak: the identity and gzip encodings share one tag
+        return f'W/"{identifier}-{int(fetched_at.timestamp() * 1000):x}{"-stale" if stale else ""}"'
+
+    def publish(self, identifier: str, provider_name: str, table: RateTable,
+                fetched_at: datetime, stale: bool = False) -> Snapshot:
+        """Replace the provider's table and re-encode its responses."""
+        summary = {
+            "provider": identifier,
+            "name": provider_name,
+            "fetched_at": fetched_at.isoformat(timespec="seconds"),
+            "stale": stale,
+        }
+        body = self._encode(dict(summary, rates=table.to_dicts()))
+        snapshot = Snapshot(identifier, provider_name, table, fetched_at, stale, body, _gzip(body),
+                            self._etag(identifier, fetched_at, stale))
+        with self._lock:
+            published = dict(self._snapshots)
+            published[identifier] = snapshot
+            self._snapshots = published
+            snapshots = sorted(published.items())
+            index_body = self._encode({
+                key: {"name": s.provider_name, "fetched_at": s.fetched_at.isoformat(timespec="seconds"),
+                      "stale": s.stale, "rates": len(s.table)}
+                for key, s in snapshots
+            })
+            index_etag = 'W/"{}"'.format(";".join(s.etag[3:-1] for _, s in snapshots))
+            self._index = (index_body, _gzip(index_body), index_etag)
+        return snapshot
+
+    @staticmethod
+    def _resolve(snapshots: Dict[str, Snapshot], identifier: str) -> Optional[str]:
+        if identifier in snapshots:
+            return identifier
+        matches = [key for key in snapshots if key.split(".")[-1] == identifier]
+        return matches[0] if len(matches) == 1 else None
+
+    def resolve(self, identifier: str) -> Optional[str]:
+        """Map "korea.hana" or a unique bank name like "hana" to a published identifier."""
+        return self._resolve(self._snapshots, identifier)
+
+    def get(self, identifier: str) -> Optional[Snapshot]:
+        """Latest snapshot for a provider identifier or bank name."""
+        snapshots = self._snapshots
+        key = self._resolve(snapshots, identifier)
+        return None if key is None else snapshots[key]
+
+    def index(self) -> Tuple[bytes, Optional[bytes], str]:
+        """Summary body, its gzip encoding (None if small) and its ETag."""
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+@dataclass(frozen=True)
+class BankHours:
+    """Local hours during which banks publish new rates."""
+
+    start: dt_time = dt_time(9, 0)
+    end: dt_time = dt_time(20, 0)
+    utc_offset_hours: float = 9
+    weekdays_only: bool = True
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> Optional["BankHours"]:
+        """
+        Build bank hours from the serve.bank_hours config section.
+
+        Returns:
+            BankHours, or None if the section is set to null
+
+        Raises:
+            ValueError: If start or end is not an HH:MM time
+        """
+        from getcurcur.config import get_config
+
+        config = config or get_config()
+        section = config.get("serve.bank_hours", {})
+        if section is None:
+            return None
+        return cls(
+            start=dt_time.fromisoformat(section.get("start", "09:00")),
+            end=dt_time.fromisoformat(section.get("end", "20:00")),
+            utc_offset_hours=float(section.get("utc_offset_hours", 9)),
+            weekdays_only=bool(section.get("weekdays_only", True)),
+        )
+
+    def is_open(self, when: datetime) -> bool:
+        """Whether `when` (aware, or naive UTC) falls within bank hours."""
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        local = when.astimezone(timezone(timedelta(hours=self.utc_offset_hours)))
+        if self.weekdays_only and local.weekday() >= 5:
+            return False
+        return self.start <= local.time() < self.end
+
+
+class RefreshScheduler:
+    """
+    Refreshes every provider on a schedule from a single worker thread.
+
+    One thread owns all browser work because Playwright's sync API is bound
+    to the thread that started it; it holds one session context for its
+    lifetime, so providers that support it keep their page warm between
+    refreshes instead of opening a new one each time. Each provider is refreshed every
+    `interval_minutes` during bank hours and every
+    `off_hours_interval_minutes` otherwise, plus a random jitter so
+    refreshes do not line up across providers and hosts. At start-up a
+    fresh cache entry is published instead of fetching; a stale one is
+    published and then refreshed right away.
+    """
+
+    # Seconds before retrying a provider whose refresh failed
+    RETRY_SECONDS = 60.0
+
+    def __init__(self, providers: Dict[str, ExchangeRateProvider], store: RateStore,
+                 interval_minutes: float = 10, off_hours_interval_minutes: float = 120,
+                 jitter_seconds: float = 30, bank_hours: Optional[BankHours] = None,
+                 browser_manager: Optional[BrowserManager] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            providers: Provider instances keyed by identifier (e.g. "korea.hana")
+            store: Store the refreshed tables are published to
+            interval_minutes: Refresh interval during bank hours
+            off_hours_interval_minutes: Refresh interval outside bank hours
+            jitter_seconds: Maximum random delay added to each refresh
+            bank_hours: Bank hours; None refreshes at `interval_minutes` around the clock
+            browser_manager: Browser manager used to open contexts
+        """
+        self.providers = providers
+        self.store = store
+        self.interval = interval_minutes * 60
+        self.off_hours_interval = off_hours_interval_minutes * 60
+        self.jitter = jitter_seconds
+        self.bank_hours = bank_hours
+        self.browser_manager = browser_manager or get_browser_manager(headless=True)
+        self._next_due: Dict[str, float] = {identifier: 0.0 for identifier in providers}
+        self._warmed: Set[str] = set()
+        # Session context held by the worker thread while it runs
+        self._context: Optional[Any] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def interval_at(self, timestamp: float) -> float:
+        """Refresh interval in seconds at a point in time."""
+        if self.bank_hours is None:
+            return self.interval
+        when = datetime.fromtimestamp(timestamp, timezone.utc)
+        return self.interval if self.bank_hours.is_open(when) else self.off_hours_interval
+
+    def next_due(self) -> Dict[str, float]:
+        """Epoch time of the next refresh per provider."""
+        return dict(self._next_due)
+
+    def _publish_cached(self, identifier: str) -> bool:
+        """Publish the provider's cached table; True if it is still fresh."""
+        provider = self.providers[identifier]
+        cache_manager = provider.cache_manager
+        if not provider.cache_enabled or cache_manager is None:
+            return False
+        entry = cache_manager.get_entry(provider.get_provider_name())
+        if entry is None or not entry.data:
+            return False
+        self.store.publish(identifier, provider.get_provider_name(), provider._as_table(entry.data),
+                           entry.timestamp, stale=entry.stale)
+        return not entry.stale
+
+    def _refresh(self, identifier: str, context: Any) -> bool:
+        # Start-up serves a fresh cache entry instead of fetching
+        if identifier not in self._warmed:
+            self._warmed.add(identifier)
+            if self._publish_cached(identifier):
+                logger.debug(f"Serving cached rates for {identifier}")
+                return True
+
+        provider = self.providers[identifier]
+        try:
+            table = provider.get_rates(context, use_cache=False)
+        except Exception as e:
+            logger.warning(f"Scheduled refresh of {identifier} failed: {e}")
+            return False
+
+        entry = provider.last_cache_entry
+        if entry is not None and entry.last_known_good:
+            # Circuit open: keep serving the old rates, marked stale
+            self.store.publish(identifier, provider.get_provider_name(), table, entry.timestamp, stale=True)
+            return False
+
+        self.store.publish(identifier, provider.get_provider_name(), table, datetime.now())
+        logger.debug(f"Refreshed {identifier} ({len(table)} rates)")
+        return True
+
+    def run_pending(self, now: Optional[float] = None) -> List[str]:
+        """
+        Refresh every provider that is due and schedule its next refresh.
+
+        Returns:
+            Identifiers that were refreshed successfully
+        """
+        now = time.time() if now is None else now
+        due = [identifier for identifier, at in self._next_due.items() if at <= now]
+        if not due:
+            return []
+
+        if self._context is not None and threading.current_thread() is self._thread:
+            return self._refresh_due(due, now, self._context)
+        with self.browser_manager.browser_context(lazy=True) as context:
+            return self._refresh_due(due, now, context)
+
+    def _refresh_due(self, due: List[str], now: float, context: Any) -> List[str]:
+        refreshed = []
+        for identifier in due:
+            if self._stop.is_set():
+                break
+            if self._refresh(identifier, context):
+                refreshed.append(identifier)
+                delay = self.interval_at(now) + random.uniform(0, self.jitter)
+            else:
+                delay = min(self.RETRY_SECONDS, self.interval_at(now))
+            self._next_due[identifier] = now + delay
+        return refreshed
+
+    def _run(self) -> None:
+        # One context for the thread's lifetime keeps each provider's page warm
+        with self.browser_manager.session_context() as context:
+            self._context = context
+            try:
+                while not self._stop.is_set():
+                    try:
+                        self.run_pending()
+                    except Exception as e:
+                        logger.error(f"Refresh cycle failed: {e}")
+                        self._stop.wait(self.RETRY_SECONDS)
+                        continue
+                    wait = min(self._next_due.values(), default=time.time() + self.interval) - time.time()
+                    self._stop.wait(max(0.0, wait))
+            finally:
+                self._context = None
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="getcurcur-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker thread after its current refresh."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def _find_rate(table: RateTable, code: str) -> Optional[ExchangeRate]:
+    # "JPY" also finds unit-quoted codes such as "JPY (100)"
+    rate = table.find(code)
+    if rate is None:
+        prefix = f"{code.upper()} ("
+        rate = next((table[i] for i, c in enumerate(table.codes) if c.upper().startswith(prefix)), None)
+    return rate
+
+
+class RateRequestHandler(BaseHTTPRequestHandler):
+    """
+    Read-only JSON API over the rate store.
+
+    GET /rates                       summary of every provider
+    GET /rates/{provider}            latest table of one provider
+    GET /rates/{provider}/{code}     latest rate of one currency
+    GET /convert?amount=100&from=USD[&to=JPY&provider=hana&type=buy]
+    GET /health                      scheduler status
+
+    Rate responses carry an ETag derived from the fetch time and answer a
+    matching If-None-Match with 304. Large bodies are gzip-encoded for
+    clients that accept it.
+    """
+
+    # HTTP/1.1 keeps connections alive; every response sets Content-Length
+    protocol_version = "HTTP/1.1"
+    server_version = f"getcurcur/{__version__}"
+    # Buffer writes so headers and body leave in one send; the buffer is
+    # flushed after each request
+    wbufsize = -1
+
+    def _accepts_gzip(self) -> bool:
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = coding.partition(";")
+            if name.strip().lower() in ("gzip", "*"):
+                params = params.strip().lower()
+                try:
+                    return not params.startswith("q=") or float(params[2:]) > 0
+                except ValueError:
+                    return False
+        return False
+
+    def _not_modified(self, etag: str) -> bool:
+        # Weak comparison, as If-None-Match requires
+        tags = [tag.strip().removeprefix("W/") for tag in self.headers.get("If-None-Match", "").split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    def _send_json(self, status: int, body: bytes, etag: Optional[str] = None,
+                   gzip_body: Optional[bytes] = None) -> None:
+        if etag is not None and self._not_modified(etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        compressible = gzip_body is not None or len(body) >= GZIP_MIN_SIZE
+        encoded = (gzip_body or _gzip(body)) if compressible and self._accepts_gzip() else None
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if compressible:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoded is not None:
+            body = encoded
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_error_json(self, status: int, message: str) -> None:
+        self._send_json(status, json.dumps({"error": message}).encode("utf-8"))
+
+    def _snapshot(self, identifier: str) -> Optional[Snapshot]:
+        snapshot: Optional[Snapshot] = self.server.store.get(identifier)  # type: ignore[attr-defined]
+        if snapshot is None:
+            scheduler: Optional[RefreshScheduler] = getattr(self.server, "scheduler", None)
+            if scheduler is not None and any(identifier in (key, key.split(".")[-1]) for key in scheduler.providers):
+                self._send_error_json(503, f"Rates for {identifier} have not been fetched yet")
+            else:
+                self._send_error_json(404, f"Unknown provider: {identifier}")
+        return snapshot
+
+    def _send_rate(self, identifier: str, code: str) -> None:
+        snapshot = self._snapshot(identifier)
+        if snapshot is None:
+            return
+        rate = _find_rate(snapshot.table, code)
+        if rate is None:
+            self._send_error_json(404, f"Currency {code.upper()} not found at {snapshot.provider_name}")
+            return
+        data = dict(rate.to_dict(), fetched_at=snapshot.fetched_at.isoformat(timespec="seconds"),
+                    stale=snapshot.stale)
+        self._send_json(200, RateStore._encode(data), etag=snapshot.etag)
+
+    def _send_conversion(self, query: str) -> None:
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        transaction_type = {"buy": "cash_buy", "sell": "cash_sell"}.get(params.get("type", "buy"))
+        try:
+            amount = float(params["amount"])
+            from_currency = params["from"].upper()
+        except (KeyError, ValueError):
+            self._send_error_json(400, "amount (number) and from (currency code) are required")
+            return
+        to_currency = params.get("to", "KRW").upper()
+        # float() accepts "nan" and "inf", which JSON cannot represent
+        if transaction_type is None or not math.isfinite(amount) or amount < 0:
+            self._send_error_json(400, "amount must be a finite, non-negative number "
+                                       "and type must be 'buy' or 'sell'")
+            return
+
+        snapshot = self._snapshot(params.get("provider", "hana"))
+        if snapshot is None:
+            return
+        converter = snapshot.table.converter()
+        from_code, to_code = split_unit(from_currency)[0], split_unit(to_currency)[0]
+        for code in (from_code, to_code):
+            if code != converter.base and _find_rate(snapshot.table, code) is None:
+                self._send_error_json(404, f"Currency {code} not found at {snapshot.provider_name}")
+                return
+        rate = converter.rate(from_code, to_code, transaction_type)
+        if rate is None:
+            self._send_error_json(422, f"Cannot convert {from_code} to {to_code} "
+                                       f"at {snapshot.provider_name}")
+            return
+        result = amount * rate
+        if not math.isfinite(result):
+            self._send_error_json(400, f"amount is too large to convert to {to_code}")
+            return
+        self._send_json(200, RateStore._encode({
+            "amount": amount,
+            "from": from_code,
+            "to": to_code,
+            "transaction_type": transaction_type,
+            "rate": rate,
+            "result": result,
+            "provider": snapshot.identifier,
+            "fetched_at": snapshot.fetched_at.isoformat(timespec="seconds"),
+            "stale": snapshot.stale,
+        }), etag=snapshot.etag)
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["rates"]:
+            body, gzip_body, etag = self.server.store.index()  # type: ignore[attr-defined]
+            self._send_json(200, body, etag=etag, gzip_body=gzip_body)
+        elif len(parts) == 2 and parts[0] == "rates":
+            snapshot = self._snapshot(parts[1])
+            if snapshot is not None:
+                self._send_json(200, snapshot.body, etag=snapshot.etag, gzip_body=snapshot.gzip_body)
+        elif len(parts) == 3 and parts[0] == "rates":
+            self._send_rate(parts[1], parts[2])
+        elif parts == ["convert"]:
+            self._send_conversion(url.query)
+        elif parts == ["health"]:
+            store: RateStore = self.server.store  # type: ignore[attr-defined]
+            scheduler: Optional[RefreshScheduler] = getattr(self.server, "scheduler", None)
+            next_due = scheduler.next_due() if scheduler else {}
+            self._send_json(200, json.dumps({
+                "providers": len(store),
+                "next_refresh": {key: datetime.fromtimestamp(at).isoformat(timespec="seconds")
+                                 for key, at in next_due.items() if at},
+            }).encode("utf-8"))
+        else:
+            self._send_error_json(404, f"Not found: {self.path}")
+
+    do_HEAD = do_GET
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class TcpRateServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a TCP address."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], store: RateStore,
+                 scheduler: Optional[RefreshScheduler] = None):
+        super().__init__(address, RateRequestHandler)
+        self.store = store
+        self.scheduler = scheduler
+
+
+if hasattr(socket, "AF_UNIX"):
+    class UnixRateServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Threaded HTTP server bound to a Unix domain socket."""
+
+        daemon_threads = True
+
+        def __init__(self, path: Path, store: RateStore,
+                     scheduler: Optional[RefreshScheduler] = None):
+            if path.exists():
+                path.unlink()
+            self.socket_path = str(path)
+            super().__init__(self.socket_path, RateRequestHandler)
+            self.store = store
+            self.scheduler = scheduler
+
+        def get_request(self) -> Tuple[Any, Tuple[str, int]]:
+            # BaseHTTPRequestHandler expects a (host, port) client address
+            request, _ = super().get_request()
+            return request, ("unix", 0)
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+def create_server(store: RateStore, host: str = "127.0.0.1", port: int = 8765,
+                  socket_path: Optional[Path] = None,
+                  scheduler: Optional[RefreshScheduler] = None) -> socketserver.BaseServer:
+    """
+    Create the lookup server on a TCP port or, if given, a Unix socket.
+
+    Raises:
+        RuntimeError: If Unix sockets are not supported on this platform
+    """
+    if socket_path is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix domain sockets are not supported on this platform")
+        return UnixRateServer(socket_path, store, scheduler)
+    return TcpRateServer((host, port), store, scheduler)
+
+
+def serve(server: socketserver.BaseServer, scheduler: Optional[RefreshScheduler] = None) -> None:
+    """
+    Run the scheduler and server until interrupted or sent SIGTERM.
+
+    The server runs on a worker thread so the main thread can handle
+    signals and shut it down cleanly.
+    """
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+
+    if scheduler is not None:
+        scheduler.start()
+    server_thread = threading.Thread(target=server.serve_forever, name="getcurcur-server", daemon=True)
+    server_thread.start()
+    try:
+        while not stopped.wait(1.0):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        if scheduler is not None:
+            scheduler.stop(timeout=30)
+        logger.info("Rate server stopped")
@@ -0,0 +1,204 @@
+"""Lightweight timing spans for the scrape pipeline."""
+
+from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """One timed phase, with times in seconds since tracing started."""
+
+    name: str
+    start: float
+    duration: float
+    thread_id: int
+    thread_name: str
+    # Number of spans open on the same thread when this one started
+    depth: int = 0
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PhaseTiming:
+    """Spans of one name added up."""
+
+    name: str
+    calls: int
+    total: float
+    max: float
+    depth: int
+
+
+class _ActiveSpan:
+    """Context manager timing one span; cheaper than a generator-based one."""
+
+    __slots__ = ("_tracer", "_name", "_args", "_start", "_depth")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._depth = self._tracer._enter()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end = time.perf_counter()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer._record(self._name, self._start, end, self._depth, self._args)
+
+
+class Tracer:
+    """
+    Collects spans from every thread until tracing is stopped.
+
+    Spans are kept in memory and only turned into a summary or a trace
+    file on request, so recording one costs two clock reads and a list
+    append.
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._stopped: Optional[float] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name: str, args: Dict[str, Any]) -> _ActiveSpan:
+        """Context manager recording a span named name."""
+        return _ActiveSpan(self, name, args)
+
+    def _enter(self) -> int:
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _record(self, name: str, start: float, end: float, depth: int, args: Dict[str, Any]) -> None:
+        self._local.depth = depth
+        thread = threading.current_thread()
+        span = Span(name, start - self._origin, end - start, thread.ident or 0, thread.name, depth, args)
+        with self._lock:
+            self.spans.append(span)
+
+    def stop(self) -> None:
+        """Freeze the wall time reported for the trace."""
+        if self._stopped is None:
+            self._stopped = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the start of tracing until it stopped (or now)."""
+        return (self._stopped or time.perf_counter()) - self._origin
+
+    def phases(self) -> List[PhaseTiming]:
+        """Spans added up by name, in the order each name first started."""
+        phases: Dict[str, PhaseTiming] = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            phase = phases.get(span.name)
+            if phase is None:
+                phases[span.name] = PhaseTiming(span.name, 1, span.duration, span.duration, span.depth)
+            else:
+                phase.calls += 1
+                phase.total += span.duration
+                phase.max = max(phase.max, span.duration)
+                phase.depth = min(phase.depth, span.depth)
+        return list(phases.values())
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Spans in the Chrome trace-event format.
+
+        The result loads in chrome://tracing, Perfetto or speedscope: one
+        complete ("X") event per span with microsecond timestamps, plus a
+        thread_name metadata event per thread.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+                         for key, value in span.args.items()},
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """
+        Write the spans to a Chrome trace-event JSON file.
+
+        Args:
+            path: Output file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        logger.debug(f"Wrote {len(self.spans)} spans to {path}")
+
+
+# Active tracer; None (the default) makes span() a shared no-op
+_tracer: Optional[Tracer] = None
+_NO_SPAN = nullcontext()
+
+
+def span(name: str, **args: Any) -> Any:
+    """
+    Time a phase of the pipeline when tracing is on.
+
+    Usage: `with span("page.goto", url=url): ...`. With tracing off this
+    returns a shared no-op context manager, so instrumented code pays one
+    global lookup per phase.
+
+    Args:
+        name: Phase name; the part before the first dot is its category
+        args: Details shown with the span in trace viewers
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, args)
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans from every thread into a new Tracer."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording; returns the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.stop()
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Tracer currently recording spans, if tracing is on."""
+    return _tracer
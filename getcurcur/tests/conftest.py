@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from getcurcur import history
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path, monkeypatch):
+    """Record fetched rates in a per-test database, never ~/.getcurcur/history.db."""
+    rate_history = history.RateHistory(tmp_path / "history.db")
+    monkeypatch.setattr(history, "_rate_history", rate_history)
+    return rate_history
@@ -0,0 +1,144 @@
+"""Tests for the per-provider circuit breaker."""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from getcurcur.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from getcurcur.exceptions import CircuitOpenError, NetworkError
+from getcurcur.providers.base import CacheManager, ExchangeRateProvider
+from getcurcur.rates import RateTable
+from getcurcur.retry import RetryPolicy
+
+RATES = [{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class OutageProvider(ExchangeRateProvider):
+    """Provider whose site is down while `down` is set."""
+
+    def __init__(self, cache_dir, breaker):
+        super().__init__(cache_enabled=True, retry_policy=RetryPolicy(max_attempts=1))
+        self.history_enabled = False
+        self.cache_manager = CacheManager(cache_dir=cache_dir, memory=False, decoder=RateTable.from_dicts)
+        self.circuit_breaker = breaker
+        self.down = False
+        self.fetches = 0
+
+    def get_provider_name(self):
+        return "Outage Bank"
+
+    def get_country(self):
+        return "KR"
+
+    def fetch_rates(self, context):
+        self.fetches += 1
+        if self.down:
+            raise NetworkError("Failed to navigate: net::ERR_CONNECTION_REFUSED")
+        return RATES
+
+
+def test_breaker_opens_probes_and_closes(tmp_path):
+    """Test the closed -> open -> half-open -> closed cycle."""
+    clock = Clock()
+    breaker = CircuitBreaker(tmp_path / "bank.circuit", failure_threshold=2, cooldown_seconds=60, clock=clock)
+
+    breaker.record_failure(NetworkError("down"))
+    assert breaker.allow()
+    breaker.record_failure(NetworkError("down"))
+    assert breaker.state.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 60
+
+    clock.now += 61
+    assert breaker.allow()  # the probe
+    assert breaker.state.state == HALF_OPEN
+    assert not breaker.allow()  # others keep failing fast
+
+    breaker.record_failure(NetworkError("still down"))
+    assert breaker.state.state == OPEN
+    assert breaker.state.last_error == "still down"
+
+    clock.now += 61
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state.state == CLOSED
+    assert breaker.state.failures == 0
+
+
+def test_state_is_shared_through_the_file(tmp_path):
+    """Test another breaker on the same file (e.g. the next CLI run) sees the state."""
+    path = tmp_path / "bank.circuit"
+    CircuitBreaker(path, failure_threshold=1).record_failure(NetworkError("down"))
+    assert json.loads(path.read_text())["state"] == OPEN
+    assert not CircuitBreaker(path, failure_threshold=1).allow()
+
+    path.write_text("not json")
+    assert CircuitBreaker(path).allow()
+
+
+def test_open_circuit_serves_last_known_good(tmp_path):
+    """Test an open circuit skips fetching and serves the last cached rates."""
+    clock = Clock()
+    breaker = CircuitBreaker(tmp_path / "bank.circuit", failure_threshold=2, cooldown_seconds=60, clock=clock)
+    provider = OutageProvider(tmp_path, breaker)
+
+    provider.get_rates(MagicMock(), use_cache=False)
+    provider.down = True
+    for _ in range(2):
+        with pytest.raises(NetworkError):
+            provider.get_rates(MagicMock(), use_cache=False)
+    assert provider.fetches == 3
+
+    rates = provider.get_rates(MagicMock(), use_cache=False)
+    assert provider.fetches == 3
+    assert [rate.code for rate in rates] == ["USD"]
+    assert provider.last_cache_entry.last_known_good
+
+    # The cooldown is over and the site is back: the probe closes the circuit
+    clock.now += 61
+    provider.down = False
+    provider.get_rates(MagicMock(), use_cache=False)
+    assert provider.fetches == 4
+    assert provider.last_cache_entry is None
+    assert breaker.state.state == CLOSED
+
+
+def test_open_circuit_without_snapshot_fails_fast(tmp_path):
+    """Test CircuitOpenError is raised when there is nothing to fall back to."""
+    breaker = CircuitBreaker(tmp_path / "bank.circuit", failure_threshold=1)
+    provider = OutageProvider(tmp_path, breaker)
+    provider.down = True
+    with pytest.raises(NetworkError):
+        provider.get_rates(MagicMock(), use_cache=False)
+
+    with pytest.raises(CircuitOpenError, match="ERR_CONNECTION_REFUSED"):
+        provider.get_rates(MagicMock(), use_cache=False)
+    assert provider.fetches == 1
+
+
+def test_expired_entry_is_kept_as_last_known_good(tmp_path):
+    """Test entries past the staleness window are set aside, not deleted."""
+    cache = CacheManager(cache_dir=tmp_path, ttl_minutes=30, memory=False)
+    cache.set("Outage Bank", RATES)
+    cache_file = cache.path_for("Outage Bank")
+    cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+    cache_data["timestamp"] = (datetime.now() - timedelta(days=2)).isoformat()
+    cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+
+    assert cache.get_entry("Outage Bank") is None
+    assert not cache_file.exists()
+    entry = cache.get_last_good("Outage Bank")
+    assert entry.data == RATES
+    assert entry.stale and entry.last_known_good
+    assert entry.age >= timedelta(days=2)
+    assert cache.get_last_good("Other Bank") is None
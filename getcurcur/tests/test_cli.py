@@ -99,6 +99,27 @@ class TestShowCommand:
         assert "USD" in result.stdout
         assert "EUR" not in result.stdout
     
+    @patch('getcurcur.fetcher.fetch_all')
+    def test_show_all_providers(self, mock_fetch_all):
+        """Test show --bank all merges results and reports skipped providers."""
+        from getcurcur.fetcher import FetchResult
+
+        mock_fetch_all.return_value = [
+            FetchResult(
+                identifier="korea.hana",
+                provider_name="Test Bank",
+                rates=[{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00",
+                        "cash_sell": "1,350.00", "provider": "Test Bank", "country": "KR"}],
+            ),
+            FetchResult(identifier="korea.other", provider_name="Other Bank", error="Timed out after 60s"),
+        ]
+
+        result = runner.invoke(app, ["show", "-b", "all", "-f", "csv"])
+        assert result.exit_code == 0
+        assert "Skipped korea.other: Timed out after 60s" in result.stderr
+        assert "Skipped" not in result.stdout
+        assert "US Dollar,USD,1,300.00,1,350.00,Test Bank,KR" in result.stdout
+
     def test_show_invalid_provider(self):
         """Test show command with invalid provider."""
         result = runner.invoke(app, ["show", "-b", "invalid_bank"])
@@ -150,6 +171,184 @@ class TestConvertCommand:
         )
 
 
+    @patch('getcurcur.main.get_browser_manager')
+    @patch('getcurcur.main.get_provider')
+    def test_convert_batch(self, mock_get_provider, mock_get_bm, tmp_path):
+        """Test batch conversion streams one output row per input row."""
+        from getcurcur.providers.base import ExchangeRateProvider
+
+        class StubProvider(ExchangeRateProvider):
+            def get_provider_name(self):
+                return "Test Bank"
+
+            def get_country(self):
+                return "KR"
+
+            def fetch_rates(self, context):
+                return [{"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+        mock_get_provider.return_value = StubProvider(cache_enabled=False)
+        mock_bm = MagicMock()
+        mock_bm.browser_context.return_value.__enter__.return_value = MagicMock()
+        mock_get_bm.return_value = mock_bm
+
+        input_file = tmp_path / "rows.csv"
+        input_file.write_text("amount,currency,type\n100,USD,buy\n2,USD,sell\n1,XYZ,\n", encoding="utf-8")
+
+        result = runner.invoke(app, ["convert", "--batch", str(input_file)])
+        assert result.exit_code == 0
+        lines = result.stdout.strip().splitlines()
+        assert lines[0] == "amount,currency,transaction_type,rate,result,error"
+        assert lines[1] == "100.0,USD,cash_buy,1300.0,130000.0,"
+        assert lines[2] == "2.0,USD,cash_sell,1350.0,2700.0,"
+        assert lines[3] == "1.0,XYZ,cash_buy,,,no rate for XYZ"
+
+        result = runner.invoke(app, ["convert", "--batch", "-", "-f", "jsonl"], input="5,USD\n")
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["result"] == 6500.0
+
+        result = runner.invoke(app, ["convert", "--batch", "-", "--to", "usd", "-f", "jsonl"],
+                               input="2600,KRW\n")
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["result"] == pytest.approx(2.0)
+
+        # Non-finite input stops the stream; overflowing results are error rows
+        for amount in ("nan", "inf"):
+            result = runner.invoke(app, ["convert", "--batch", "-", "--to", "usd", "-f", "jsonl"],
+                                   input=f"2600,KRW\n{amount},KRW\n")
+            assert result.exit_code == 1
+            assert "line 2: invalid amount" in result.stderr
+            assert json.loads(result.stdout)["result"] == pytest.approx(2.0)
+
+        result = runner.invoke(app, ["convert", "--batch", "-", "--to", "krw", "-f", "jsonl"],
+                               input="1e308,USD\n")
+        assert result.exit_code == 0
+        row = json.loads(result.stdout, parse_constant=lambda name: pytest.fail(f"{name} in output"))
+        assert row["result"] is None
+        assert row["error"] == "result out of range"
+
+    def test_read_batch_rows_rejects_non_finite_amounts(self):
+        """Test NaN and infinite amounts are rejected like unparseable ones."""
+        from getcurcur.main import _read_batch_rows
+
+        assert list(_read_batch_rows(["1e3,USD"])) == [(1000.0, "USD", None)]
+        for amount in ("nan", "inf", "-Infinity"):
+            with pytest.raises(ValueError, match="line 2: invalid amount"):
+                list(_read_batch_rows(["1,USD", f"{amount},USD"]))
+
+    def test_convert_requires_amount_or_batch(self):
+        """Test convert without arguments is rejected."""
+        result = runner.invoke(app, ["convert"])
+        assert result.exit_code == 1
+
+    @patch('getcurcur.main.get_provider')
+    def test_convert_as_of(self, mock_get_provider, tmp_path):
+        """Test back-dated conversion uses the recorded rate without fetching."""
+        from datetime import datetime
+        from getcurcur.history import RateHistory
+        from getcurcur.rates import RateTable
+
+        history = RateHistory(tmp_path / "history.db")
+        history.record(RateTable.from_rows("Test Bank", "KR", [("미국", "USD", "1,300.00", "1,350.00"),
+                                                               ("일본", "JPY (100)", "900.00", "950.00")]),
+                       timestamp=datetime(2024, 1, 30, 10, 0))
+        mock_provider = MagicMock()
+        mock_provider.get_provider_name.return_value = "Test Bank"
+        mock_get_provider.return_value = mock_provider
+
+        with patch('getcurcur.history.get_rate_history', return_value=history):
+            result = runner.invoke(app, ["convert", "100", "USD", "--as-of", "2024-01-31"])
+            assert result.exit_code == 0
+            assert "130,000.00" in result.stdout
+            mock_provider.get_rates.assert_not_called()
+
+            result = runner.invoke(app, ["convert", "100", "USD", "--to", "JPY", "--as-of", "2024-01-31"])
+            assert result.exit_code == 0
+            assert "14,444.44 JPY" in result.stdout
+            
+            result = runner.invoke(app, ["convert", "100", "USD", "--as-of", "2024-01-01"])
+            assert result.exit_code == 1
+
+
+class TestHistoryCommand:
+    """Test 'history' command."""
+
+    @patch('getcurcur.main.get_provider')
+    def test_history_json(self, mock_get_provider, tmp_path):
+        """Test recorded rates are listed for the requested range."""
+        from datetime import datetime, timedelta
+        from getcurcur.history import RateHistory
+        from getcurcur.rates import RateTable
+
+        history = RateHistory(tmp_path / "history.db")
+        now = datetime.now()
+        for days, buy in ((10, "1,290.00"), (2, "1,300.00"), (1, "1,310.00")):
+            history.record(RateTable.from_rows("Test Bank", "KR", [("미국", "USD", buy, "1,350.00")]),
+                           timestamp=now - timedelta(days=days))
+        mock_get_provider.return_value.get_provider_name.return_value = "Test Bank"
+
+        with patch('getcurcur.history.get_rate_history', return_value=history):
+            result = runner.invoke(app, ["history", "-c", "usd", "--since", "7d", "-f", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert [row["cash_buy"] for row in data] == ["1,300.00", "1,310.00"]
+
+
+class TestServeCommand:
+    """Test 'serve' command."""
+    
+    @patch('getcurcur.server.serve')
+    @patch('getcurcur.server.create_server')
+    @patch('getcurcur.server.RefreshScheduler')
+    def test_serve_options(self, mock_scheduler, mock_create_server, mock_serve):
+        """Test serve wires the scheduler and server from CLI options."""
+        mock_create_server.return_value.server_address = ("127.0.0.1", 9000)
+        
+        result = runner.invoke(app, ["serve", "-b", "hana", "--port", "9000", "--interval", "5"])
+        
+        assert result.exit_code == 0
+        assert "http://127.0.0.1:9000" in result.stdout
+        providers = mock_scheduler.call_args[0][0]
+        assert list(providers) == ["korea.hana"]
+        assert mock_scheduler.call_args[1]["interval_minutes"] == 5
+        assert mock_create_server.call_args[1]["port"] == 9000
+        mock_serve.assert_called_once_with(mock_create_server.return_value, mock_scheduler.return_value)
+
+
+class TestBestCommand:
+    """Test 'best' command."""
+
+    @patch('getcurcur.fetcher.fetch_all')
+    def test_best_ranks_providers(self, mock_fetch_all):
+        """Test best ranks every provider and reports skipped ones."""
+        from getcurcur.fetcher import FetchResult
+
+        mock_fetch_all.return_value = [
+            FetchResult(identifier="korea.hana", provider_name="Hana",
+                        rates=[{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00",
+                                "cash_sell": "1,250.00"}]),
+            FetchResult(identifier="korea.kb", provider_name="KB",
+                        rates=[{"currency": "US Dollar", "code": "USD", "cash_buy": "1,295.00",
+                                "cash_sell": "1,260.00"}]),
+            FetchResult(identifier="korea.other", provider_name="Other", error="Timed out after 60s"),
+        ]
+
+        result = runner.invoke(app, ["best", "-c", "USD", "--type", "sell", "-f", "json"])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert [quote["identifier"] for quote in data["quotes"]] == ["korea.kb", "korea.hana"]
+        assert data["quotes"][1]["difference"] == "10.00"
+        assert data["skipped"] == {"korea.other": "Timed out after 60s"}
+
+        result = runner.invoke(app, ["best", "-c", "USD", "-f", "csv"])
+        assert result.exit_code == 0
+        assert '1,korea.kb,KB,"1,295.00","1,260.00",35.00' in result.stdout
+
+        result = runner.invoke(app, ["best", "-c", "GBP"])
+        assert result.exit_code == 1
+
+
 class TestListProvidersCommand:
     """Test 'list-providers' command."""
     
@@ -0,0 +1,69 @@
+"""Tests for ranking rates across providers."""
+
+import pytest
+
+from getcurcur.comparison import compare_rates
+from getcurcur.fetcher import FetchResult
+from getcurcur.rates import RateTable
+
+
+@pytest.fixture
+def results():
+    return [
+        FetchResult("korea.hana", "Hana", RateTable.from_rows("Hana", "KR", [
+            ("미국", "USD", "1,300.00", "1,250.00"),
+            ("일본", "JPY (100)", "900.00", "870.00"),
+        ])),
+        FetchResult("korea.kb", "KB", RateTable.from_rows("KB", "KR", [
+            ("미국", "USD", "1,295.00", "1,240.00"),
+            ("일본", "JPY", "9.10", "8.75"),
+        ])),
+        FetchResult("korea.shinhan", "Shinhan", RateTable.from_rows("Shinhan", "KR", [
+            ("미국", "USD", "1,310.00", "-"),
+        ])),
+        FetchResult("korea.woori", "Woori", error="Timed out after 60s"),
+    ]
+
+
+def test_buy_ranks_lowest_first(results):
+    """Test the cheapest bank to buy from ranks first, with spreads."""
+    comparison = compare_rates(results, "usd", "cash_buy")
+
+    assert [quote.identifier for quote in comparison.quotes] == ["korea.kb", "korea.hana", "korea.shinhan"]
+    assert comparison.best.spread == 55
+    assert comparison.quotes[1].spread_percent == pytest.approx(50 / 1275 * 100)
+    assert comparison.quotes[2].spread is None
+    assert comparison.difference(comparison.quotes[2]) == 15
+    assert comparison.skipped == {"korea.woori": "Timed out after 60s"}
+
+
+def test_sell_ranks_highest_first(results):
+    """Test the bank paying the most ranks first and missing rates are skipped."""
+    comparison = compare_rates(results, "USD", "cash_sell")
+
+    assert [quote.identifier for quote in comparison.quotes] == ["korea.hana", "korea.kb"]
+    assert comparison.difference(comparison.quotes[1]) == 10
+    assert comparison.skipped["korea.shinhan"] == "no cash_sell rate for USD"
+
+    data = comparison.to_dict()
+    assert data["quotes"][0] == {
+        "rank": 1, "identifier": "korea.hana", "provider": "Hana", "cash_buy": "1,300.00",
+        "cash_sell": "1,250.00", "spread": "50.00", "spread_percent": pytest.approx(3.9216),
+        "difference": "0.00",
+    }
+
+
+def test_units_are_normalized(results):
+    """Test rates quoted per different units are compared per the same unit."""
+    comparison = compare_rates(results, "JPY (100)", "cash_buy")
+
+    assert comparison.unit == 100
+    assert [quote.identifier for quote in comparison.quotes] == ["korea.hana", "korea.kb"]
+    assert comparison.quotes[1].cash_buy == 910
+    assert comparison.skipped["korea.shinhan"] == "JPY not quoted"
+
+
+def test_invalid_transaction_type(results):
+    """Test unknown transaction types are rejected."""
+    with pytest.raises(ValueError):
+        compare_rates(results, "USD", "mid")
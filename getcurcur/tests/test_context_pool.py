@@ -0,0 +1,237 @@
+"""Tests for the browser context pools."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from getcurcur.context_pool import AsyncContextPool, ContextPool
+from getcurcur.exceptions import TimeoutError as GetCurCurTimeoutError
+
+
+class FakeBrowser:
+    """Browser that hands out mock contexts and can be crashed."""
+
+    def __init__(self, async_api=False):
+        self.async_api = async_api
+        self.connected = True
+        self.launches = 1
+        self.contexts = []
+
+    def new_context(self):
+        context = AsyncMock() if self.async_api else MagicMock()
+        self.contexts.append(context)
+        return context
+
+    async def new_context_async(self):
+        return self.new_context()
+
+    def alive(self):
+        return self.connected
+
+    def relaunch(self):
+        self.connected = True
+        self.launches += 1
+
+    async def relaunch_async(self):
+        self.relaunch()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(browser, clock=None, **kwargs):
+    return ContextPool(browser.new_context, browser.alive, browser.relaunch, clock=clock or Clock(), **kwargs)
+
+
+def test_contexts_are_reused():
+    """Test checked-in contexts are reused instead of created."""
+    browser = FakeBrowser()
+    pool = _pool(browser, max_size=2)
+
+    with pool.context() as first:
+        pass
+    with pool.context() as second:
+        with pool.context() as third:
+            assert third is not second
+    assert second is first
+    assert len(browser.contexts) == 2
+    assert pool.metrics.as_dict()["reused"] == 1
+    assert pool.metrics.peak_in_use == 2
+    assert (pool.metrics.in_use, pool.metrics.idle) == (0, 2)
+
+
+def test_idle_time_and_use_limits():
+    """Test contexts are retired after max_idle_seconds or max_uses."""
+    browser = FakeBrowser()
+    clock = Clock()
+    pool = _pool(browser, clock, max_idle_seconds=60, max_uses=2)
+
+    context = pool.checkout()
+    pool.checkin(context)
+    clock.now = 30
+    assert pool.checkout() is context
+    # Second use reached max_uses
+    pool.checkin(context)
+    context.close.assert_called_once()
+
+    fresh = pool.checkout()
+    pool.checkin(fresh)
+    clock.now = 100
+    assert pool.checkout() is not fresh
+    fresh.close.assert_called_once()
+    assert pool.metrics.retired == 2
+
+
+def test_failed_probe_replaces_context():
+    """Test a context failing its liveness probe is closed and replaced."""
+    browser = FakeBrowser()
+    pool = _pool(browser)
+
+    context = pool.checkout()
+    pool.checkin(context)
+    context.cookies.side_effect = Exception("Target page, context or browser has been closed")
+
+    assert pool.checkout() is not context
+    assert pool.metrics.probe_failures == 1
+
+
+def test_browser_relaunched_after_crash():
+    """Test a disconnected browser is relaunched and its contexts retired."""
+    browser = FakeBrowser()
+    pool = _pool(browser)
+
+    old = pool.checkout()
+    browser.connected = False
+    new = pool.checkout()
+    assert new is not old
+    assert browser.launches == 2
+    assert pool.metrics.relaunches == 1
+
+    # Contexts of the crashed browser are closed on checkin
+    pool.checkin(old)
+    old.close.assert_called_once()
+    pool.checkin(new)
+    assert len(pool) == 1
+
+
+def test_saturated_sync_pool_raises():
+    """Test the sync pool fails fast when every context is checked out."""
+    pool = _pool(FakeBrowser(), max_size=1)
+    context = pool.checkout()
+    with pytest.raises(RuntimeError, match="in use"):
+        pool.checkout()
+    assert pool.metrics.saturated == 1
+
+    pool.close()
+    pool.checkin(context)
+    context.close.assert_called_once()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.checkout()
+
+
+def _async_pool(browser, **kwargs):
+    return AsyncContextPool(browser.new_context_async, browser.alive, browser.relaunch_async, **kwargs)
+
+
+def test_async_pool_waits_for_checkin():
+    """Test concurrent checkouts beyond max_size wait and are metered."""
+    browser = FakeBrowser(async_api=True)
+
+    async def scrape(pool, results):
+        async with pool.context() as context:
+            results.append(context)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        pool = _async_pool(browser, max_size=2)
+        results = []
+        await asyncio.gather(*(scrape(pool, results) for _ in range(6)))
+        await pool.close()
+        return pool, results
+
+    pool, results = asyncio.run(main())
+
+    assert len(results) == 6
+    assert len(browser.contexts) == 2
+    metrics = pool.metrics.as_dict()
+    assert metrics["peak_in_use"] == 2
+    assert metrics["saturated"] == 4
+    assert metrics["max_wait_seconds"] > 0
+    assert metrics["mean_wait_seconds"] > 0
+    assert all(context.close.await_count == 1 for context in browser.contexts)
+
+
+def test_async_pool_acquire_timeout():
+    """Test a checkout gives up after acquire_timeout."""
+    browser = FakeBrowser(async_api=True)
+
+    async def main():
+        pool = _async_pool(browser, max_size=1, acquire_timeout=0.01)
+        context = await pool.checkout()
+        with pytest.raises(GetCurCurTimeoutError):
+            await pool.checkout()
+        await pool.checkin(context)
+        assert await pool.checkout() is context
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool.metrics.timeouts == 1
+
+
+def test_async_pool_close_during_checkout():
+    """Test a checkout interrupted by close fails without keeping its reservation."""
+    browser = FakeBrowser(async_api=True)
+    clock = Clock()
+
+    async def main():
+        pool = _async_pool(browser, clock=clock, max_size=1, max_idle_seconds=10)
+        context = await pool.checkout()
+        await pool.checkin(context)
+        # The expired context is closed after the reservation is taken;
+        # close() runs while that await is pending
+        clock.now = 20
+        async def slow_close():
+            await asyncio.sleep(0.01)
+
+        context.close.side_effect = slow_close
+        closing = asyncio.create_task(pool.close())
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.checkout()
+        await closing
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool._reserved == 0
+    assert len(browser.contexts) == 1
+
+
+@patch('getcurcur.browser_manager.sync_playwright')
+def test_shared_browser_context_uses_pool(mock_playwright):
+    """Test shared contexts are pooled and the pool is closed with the browser."""
+    from getcurcur.browser_manager import BrowserManager
+
+    mock_p = MagicMock()
+    mock_playwright.return_value.__enter__.return_value = mock_p
+    mock_browser = mock_p.chromium.launch.return_value
+    mock_browser.new_context.side_effect = lambda **kwargs: MagicMock()
+    manager = BrowserManager(use_daemon=False)
+
+    with manager.with_shared_browser(max_contexts=2) as pool:
+        with manager.shared_browser_context() as first:
+            pass
+        with manager.shared_browser_context() as second:
+            pass
+        assert second is first
+        assert manager.pool is pool
+        assert pool.max_size == 2
+
+    first.close.assert_called_once()
+    mock_browser.close.assert_called_once()
+    assert manager.pool is None
+    assert mock_browser.new_context.call_count == 1
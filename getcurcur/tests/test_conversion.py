@@ -0,0 +1,72 @@
+"""Tests for the cross-rate conversion engine."""
+
+import pytest
+
+from getcurcur.conversion import ConversionEngine, split_unit
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.rates import RateTable
+
+
+@pytest.fixture
+def table():
+    return RateTable.from_rows("Test Bank", "KR", [
+        ("미국", "USD", "1,300.00", "1,250.00"),
+        ("일본", "JPY (100)", "900.00", "870.00"),
+        ("유로", "EUR", "1,400.00", "-"),
+        ("미국", "USD", "9,999.00", "9,999.00"),
+    ])
+
+
+def test_split_unit():
+    """Test quote units are split from currency codes."""
+    assert split_unit("JPY (100)") == ("JPY", 100)
+    assert split_unit(" usd ") == ("USD", 1)
+
+
+def test_cross_rates(table):
+    """Test conversions between any two currencies via KRW."""
+    engine = table.converter()
+    assert engine.base == "KRW"
+    assert engine.convert(100, "USD", "KRW") == pytest.approx(130000)
+    # JPY is quoted per 100 yen
+    assert engine.convert(1000, "JPY", "KRW") == pytest.approx(9000)
+    assert engine.convert(9000, "KRW", "JPY (100)") == pytest.approx(1000)
+    assert engine.convert(100, "USD", "JPY") == pytest.approx(100 * 1300 / 9)
+    assert engine.convert(100, "usd", "eur", "cash_sell") is None
+    assert engine.convert(100, "USD", "GBP") is None
+    assert engine.rate("USD", "USD") == 1.0
+    assert set(engine.currencies()) == {"KRW", "USD", "JPY", "EUR"}
+
+
+def test_matrix_is_memoized(table):
+    """Test the engine and its matrices are built once per snapshot."""
+    engine = table.converter()
+    assert table.converter() is engine
+    assert engine.matrix("cash_buy") is engine.matrix("cash_buy")
+    with pytest.raises(ValueError):
+        engine.matrix("mid")
+
+
+def test_direct_rates_preferred(table):
+    """Test a published direct pair is used instead of the KRW cross rate."""
+    engine = ConversionEngine(table, direct_rates=[("USD", "EUR", "cash_buy", 0.9)])
+    assert engine.rate("USD", "EUR") == pytest.approx(0.9)
+    assert engine.rate("EUR", "USD") == pytest.approx(1 / 0.9)
+    assert engine.rate("USD", "EUR", "cash_sell") is None
+    assert engine.direct_currencies() == ["USD", "EUR"]
+    assert engine.direct_currencies("cash_sell") == []
+
+
+def test_base_rates(table):
+    """Test per-unit base prices of the table's currencies."""
+    engine = table.converter()
+    assert engine.base_rates() == pytest.approx({"KRW": 1.0, "USD": 1300.0, "JPY": 9.0, "EUR": 1400.0})
+    assert "EUR" not in engine.base_rates("cash_sell")
+    with pytest.raises(ValueError):
+        engine.base_rates("mid")
+
+
+def test_convert_with_rates(table):
+    """Test provider conversions go through the engine."""
+    assert ExchangeRateProvider.convert_with_rates(100, "USD", table, "JPY") == pytest.approx(100 * 1300 / 9)
+    assert ExchangeRateProvider.convert_with_rates(100, "GBP", table) is None
@@ -0,0 +1,104 @@
+"""Tests for concurrent multi-provider fetching."""
+
+import contextlib
+import time
+from unittest.mock import MagicMock
+
+from getcurcur.browser_manager import BrowserManager
+from getcurcur.exceptions import NetworkError
+from getcurcur.fetcher import fetch_all
+from getcurcur.providers.base import ExchangeRateProvider
+
+
+class SleepyProvider(ExchangeRateProvider):
+    """Provider that takes a fixed time to return one rate."""
+
+    def __init__(self, name, delay, error=None):
+        super().__init__(cache_enabled=False)
+        self.name = name
+        self.delay = delay
+        self.error = error
+
+    def get_provider_name(self):
+        return self.name
+
+    def get_country(self):
+        return "KR"
+
+    def fetch_rates(self, context):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [{"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00", "provider": self.name}]
+
+    def get_rates(self, context, use_cache=True):
+        # Skip tenacity's retry waits; concurrency is what is under test
+        return self.fetch_rates(context)
+
+
+def _browser_manager():
+    manager = MagicMock()
+    manager.browser_context.return_value.__enter__.return_value = MagicMock()
+    return manager
+
+
+class TestFetchAll:
+    """Test fetch_all orchestration."""
+
+    def test_fetches_concurrently(self):
+        """Test wall time is bounded by the slowest provider, not the sum."""
+        providers = {f"korea.bank{i}": SleepyProvider(f"Bank {i}", 0.3) for i in range(4)}
+
+        start = time.perf_counter()
+        results = fetch_all(providers, browser_manager=_browser_manager())
+        elapsed = time.perf_counter() - start
+
+        assert all(result.ok for result in results)
+        assert [result.identifier for result in results] == list(providers)
+        assert elapsed < 0.9
+
+    def test_partial_results(self):
+        """Test failures and timeouts are reported without losing other results."""
+        providers = {
+            "korea.good": SleepyProvider("Good", 0.0),
+            "korea.broken": SleepyProvider("Broken", 0.0, error=NetworkError("boom")),
+            "korea.slow": SleepyProvider("Slow", 2.0),
+        }
+
+        results = {r.identifier: r for r in fetch_all(providers, timeout=0.5,
+                                                     browser_manager=_browser_manager())}
+
+        assert results["korea.good"].ok
+        assert results["korea.good"].rates[0]["provider"] == "Good"
+        assert results["korea.broken"].error == "boom"
+        assert "Timed out" in results["korea.slow"].error
+        assert results["korea.slow"].rates == []
+
+    def test_browser_launches_are_capped(self):
+        """Test without the daemon at most max_browsers workers hold a browser."""
+        open_now = []
+        peak = []
+
+        class BrowserProvider(SleepyProvider):
+            def fetch_rates(self, context):
+                context.new_page()
+                open_now.append(self.name)
+                peak.append(len(open_now))
+                time.sleep(self.delay)
+                open_now.remove(self.name)
+                return super().fetch_rates(context)
+
+        def browser_context(lazy=False, launch_slots=None):
+            if lazy:
+                return BrowserManager.browser_context(manager, lazy=True, launch_slots=launch_slots)
+            return contextlib.nullcontext(MagicMock())
+
+        manager = MagicMock()
+        manager.use_daemon = False
+        manager.browser_context.side_effect = browser_context
+        providers = {f"korea.bank{i}": BrowserProvider(f"Bank {i}", 0.05) for i in range(4)}
+
+        results = fetch_all(providers, browser_manager=manager, max_browsers=2)
+
+        assert all(result.ok for result in results)
+        assert max(peak) == 2
@@ -0,0 +1,94 @@
+"""Tests for the local rate history."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from getcurcur.history import RateHistory, parse_time_spec
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.rates import RateTable
+
+
+def _table(buy, provider="Test Bank"):
+    return RateTable.from_rows(provider, "KR", [("미국", "USD", buy, "1,350.00"),
+                                                ("일본", "JPY (100)", "950.00", "-")])
+
+
+def test_parse_time_spec():
+    """Test durations and ISO timestamps are accepted."""
+    now = datetime(2024, 3, 10, 12, 0)
+    assert parse_time_spec("7d", now=now) == datetime(2024, 3, 3, 12, 0)
+    assert parse_time_spec("12h", now=now) == datetime(2024, 3, 10, 0, 0)
+    assert parse_time_spec("2024-01-31") == datetime(2024, 1, 31)
+    with pytest.raises(ValueError):
+        parse_time_spec("last tuesday")
+
+
+def test_range_and_as_of(tmp_path):
+    """Test snapshots are queryable by range and as of a point in time."""
+    history = RateHistory(tmp_path / "history.db")
+    t0 = datetime(2024, 3, 1, 9, 0)
+    assert history.record(_table("1,300.00"), timestamp=t0) == 2
+    history.record(_table("1,310.00"), timestamp=t0 + timedelta(days=1))
+    history.record(_table("1,320.00"), timestamp=t0 + timedelta(days=2))
+    history.record(_table("1,999.00", provider="Other Bank"), timestamp=t0 + timedelta(days=1))
+
+    points = history.range("usd", since=t0 + timedelta(hours=1), provider="Test Bank")
+    assert [p.rate.cash_buy for p in points] == [Decimal("1310.00"), Decimal("1320.00")]
+    assert len(history.range("USD")) == 4
+
+    point = history.as_of("USD", t0 + timedelta(days=1, hours=5), provider="Test Bank")
+    assert point.timestamp == t0 + timedelta(days=1)
+    assert point.rate["cash_buy"] == "1,310.00"
+    assert point.to_dict()["timestamp"] == "2024-03-02T09:00:00"
+    assert history.as_of("USD", t0 - timedelta(seconds=1)) is None
+
+    # Unit-quoted codes match the plain code; missing rates stay missing
+    jpy = history.as_of("JPY", t0, provider="Test Bank")
+    assert jpy.rate.code == "JPY (100)"
+    assert jpy.rate.cash_sell is None
+
+
+def test_fresh_fetch_records_snapshot(tmp_path):
+    """Test fresh fetches are recorded but cache hits are not."""
+    history = RateHistory(tmp_path / "history.db")
+
+    class TestProvider(ExchangeRateProvider):
+        def get_provider_name(self):
+            return "History Test Bank"
+
+        def get_country(self):
+            return "KR"
+
+        def fetch_rates(self, context):
+            return [{"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+    provider = TestProvider(cache_enabled=False)
+    with patch("getcurcur.history.get_rate_history", return_value=history):
+        provider.get_rates(MagicMock(), use_cache=False)
+        provider.history_enabled = False
+        provider.get_rates(MagicMock(), use_cache=False)
+
+    points = history.range("USD", provider="History Test Bank")
+    assert len(points) == 1
+    assert points[0].rate.value("cash_buy") == 1300.0
+
+
+def test_lookups_use_the_code_index(tmp_path):
+    """Test currency lookups are served by an index, unit-quoted codes included."""
+    history = RateHistory(tmp_path / "history.db")
+    history.record(_table("1,300.00"))
+    where, params = history._where("JPY", "Test Bank")
+    conn = history._connect()
+    try:
+        plan = " ".join(row[-1] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT code FROM rates WHERE {where} AND ts <= ? ORDER BY ts DESC LIMIT 1",
+            params + [datetime.now().timestamp()],
+        ))
+    finally:
+        conn.close()
+    assert "USING INDEX idx_rates_provider_base_code_ts" in plan
+    assert "TEMP B-TREE" not in plan
+
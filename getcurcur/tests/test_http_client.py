@@ -0,0 +1,81 @@
+"""Tests for the pooled HTTP client."""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from getcurcur.exceptions import NetworkError
+from getcurcur.http_client import HttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        _Handler.connections.add(self.client_address)
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        payload = gzip.compress("받음:".encode("utf-8") + body)
+        if self.path == "/truncated":
+            payload = payload[:len(payload) // 2]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpClient:
+    """Test HTTP client behaviour."""
+
+    def test_post_form_reuses_connection(self, server):
+        """Test keep-alive connections are pooled across requests."""
+        client = HttpClient()
+        try:
+            first = client.post_form(f"{server}/rates", {"a": "1"})
+            second = client.post_form(f"{server}/rates", {"b": "2"})
+        finally:
+            client.close()
+
+        assert first.text() == "받음:a=1"
+        assert second.text() == "받음:b=2"
+        assert len(_Handler.connections) == 1
+
+    def test_error_status_raises(self, server):
+        """Test non-2xx responses raise NetworkError."""
+        client = HttpClient()
+        with pytest.raises(NetworkError):
+            client.post_form(f"{server}/missing", {})
+        client.close()
+
+    def test_invalid_gzip_raises_network_error(self, server):
+        """Test a truncated gzip body raises NetworkError so callers can fall back."""
+        client = HttpClient()
+        with pytest.raises(NetworkError, match="gzip"):
+            client.post_form(f"{server}/truncated", {"a": "1"})
+        client.close()
@@ -0,0 +1,186 @@
+"""Tests for full conversion matrix export."""
+
+import csv
+import io
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+from getcurcur.exceptions import NetworkError, ProviderError
+from getcurcur.main import app
+from getcurcur.matrix import RateMatrix, write_npy
+from getcurcur.rates import RateTable
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def table():
+    return RateTable.from_rows("Test Bank", "KR", [
+        ("미국", "USD", "1,300.00", "1,250.00"),
+        ("일본", "JPY (100)", "900.00", "870.00"),
+        ("유로", "EUR", "1,400.00", "-"),
+        ("미국", "USD", "9,999.00", "9,999.00"),
+    ])
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_rates_match_engine(table, use_numpy):
+    """Test every pair matches the conversion engine, with and without NumPy."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    matrix = RateMatrix.from_table(table, use_numpy=use_numpy)
+    engine = table.converter()
+
+    assert matrix.currencies == ["KRW", "USD", "JPY", "EUR"]
+    for transaction_type in ("cash_buy", "cash_sell"):
+        for source in matrix.currencies:
+            for target in matrix.currencies:
+                expected = engine.rate(source, target, transaction_type)
+                assert matrix.rate(source, target, transaction_type) == pytest.approx(expected)
+    assert matrix.rate("USD", "JPY (100)") == pytest.approx(1300 / 9)
+    assert matrix.rate("USD", "GBP") is None
+
+
+def test_numpy_matches_python(table):
+    """Test both backends produce the same values and missing pairs."""
+    pytest.importorskip("numpy")
+    vectorized = [v for m in RateMatrix.from_table(table, use_numpy=True).tolist() for row in m for v in row]
+    python = [v for m in RateMatrix.from_table(table, use_numpy=False).tolist() for row in m for v in row]
+    assert [v is None for v in vectorized] == [v is None for v in python]
+    assert [v for v in vectorized if v is not None] == pytest.approx([v for v in python if v is not None])
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_direct_pairs(table, use_numpy):
+    """Test direct pairs of the engine are used instead of the KRW cross rate."""
+    from getcurcur.conversion import ConversionEngine
+
+    if use_numpy:
+        pytest.importorskip("numpy")
+    engine = ConversionEngine(table, direct_rates=[("USD", "EUR", "cash_buy", 0.9), ("USD", "CHF", "cash_buy", 0.8)])
+    matrix = RateMatrix.from_engine(engine, use_numpy=use_numpy)
+
+    assert matrix.currencies == ["KRW", "USD", "JPY", "EUR", "CHF"]
+    assert matrix.rate("USD", "EUR") == pytest.approx(0.9)
+    assert matrix.rate("USD", "CHF") == pytest.approx(0.8)
+    assert matrix.rate("CHF", "KRW") == pytest.approx(1300 / 0.8)
+    assert matrix.rate("CHF", "KRW", "cash_sell") is None
+    for source in matrix.currencies:
+        for target in matrix.currencies:
+            assert matrix.rate(source, target) == pytest.approx(engine.rate(source, target))
+
+
+def test_invalid_transaction_type(table):
+    """Test unknown transaction types are rejected."""
+    with pytest.raises(ValueError):
+        RateMatrix.from_table(table, ["mid"])
+
+
+def test_csv_and_json(table):
+    """Test CSV rows and the JSON form, with missing rates left empty."""
+    matrix = RateMatrix.from_table(table, use_numpy=False)
+
+    out = io.StringIO()
+    matrix.write_csv(out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == ["transaction_type", "from", "KRW", "USD", "JPY", "EUR"]
+    assert len(rows) == 1 + 2 * 4
+    assert rows[2][:2] == ["cash_buy", "USD"] and float(rows[2][2]) == 1300.0
+    assert rows[-1] == ["cash_sell", "EUR", "", "", "", ""]
+
+    data = json.loads(json.dumps(matrix.to_dict()))
+    assert data["base"] == "KRW"
+    assert data["cash_sell"][0][3] is None
+    assert data["cash_buy"][1][0] == 1300.0
+
+
+def test_npy_without_numpy(table):
+    """Test the pure-Python .npy writer produces an array NumPy can load."""
+    np = pytest.importorskip("numpy")
+    matrix = RateMatrix.from_table(table, use_numpy=False)
+    out = io.BytesIO()
+    matrix.write_npy(out)
+    assert len(out.getvalue()) % 8 == 0
+
+    out.seek(0)
+    loaded = np.load(out)
+    assert loaded.shape == (2, 4, 4)
+    assert loaded.dtype == np.float64
+    np.testing.assert_allclose(loaded, RateMatrix.from_table(table, use_numpy=True).values)
+
+    out = io.BytesIO()
+    write_npy(out, [], (0,))
+    out.seek(0)
+    assert np.load(out).shape == (0,)
+
+
+class TestMatrixCommand:
+    """Test 'matrix' command."""
+
+    @patch('getcurcur.main.get_browser_manager')
+    @patch('getcurcur.main.get_provider')
+    def test_matrix_json(self, mock_get_provider, mock_get_bm, table):
+        """Test the matrix is printed as JSON for one transaction type."""
+        mock_provider = MagicMock()
+        mock_provider.get_provider_name.return_value = "Test Bank"
+        mock_provider.get_rates.return_value = table
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(app, ["matrix", "-f", "json", "--type", "sell", "--no-cache"])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["currencies"] == ["KRW", "USD", "JPY", "EUR"]
+        assert "cash_buy" not in data
+        assert data["cash_sell"][1][0] == 1250.0
+        assert mock_provider.get_rates.call_args.kwargs["use_cache"] is False
+
+    @patch('getcurcur.main.get_browser_manager')
+    @patch('getcurcur.main.get_provider')
+    def test_matrix_files(self, mock_get_provider, mock_get_bm, table, tmp_path):
+        """Test CSV and npy output files."""
+        mock_provider = MagicMock()
+        mock_provider.get_provider_name.return_value = "Test Bank"
+        mock_provider.get_rates.return_value = table
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(app, ["matrix", "-o", str(tmp_path / "rates.csv")])
+        assert result.exit_code == 0
+        assert (tmp_path / "rates.csv").read_text().startswith("transaction_type,from,KRW,USD")
+
+        result = runner.invoke(app, ["matrix", "-f", "npy", "-o", str(tmp_path / "rates.npy")])
+        assert result.exit_code == 0
+        assert (tmp_path / "rates.npy").read_bytes().startswith(b"\x93NUMPY")
+
+        result = runner.invoke(app, ["matrix", "--type", "mid"])
+        assert result.exit_code == 1
+
+    @patch('getcurcur.main.get_browser_manager')
+    @patch('getcurcur.main.get_provider')
+    def test_matrix_errors(self, mock_get_provider, mock_get_bm, table, tmp_path):
+        """Test empty tables and unwritable outputs exit cleanly."""
+        mock_provider = MagicMock()
+        mock_provider.get_provider_name.return_value = "Test Bank"
+        mock_provider.get_rates.return_value = RateTable.from_rows("Test Bank", "KR", [])
+        mock_get_provider.return_value = mock_provider
+
+        result = runner.invoke(app, ["matrix"])
+        assert result.exit_code == 1
+        assert "No exchange rate data found" in result.stdout
+        assert isinstance(result.exception, SystemExit)
+
+        mock_provider.get_rates.return_value = table
+        result = runner.invoke(app, ["matrix", "-o", str(tmp_path / "missing" / "rates.csv")])
+        assert result.exit_code == 1
+        assert "cannot write" in result.stdout
+        assert isinstance(result.exception, SystemExit)
+
+        for error, message in ((NetworkError("reset"), "Network error"), (ProviderError("no table"), "Provider error"),
+                               (RuntimeError("Browser closed"), "Unexpected error")):
+            mock_provider.get_rates.side_effect = error
+            result = runner.invoke(app, ["matrix"])
+            assert result.exit_code == 1
+            assert message in result.stdout
+            assert isinstance(result.exception, SystemExit)
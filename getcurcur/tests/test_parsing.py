@@ -0,0 +1,56 @@
+"""Tests for HTML parser backends."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from getcurcur.parsing import _strainer_for, available_backends, extract_table_cells, resolve_backend
+from getcurcur.providers.korea import HanaBankProvider
+
+# Synthetic page with Hana's rate table layout, not a captured page
+FIXTURE = Path(__file__).parent / "fixtures" / "hana_rates_synthetic.html"
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_extract_hana_table(backend):
+    """Test every installed backend reads the same rows from the Hana table layout."""
+    html = FIXTURE.read_text(encoding="utf-8")
+    rows = extract_table_cells(html, HanaBankProvider.TABLE_ROWS_SELECTOR, HanaBankProvider.TABLE_COLUMNS,
+                               backend=backend)
+
+    assert len(rows) == 49
+    assert rows[0] == ["미국", "USD", "1,343.10", "1,296.90"]
+    assert rows[1][1] == "JPY (100)"
+    assert ["알제리", "DZD", "-", "-"] in rows
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_skip_short_rows_and_join_text(backend):
+    """Test short rows are skipped and child text is joined with the separator."""
+    html = """
+    <table><tbody>
+        <tr><td><a>미국</a><br>USD</td><td>1,300.00</td><td>1.75</td><td>1,350.00</td></tr>
+        <tr><td colspan="4">no data</td></tr>
+    </tbody></table>
+    """
+    rows = extract_table_cells(html, "table tbody tr", (0, 1, 3), backend=backend, separator=" ")
+
+    assert rows == [["미국 USD", "1,300.00", "1,350.00"]]
+
+
+def test_strainer_targets_first_compound():
+    """Test html.parser only builds the subtree named by the selector."""
+    strainer = _strainer_for("#p_grid1_tb > tbody > tr")
+    assert strainer is not None
+    assert _strainer_for("> tr") is None
+
+
+def test_resolve_backend():
+    """Test auto selection, fallback for missing backends and unknown names."""
+    assert resolve_backend("auto") == available_backends()[0]
+    assert resolve_backend("html.parser") == "html.parser"
+    with patch("getcurcur.parsing.available_backends", return_value=["html.parser"]):
+        assert resolve_backend("selectolax") == "html.parser"
+    with pytest.raises(ValueError):
+        resolve_backend("regex")
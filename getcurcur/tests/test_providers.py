@@ -1,10 +1,14 @@
 """Tests for exchange rate providers."""
 
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from playwright.sync_api import BrowserContext
 from getcurcur.providers.base import ExchangeRateProvider, CacheManager
-from getcurcur.providers.korea import HanaBankProvider, WooriBankProvider
+from getcurcur.providers.korea import HanaBankProvider
 from getcurcur.exceptions import NetworkError, ParseError
 
 
@@ -40,6 +44,68 @@ class TestCacheManager:
         assert result == test_data
 
 
+    def test_stale_while_revalidate_window(self, tmp_path):
+        """Test expired entries are served as stale until the max-staleness limit."""
+        cache = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30, max_stale_minutes=60, memory=False)
+        test_data = [{"code": "USD", "rate": "1300"}]
+        cache.set("test_provider", test_data)
+        cache_file = next((tmp_path / "cache").glob("*.json"))
+
+        def _age_cache(minutes):
+            cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+            cache_data["timestamp"] = (datetime.now() - timedelta(minutes=minutes)).isoformat()
+            cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+
+        _age_cache(45)
+        entry = cache.get_entry("test_provider")
+        assert entry.stale
+        assert entry.data == test_data
+        assert entry.age >= timedelta(minutes=45)
+        assert cache.get("test_provider") is None  # get() only returns fresh data
+
+        _age_cache(120)
+        assert cache.get_entry("test_provider") is None
+        assert not cache_file.exists()
+
+    def test_expired_without_stale_window(self, tmp_path):
+        """Test expired entries are dropped when stale serving is disabled."""
+        cache = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30, memory=False)
+        cache.set("test_provider", [{"code": "USD"}])
+        cache_file = next((tmp_path / "cache").glob("*.json"))
+        cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+        cache_data["timestamp"] = (datetime.now() - timedelta(minutes=31)).isoformat()
+        cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+
+        assert cache.get_entry("test_provider") is None
+
+
+    def test_memory_tier_avoids_disk(self, tmp_path):
+        """Test repeated lookups are served from memory after one disk read."""
+        cache = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30)
+        cache.set("test_provider", [{"code": "USD", "rate": "1300"}])
+        cache.memory.clear()
+
+        for _ in range(1000):
+            assert cache.get("test_provider")[0]["rate"] == "1300"
+
+        assert cache.stats["disk_hits"] == 1
+        assert cache.stats["memory_hits"] == 999
+
+    def test_memory_cache_lru_eviction(self):
+        """Test the memory tier stays bounded."""
+        from getcurcur.providers.base import CacheEntry, MemoryCache
+
+        memory = MemoryCache(maxsize=2)
+        for key in ("a", "b"):
+            memory.set(key, CacheEntry(data=[{"code": key}], timestamp=datetime.now()))
+        memory.get("a")  # "b" becomes least recently used
+        memory.set("c", CacheEntry(data=[{"code": "c"}], timestamp=datetime.now()))
+
+        assert len(memory) == 2
+        assert memory.get("b") is None
+        assert memory.get("a") is not None
+
+
 class TestExchangeRateProvider:
     """Test base provider functionality."""
     
@@ -81,6 +147,79 @@ class TestExchangeRateProvider:
         assert result is None
 
 
+    def test_convert_batch(self):
+        """Test batch conversion fetches rates once and streams results."""
+        class MockProvider(ExchangeRateProvider):
+            fetches = 0
+
+            def get_provider_name(self):
+                return "Mock Provider"
+
+            def get_country(self):
+                return "KR"
+
+            def fetch_rates(self, context):
+                MockProvider.fetches += 1
+                return [
+                    {"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"},
+                    {"code": "EUR", "cash_buy": "1,400.00", "cash_sell": "-"}
+                ]
+
+        provider = MockProvider(cache_enabled=False)
+        rows = [(100, "usd", None), (10, "EUR", "cash_buy"), (1, "USD", "cash_sell"),
+                (5, "EUR", "cash_sell"), (1, "GBP", None), (-1, "USD", None)]
+        results = list(provider.convert_batch(iter(rows), MagicMock()))
+
+        assert MockProvider.fetches == 1
+        assert [r["result"] for r in results] == [130000.0, 14000.0, 1350.0, None, None, None]
+        assert results[0]["currency"] == "USD"
+        assert results[3]["error"] == "no rate for EUR"
+        assert results[5]["error"] == "negative amount"
+
+        rows = [(float("nan"), "USD", None), (float("inf"), "USD", None), (-float("inf"), "USD", None)]
+        results = list(provider.convert_batch(iter(rows), MagicMock()))
+        assert [r["error"] for r in results] == ["invalid amount"] * 3
+        assert all(r["result"] is None and r["rate"] is None for r in results)
+
+    def test_convert_batch_unit_quotes(self):
+        """Test batch conversion normalizes per-unit quotes and converts to other currencies."""
+        class MockProvider(ExchangeRateProvider):
+            def get_provider_name(self):
+                return "Mock Provider"
+
+            def get_country(self):
+                return "KR"
+
+            def fetch_rates(self, context):
+                return [
+                    {"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"},
+                    {"code": "JPY (100)", "cash_buy": "900.00", "cash_sell": "950.00"}
+                ]
+
+        provider = MockProvider(cache_enabled=False)
+        rows = [(1000, "JPY", None), (1000, "JPY (100)", None), (1, "USD", "cash_sell")]
+        results = list(provider.convert_batch(iter(rows), MagicMock()))
+        assert [r["rate"] for r in results] == [pytest.approx(9.0), pytest.approx(9.0), 1350.0]
+        assert results[0]["result"] == pytest.approx(9000.0)
+        assert results[1]["result"] == pytest.approx(9000.0)
+
+        results = list(provider.convert_batch(iter([(13, "USD", None), (1, "USD", None)]), MagicMock(),
+                                              to_currency="jpy"))
+        assert results[0]["result"] == pytest.approx(13 * 1300 / 9)
+
+        results = list(provider.convert_batch(iter([(1, "USD", None)]), MagicMock(), to_currency="GBP"))
+        assert results[0]["result"] is None
+        assert results[0]["error"] == "no rate for GBP"
+
+    def test_build_rate_index(self):
+        """Test rate index parsing skips unusable values."""
+        index = ExchangeRateProvider.build_rate_index(
+            [{"code": "usd", "cash_buy": "1,300.50"}, {"code": "JPY", "cash_buy": "-"}],
+            "cash_buy",
+        )
+        assert index == {"USD": 1300.5}
+
+
 class TestHanaBankProvider:
     """Test Hana Bank provider."""
     
@@ -119,12 +258,212 @@ class TestHanaBankProvider:
         assert rates[0]["provider"] == "KEB Hana Bank (Korea)"
         assert rates[0]["country"] == "KR"
     
+    def test_fetch_rates_in_page_extraction(self):
+        """Test rates are read in-page without serializing the DOM."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.evaluate_all.return_value = [
+            ["미국", "USD", "1,300.00", "1,350.00"],
+            None,  # Row with too few cells
+            ["", "-", "", ""],
+        ]
+        mock_context = MagicMock()
+        mock_context.new_page.return_value = mock_page
+
+        provider = HanaBankProvider(cache_enabled=False)
+        rates = provider.fetch_rates(mock_context)
+
+        assert rates == [{"currency": "미국", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00",
+                          "provider": "KEB Hana Bank (Korea)", "country": "KR"}]
+        mock_page.locator.assert_called_with(HanaBankProvider.TABLE_ROWS_SELECTOR)
+        assert mock_page.locator.return_value.evaluate_all.call_args.args[1] == [0, 1, 2, 4]
+        mock_page.content.assert_not_called()
+
+    def test_fetch_rates_extraction_falls_back_to_html(self):
+        """Test unexpected in-page results fall back to parsing page.content()."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.evaluate_all.return_value = {"unexpected": True}
+        mock_page.content.return_value = """
+        <table id="p_grid1_tb"><tbody>
+            <tr><td>유럽연합</td><td>EUR</td><td>1,400.00</td><td>1,420.00</td><td>1,450.00</td></tr>
+        </tbody></table>
+        """
+        mock_context = MagicMock()
+        mock_context.new_page.return_value = mock_page
+
+        rates = HanaBankProvider(cache_enabled=False).fetch_rates(mock_context)
+
+        assert rates[0]["code"] == "EUR"
+        assert rates[0]["cash_sell"] == "1,450.00"
+
+    def test_fetch_rates_session(self):
+        """Test a session page is loaded once, then re-queried in-page when the fast path is enabled."""
+        from getcurcur.browser_manager import SessionContext
+
+        fragment = """
+        <table><tbody><tr>
+            <td>미국 USD</td><td>1,310.00</td><td>1.75</td><td>1,360.00</td><td>1.75</td>
+        </tr></tbody></table>
+        """
+        mock_page = MagicMock()
+        mock_page.is_closed.return_value = False
+        mock_page.evaluate.side_effect = lambda script, *args: fragment if args else 1
+        mock_page.locator.return_value.evaluate_all.return_value = [["미국", "USD", "1,300.00", "1,350.00"]]
+        mock_manager = MagicMock()
+        mock_manager.browser_context.return_value.__enter__.return_value.new_page.return_value = mock_page
+
+        provider = HanaBankProvider(cache_enabled=False, fetch_mode="auto")
+        context = SessionContext(mock_manager)
+        first = provider.fetch_rates(context)
+        second = provider.fetch_rates(context)
+
+        assert first[0]["cash_buy"] == "1,300.00"
+        assert second[0]["cash_buy"] == "1,310.00"
+        mock_page.goto.assert_called_once_with(HanaBankProvider.URL, wait_until=HanaBankProvider.WAIT_UNTIL)
+        mock_page.reload.assert_not_called()
+        assert context.sessions[provider.get_provider_name()].stats["requeried"] == 1
+
+        # A failed re-query falls back to reloading the page
+        mock_page.evaluate.side_effect = lambda script, *args: "<p>error</p>" if args else 1
+        assert provider.fetch_rates(context)[0]["cash_buy"] == "1,300.00"
+        mock_page.reload.assert_called_once()
+
+        context._release()
+        mock_page.close.assert_called_once()
+
     def test_provider_metadata(self):
         """Test provider metadata."""
         provider = HanaBankProvider()
         assert provider.get_provider_name() == "KEB Hana Bank (Korea)"
         assert provider.get_country() == "KR"
 
+    @patch('getcurcur.providers.korea.hana.get_http_client')
+    def test_fetch_rates_http(self, mock_get_client):
+        """Test fetching rates from the XHR endpoint without a browser."""
+        mock_response = MagicMock()
+        mock_response.text.return_value = """
+        <table class="tblBasic">
+            <thead><tr><th>통화</th></tr></thead>
+            <tbody>
+                <tr>
+                    <td><a href="#">미국 USD</a></td>
+                    <td>1,300.00</td><td>1.75</td><td>1,350.00</td><td>1.75</td>
+                </tr>
+                <tr>
+                    <td><a href="#">일본 JPY (100)</a></td>
+                    <td>900.10</td><td>1.75</td><td>930.20</td><td>1.75</td>
+                </tr>
+            </tbody>
+        </table>
+        """
+        mock_get_client.return_value.post_form.return_value = mock_response
+
+        provider = HanaBankProvider(cache_enabled=False)
+        rates = provider.fetch_rates_http()
+
+        assert [r["code"] for r in rates] == ["USD", "JPY (100)"]
+        assert rates[0]["currency"] == "미국"
+        assert rates[0]["cash_buy"] == "1,300.00"
+        assert rates[0]["cash_sell"] == "1,350.00"
+        assert rates[1]["cash_buy"] == "900.10"
+
+    @patch('getcurcur.providers.korea.hana.get_http_client')
+    def test_get_rates_falls_back_to_browser(self, mock_get_client):
+        """Test the browser is only used when the HTTP fast path fails validation."""
+        mock_response = MagicMock()
+        mock_response.text.return_value = "<html><body>maintenance</body></html>"
+        mock_get_client.return_value.post_form.return_value = mock_response
+
+        mock_page = MagicMock()
+        mock_page.content.return_value = """
+        <table id="p_grid1_tb"><tbody>
+            <tr><td>미국</td><td>USD</td><td>1,300.00</td><td>1,320.00</td><td>1,350.00</td></tr>
+        </tbody></table>
+        """
+        mock_context = MagicMock()
+        mock_context.new_page.return_value = mock_page
+
+        provider = HanaBankProvider(cache_enabled=False, fetch_mode="auto")
+        rates = provider.get_rates(mock_context, use_cache=False)
+
+        assert rates[0]["code"] == "USD"
+        mock_context.new_page.assert_called_once()
+
+    @patch('getcurcur.providers.korea.hana.get_http_client')
+    def test_http_fast_path_is_opt_in(self, mock_get_client):
+        """Test the HTTP fast path is not tried unless fetch_mode enables it."""
+        mock_page = MagicMock()
+        mock_page.content.return_value = """
+        <table id="p_grid1_tb"><tbody>
+            <tr><td>미국</td><td>USD</td><td>1,300.00</td><td>1,320.00</td><td>1,350.00</td></tr>
+        </tbody></table>
+        """
+        mock_context = MagicMock()
+        mock_context.new_page.return_value = mock_page
+
+        provider = HanaBankProvider(cache_enabled=False)
+        assert provider.fetch_mode == "browser"
+        rates = provider.get_rates(mock_context, use_cache=False)
+
+        assert rates[0]["cash_sell"] == "1,350.00"
+        mock_get_client.assert_not_called()
+
+    @patch('getcurcur.providers.korea.hana.get_http_client')
+    def test_get_rates_http_skips_browser(self, mock_get_client):
+        """Test a valid fast-path response never touches the browser context."""
+        mock_response = MagicMock()
+        mock_response.text.return_value = (
+            "<table><tbody><tr><td>미국 USD</td><td>1,300.00</td><td>1.75</td>"
+            "<td>1,350.00</td></tr></tbody></table>"
+        )
+        mock_get_client.return_value.post_form.return_value = mock_response
+
+        mock_context = MagicMock()
+        provider = HanaBankProvider(cache_enabled=False, fetch_mode="auto")
+        rates = provider.get_rates(mock_context, use_cache=False)
+
+        assert rates[0]["cash_sell"] == "1,350.00"
+        mock_context.new_page.assert_not_called()
+
+    def test_fetch_rates_async(self):
+        """Test fetching rates through a playwright.async_api context."""
+        mock_page = MagicMock()
+        mock_page.goto = AsyncMock()
+        mock_page.wait_for_selector = AsyncMock()
+        mock_page.close = AsyncMock()
+        mock_page.content = AsyncMock(return_value="""
+        <table id="p_grid1_tb"><tbody>
+            <tr><td>미국</td><td>USD</td><td>1,300.00</td><td>1,320.00</td><td>1,350.00</td></tr>
+        </tbody></table>
+        """)
+        mock_context = MagicMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+
+        provider = HanaBankProvider(cache_enabled=False, fetch_mode="browser")
+        rates = asyncio.run(provider.get_rates_async(mock_context, use_cache=False))
+
+        assert rates[0]["code"] == "USD"
+        assert rates[0]["cash_sell"] == "1,350.00"
+        mock_page.close.assert_awaited_once()
+
+    def test_get_rates_async_uses_cache(self, tmp_path):
+        """Test async rate lookups are served from the shared cache."""
+        provider = HanaBankProvider()
+        provider.cache_manager = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30)
+        cached = [{"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+        provider.cache_manager.set(provider.get_provider_name(), cached)
+
+        mock_context = MagicMock()
+        rates = asyncio.run(provider.get_rates_async(mock_context))
+
+        assert rates[0]["code"] == "USD"
+        assert rates[0]["cash_sell"] == "1,350.00"
+        mock_context.new_page.assert_not_called()
+
+    def test_invalid_fetch_mode(self):
+        """Test unknown fetch modes are rejected."""
+        with pytest.raises(ValueError):
+            HanaBankProvider(fetch_mode="carrier-pigeon")
+
 
 class TestProviderIntegration:
     """Integration tests for providers."""
@@ -210,6 +549,270 @@ class TestBrowserManager:
             viewport={'width': 1920, 'height': 1080}
         )
     
+    @patch('getcurcur.browser_manager.sync_playwright')
+    def test_browser_context_with_lean_profile(self, mock_playwright):
+        """Test the lean profile shapes the context and routes every request."""
+        from getcurcur.browser_manager import BrowserManager, ScrapeProfile
+        
+        mock_context = MagicMock()
+        mock_browser = MagicMock()
+        mock_browser.new_context.return_value = mock_context
+        mock_p = MagicMock()
+        mock_p.chromium.launch.return_value = mock_browser
+        mock_playwright.return_value.__enter__.return_value = mock_p
+        
+        manager = BrowserManager(use_daemon=False, profile=ScrapeProfile())
+        with manager.browser_context():
+            pass
+        
+        mock_p.chromium.launch.assert_called_with(headless=True, args=["--blink-settings=imagesEnabled=false"])
+        kwargs = mock_browser.new_context.call_args.kwargs
+        assert kwargs["reduced_motion"] == "reduce"
+        assert kwargs["service_workers"] == "block"
+        assert kwargs["viewport"] == {'width': 1280, 'height': 800}
+        assert mock_context.route.call_args.args[0] == "**/*"
+    
+    def test_lean_profile_blocking_rules(self):
+        """Test which requests the lean profile aborts."""
+        from getcurcur.browser_manager import ScrapeProfile
+        
+        profile = ScrapeProfile()
+        page = "https://www.kebhana.com/cont/mall/mall15/mall1501/index.jsp"
+        
+        assert not profile.should_block("document", page, "about:blank", main_navigation=True)
+        assert not profile.should_block("script", "https://static.kebhana.com/app.js", page)
+        assert not profile.should_block("xhr", "https://www.kebhana.com/cms/rate/wpfxd651_01i_01.do", page)
+        assert profile.should_block("image", "https://www.kebhana.com/logo.png", page)
+        assert profile.should_block("stylesheet", "https://www.kebhana.com/site.css", page)
+        assert profile.should_block("script", "https://www.googletagmanager.com/gtm.js", page)
+        assert profile.should_block("script", "https://cdn.example.co.kr/widget.js", page)
+        assert not ScrapeProfile(block_third_party=False).should_block(
+            "script", "https://cdn.example.co.kr/widget.js", page)
+    
+    def test_lean_profile_from_config(self):
+        """Test the profile can be disabled or tuned through config."""
+        from getcurcur.browser_manager import ScrapeProfile
+        
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: {
+            "browser.lean.enabled": True,
+            "browser.lean.block_resource_types": ["image"],
+        }.get(key, default)
+        profile = ScrapeProfile.from_config(config)
+        assert profile.block_resource_types == ("image",)
+        assert profile.block_third_party
+        
+        config.get.side_effect = lambda key, default=None: False if key == "browser.lean.enabled" else default
+        assert ScrapeProfile.from_config(config) is None
+        
+        # Off unless enabled
+        config.get.side_effect = lambda key, default=None: default
+        assert ScrapeProfile.from_config(config) is None
+    
+    @patch('getcurcur.browser_manager.read_daemon_endpoint')
+    @patch('getcurcur.browser_manager.sync_playwright')
+    def test_browser_context_uses_daemon(self, mock_playwright, mock_endpoint):
+        """Test browser context connects to a running daemon instead of launching."""
+        from getcurcur.browser_manager import BrowserManager
+
+        mock_endpoint.return_value = "http://127.0.0.1:9222"
+        mock_context = MagicMock()
+        mock_browser = MagicMock()
+        mock_browser.new_context.return_value = mock_context
+
+        mock_p = MagicMock()
+        mock_p.chromium.connect_over_cdp.return_value = mock_browser
+        mock_playwright.return_value.__enter__.return_value = mock_p
+
+        manager = BrowserManager()
+        with manager.browser_context() as context:
+            assert context == mock_context
+
+        mock_p.chromium.connect_over_cdp.assert_called_once_with("http://127.0.0.1:9222")
+        mock_p.chromium.launch.assert_not_called()
+        mock_context.close.assert_called_once()
+        mock_browser.close.assert_not_called()  # Daemon browser must stay alive
+
+    @patch('getcurcur.browser_manager.read_daemon_endpoint')
+    @patch('getcurcur.browser_manager.sync_playwright')
+    def test_browser_context_falls_back_when_daemon_unreachable(self, mock_playwright, mock_endpoint):
+        """Test browser context launches locally when the daemon cannot be reached."""
+        from getcurcur.browser_manager import BrowserManager
+
+        mock_endpoint.return_value = "http://127.0.0.1:9222"
+        mock_browser = MagicMock()
+        mock_p = MagicMock()
+        mock_p.chromium.connect_over_cdp.side_effect = Exception("connection refused")
+        mock_p.chromium.launch.return_value = mock_browser
+        mock_playwright.return_value.__enter__.return_value = mock_p
+
+        manager = BrowserManager()
+        with manager.browser_context():
+            pass
+
+        mock_p.chromium.launch.assert_called_once_with(headless=True)
+        mock_browser.close.assert_called_once()
+
+    @patch('getcurcur.browser_manager.sync_playwright')
+    def test_lazy_browser_context(self, mock_playwright):
+        """Test lazy contexts only launch a browser when actually used."""
+        from getcurcur.browser_manager import BrowserManager
+
+        mock_p = MagicMock()
+        mock_playwright.return_value.__enter__.return_value = mock_p
+        manager = BrowserManager(use_daemon=False)
+
+        with manager.browser_context(lazy=True) as context:
+            assert not context.started
+        mock_p.chromium.launch.assert_not_called()
+
+        with manager.browser_context(lazy=True) as context:
+            context.new_page()
+            assert context.started
+        mock_p.chromium.launch.assert_called_once()
+        mock_p.chromium.launch.return_value.close.assert_called_once()
+
+    def test_scrape_session_recreates_dead_pages(self):
+        """Test session pages are reloaded while alive and reopened after a crash."""
+        from getcurcur.browser_manager import ScrapeSession
+
+        pages = []
+
+        def new_page():
+            page = MagicMock()
+            page.is_closed.return_value = False
+            pages.append(page)
+            return page
+
+        mock_context = MagicMock()
+        mock_context.new_page.side_effect = new_page
+        session = ScrapeSession(lambda: mock_context, "https://bank.example/rates", wait_until="domcontentloaded")
+
+        assert session.warm_page() is None
+        page = session.load()
+        assert session.load() is page
+        page.reload.assert_called_once_with(wait_until="domcontentloaded")
+
+        # Crash handler registered on the page
+        crash_handler = dict(call.args for call in page.on.call_args_list)["crash"]
+        crash_handler(page)
+        assert session.warm_page() is None
+        assert session.load() is pages[1]
+        page.close.assert_called_once()
+
+        # Renderer no longer answering the liveness probe
+        pages[1].evaluate.side_effect = Exception("Target closed")
+        assert session.load() is pages[2]
+        assert session.stats == {"opened": 3, "reloaded": 1, "requeried": 0, "recreated": 2}
+
+        # Failed navigation discards the page
+        pages[2].reload.side_effect = Exception("net::ERR_CONNECTION_RESET")
+        with pytest.raises(Exception):
+            session.load()
+        assert session.warm_page() is None
+
+    @patch('getcurcur.browser_manager.sync_playwright')
+    def test_session_context_relaunches_disconnected_browser(self, mock_playwright):
+        """Test session contexts keep one browser and relaunch it after a disconnect."""
+        from getcurcur.browser_manager import BrowserManager
+
+        mock_p = MagicMock()
+        mock_playwright.return_value.__enter__.return_value = mock_p
+        mock_browser = mock_p.chromium.launch.return_value
+        mock_browser.new_context.return_value.browser = mock_browser
+        manager = BrowserManager(use_daemon=False)
+
+        with manager.session_context() as context:
+            session = context.session("Bank", "https://bank.example/rates")
+            assert context.session("Bank", "https://bank.example/rates") is session
+            session.load()
+            session.discard()
+            session.load()
+            assert mock_p.chromium.launch.call_count == 1
+
+            mock_browser.is_connected.return_value = False
+            session.discard()
+            session.load()
+            assert mock_p.chromium.launch.call_count == 2
+        assert mock_browser.close.call_count == 2
+
+    @patch('getcurcur.browser_manager.read_daemon_endpoint', return_value=None)
+    @patch('getcurcur.browser_manager.async_playwright')
+    def test_async_browser_context_manager(self, mock_playwright, mock_endpoint):
+        """Test async browser context manager lifecycle."""
+        from getcurcur.browser_manager import AsyncBrowserManager
+
+        mock_context = MagicMock()
+        mock_context.close = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+        mock_browser.close = AsyncMock()
+        mock_p = MagicMock()
+        mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_playwright.return_value.__aenter__.return_value = mock_p
+
+        async def _use():
+            manager = AsyncBrowserManager(headless=True)
+            async with manager.browser_context() as context:
+                assert context == mock_context
+
+        asyncio.run(_use())
+
+        mock_p.chromium.launch.assert_awaited_once_with(headless=True)
+        mock_context.close.assert_awaited_once()
+        mock_browser.close.assert_awaited_once()
+
+    def test_read_daemon_endpoint(self, tmp_path):
+        """Test daemon discovery through the state file."""
+        import os
+        from getcurcur.browser_manager import read_daemon_endpoint
+
+        state_file = tmp_path / "daemon.json"
+        assert read_daemon_endpoint(state_file) is None
+
+        state_file.write_text(json.dumps({"pid": os.getpid(), "endpoint": "http://127.0.0.1:9333"}))
+        assert read_daemon_endpoint(state_file) == "http://127.0.0.1:9333"
+
+    @patch('getcurcur.browser_manager.os.kill', side_effect=ProcessLookupError)
+    def test_read_daemon_endpoint_removes_stale_state(self, mock_kill, tmp_path):
+        """Test stale daemon state is cleaned up."""
+        from getcurcur.browser_manager import read_daemon_endpoint
+
+        state_file = tmp_path / "daemon.json"
+        state_file.write_text(json.dumps({"pid": 999999, "endpoint": "http://127.0.0.1:9333"}))
+
+        assert read_daemon_endpoint(state_file) is None
+        assert not state_file.exists()
+
+    def test_daemon_publishes_chosen_port_privately(self, tmp_path):
+        """Test the daemon lets Chromium pick a port and publishes it owner-only."""
+        import os
+        from pathlib import Path
+        from getcurcur.browser_manager import ScrapeProfile, read_daemon_endpoint
+        from getcurcur.daemon import BrowserDaemon
+
+        def launch(user_data_dir, **kwargs):
+            (Path(user_data_dir) / "DevToolsActivePort").write_text("41234\n/devtools/browser/abc\n")
+            return MagicMock()
+
+        mock_p = MagicMock()
+        mock_p.chromium.launch_persistent_context.side_effect = launch
+        state_file = tmp_path / "daemon.json"
+        browser_daemon = BrowserDaemon(state_file=state_file, profile=ScrapeProfile())
+
+        browser_daemon._launch(mock_p)
+        browser_daemon._write_state()
+
+        args = mock_p.chromium.launch_persistent_context.call_args.kwargs['args']
+        assert "--remote-debugging-port=0" in args
+        assert "--blink-settings=imagesEnabled=false" in args
+        assert read_daemon_endpoint(state_file) == "http://127.0.0.1:41234"
+        assert state_file.stat().st_mode & 0o777 == 0o600
+
+        user_data_dir = browser_daemon._user_data_dir
+        browser_daemon._remove_user_data_dir()
+        assert not os.path.exists(user_data_dir)
+
     def test_get_browser_manager_singleton(self):
         """Test get_browser_manager returns configured instance."""
         from getcurcur.browser_manager import get_browser_manager
@@ -224,6 +827,10 @@ class TestBrowserManager:
         manager3 = get_browser_manager(headless=False, user_agent=custom_ua)
         assert manager3.headless is False
         assert manager3.user_agent == custom_ua
+        
+        # Other settings get their own manager instead of replacing the default one
+        assert get_browser_manager() is manager1
+        assert get_browser_manager(headless=False, user_agent=custom_ua) is manager3
 
 
 class TestWooriBankProvider:
@@ -335,7 +942,8 @@ class TestCacheIntegration:
         
         # Create cache with test data
         cache = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30)
-        test_data = [{"code": "USD", "rate": "1300.00", "provider": "Test"}]
+        test_data = [{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00",
+                      "provider": "Test", "country": "KR"}]
         cache.set("test_provider", test_data)
         
         # Create provider with cache
@@ -351,7 +959,7 @@ class TestCacheIntegration:
                 return "KR"
             
             def fetch_rates(self, context):
-                return [{"code": "USD", "rate": "1301.00", "provider": "Test"}]
+                return [{"code": "USD", "cash_buy": "1,301.00", "provider": "Test"}]
         
         provider = TestProvider()
         mock_context = MagicMock()
@@ -359,8 +967,45 @@ class TestCacheIntegration:
         # Should return cached data
         result = provider.get_rates(mock_context, use_cache=True)
         assert result == test_data
-        assert result[0]["rate"] == "1300.00"  # Cached value, not fresh
+        assert result[0]["cash_buy"] == "1,300.00"  # Cached value, not fresh
     
+    def test_stale_cache_served_and_refreshed(self, tmp_path):
+        """Test stale entries are returned immediately and revalidated in the background."""
+        cache = CacheManager(cache_dir=tmp_path / "cache", ttl_minutes=30, max_stale_minutes=60, memory=False)
+        cache.set("test_provider_stale", [{"code": "USD", "cash_buy": "1,300.00"}])
+        cache_file = next((tmp_path / "cache").glob("*.json"))
+        cache_data = json.loads(cache_file.read_text(encoding="utf-8"))
+        cache_data["timestamp"] = (datetime.now() - timedelta(minutes=40)).isoformat()
+        cache_file.write_text(json.dumps(cache_data), encoding="utf-8")
+
+        class TestProvider(ExchangeRateProvider):
+            def __init__(self):
+                super().__init__(cache_enabled=True, cache_ttl=30)
+                self.cache_manager = cache
+
+            def get_provider_name(self):
+                return "test_provider_stale"
+
+            def get_country(self):
+                return "KR"
+
+            def fetch_rates(self, context):
+                return [{"code": "USD", "cash_buy": "1,301.00"}]
+
+        provider = TestProvider()
+        with patch('getcurcur.browser_manager.BrowserManager') as mock_bm_class:
+            mock_bm_class.return_value.browser_context.return_value.__enter__.return_value = MagicMock()
+            result = provider.get_rates(MagicMock())
+            assert result[0]["cash_buy"] == "1,300.00"  # Stale value served immediately
+            assert provider.last_cache_entry.stale
+
+            for thread in threading.enumerate():
+                if thread.name.startswith("getcurcur-refresh-"):
+                    assert thread.daemon  # never holds up CLI exit
+                    thread.join(timeout=5)
+
+        assert cache.get("test_provider_stale")[0]["cash_buy"] == "1,301.00"
+
     def test_cache_miss_fetch_fresh(self, tmp_path):
         """Test fresh data fetch on cache miss."""
         from getcurcur.providers.base import CacheManager
@@ -379,14 +1024,14 @@ class TestCacheIntegration:
                 return "KR"
             
             def fetch_rates(self, context):
-                return [{"code": "USD", "rate": "1301.00", "provider": "Test"}]
+                return [{"code": "USD", "cash_buy": "1,301.00", "provider": "Test"}]
         
         provider = TestProvider()
         mock_context = MagicMock()
         
         # Should fetch fresh data (cache miss)
         result = provider.get_rates(mock_context, use_cache=True)
-        assert result[0]["rate"] == "1301.00"  # Fresh value
+        assert result[0]["cash_buy"] == "1,301.00"  # Fresh value
         
         # Verify data was cached
         cached_result = cache.get("test_provider_fresh")
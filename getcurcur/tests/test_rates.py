@@ -0,0 +1,81 @@
+"""Tests for typed exchange rate records."""
+
+from decimal import Decimal
+import json
+
+import pytest
+
+from getcurcur.rates import ExchangeRate, RateTable, as_dicts, parse_decimal
+
+
+ROWS = [
+    {"currency": "미국", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00",
+     "provider": "Test Bank", "country": "KR"},
+    {"currency": "일본", "code": "JPY (100)", "cash_buy": "950.50", "cash_sell": "-",
+     "provider": "Test Bank", "country": "KR"},
+]
+
+
+def test_parse_decimal():
+    """Test displayed rates are parsed once into Decimals."""
+    assert parse_decimal("1,300.50") == Decimal("1300.50")
+    assert parse_decimal(" 950 ") == Decimal("950")
+    assert parse_decimal("-") is None
+    assert parse_decimal("") is None
+    assert parse_decimal("N/A") is None
+    assert parse_decimal("0") is None
+
+
+def test_record_is_slotted_and_immutable():
+    """Test records carry no per-instance dict and cannot be modified."""
+    rate = ExchangeRate.from_dict(ROWS[0])
+
+    assert not hasattr(rate, "__dict__")
+    assert rate.cash_buy == Decimal("1300.00")
+    assert rate.value("cash_sell") == 1350.0
+    with pytest.raises(AttributeError):
+        rate.code = "EUR"
+
+
+def test_record_dict_compatibility():
+    """Test records read like the former dicts of displayed strings."""
+    rate = ExchangeRate.from_dict(ROWS[0])
+
+    assert rate["cash_buy"] == "1,300.00"
+    assert rate.get("provider") == "Test Bank"
+    assert rate.get("missing", "x") == "x"
+    assert rate == ROWS[0]
+    assert dict(rate) == ROWS[0]
+
+
+def test_table_round_trip():
+    """Test tables convert back to the JSON/cache dict format unchanged."""
+    table = RateTable.from_dicts(ROWS)
+
+    assert len(table) == 2
+    assert table.provider == "Test Bank"
+    assert table == ROWS
+    assert json.loads(json.dumps(as_dicts(table))) == ROWS
+    assert table[1:] == ROWS[1:]
+
+
+def test_table_shares_interned_strings():
+    """Test rows of different tables share their code and provider strings."""
+    first = RateTable.from_dicts(json.loads(json.dumps(ROWS)))
+    second = RateTable.from_dicts(json.loads(json.dumps(ROWS)))
+
+    assert first.codes[0] is second.codes[0]
+    assert first[0].provider is second[1].provider
+
+
+def test_table_index_and_find():
+    """Test the code -> rate index skips missing rates and is memoized."""
+    table = RateTable.from_dicts(ROWS)
+
+    index = table.index("cash_sell")
+    assert index == {"USD": 1350.0}
+    assert table.index("cash_sell") is index
+    assert table.find("usd")["cash_sell"] == "1,350.00"
+    assert table.find("EUR") is None
+    with pytest.raises(ValueError):
+        table.values("mid")
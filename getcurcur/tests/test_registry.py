@@ -0,0 +1,69 @@
+"""Tests for the provider registry and entry-point discovery."""
+
+from unittest.mock import patch
+
+import pytest
+
+from getcurcur.exceptions import ProviderError
+from getcurcur.providers.korea.hana import HanaBankProvider
+from getcurcur.registry import ProviderRegistry
+
+PLUGINS = [
+    ("korea.kb", "getcurcur_kb:KBBankProvider"),
+    ("japan.mufg", "getcurcur_mufg:MUFGProvider"),
+    ("usa.hana", "getcurcur_hana_us:HanaUSProvider"),
+]
+
+
+@pytest.fixture
+def scan():
+    with patch("getcurcur.registry._scan_entry_points", return_value=list(PLUGINS)) as scan:
+        yield scan
+
+
+def test_aliases(tmp_path, scan):
+    """Test identifiers and bare bank names resolve, preferring Korean banks."""
+    registry = ProviderRegistry(tmp_path / "providers.json")
+
+    assert set(registry.paths) == {"korea.hana", "korea.kb", "japan.mufg", "usa.hana"}
+    assert registry.resolve("hana") == "korea.hana"
+    assert registry.resolve("usa.hana") == "usa.hana"
+    assert registry.resolve("mufg") == "japan.mufg"
+    assert "kb" in registry
+    with pytest.raises(ValueError):
+        registry.resolve("unknown")
+
+
+def test_discovery_is_cached(tmp_path, scan):
+    """Test entry points are only rescanned when installed packages change."""
+    cache_path = tmp_path / "providers.json"
+    with patch("getcurcur.registry._metadata_fingerprint", return_value="a"):
+        assert len(ProviderRegistry(cache_path)) == 4
+        assert len(ProviderRegistry(cache_path)) == 4
+    assert scan.call_count == 1
+
+    scan.return_value = PLUGINS[:1]
+    with patch("getcurcur.registry._metadata_fingerprint", return_value="b"):
+        assert "mufg" not in ProviderRegistry(cache_path)
+    assert scan.call_count == 2
+
+    cache_path.write_text("{not json")
+    with patch("getcurcur.registry._metadata_fingerprint", return_value="b"):
+        assert "kb" in ProviderRegistry(cache_path)
+    assert scan.call_count == 3
+
+
+def test_builtin_providers_take_precedence(tmp_path):
+    """Test a plugin cannot replace a built-in provider or register a malformed name."""
+    plugins = [("korea.hana", "evil:Provider"), ("kb", "getcurcur_kb:KBBankProvider")]
+    with patch("getcurcur.registry._scan_entry_points", return_value=plugins):
+        registry = ProviderRegistry(use_cache=False)
+        assert registry.load("hana") is HanaBankProvider
+        assert "kb" not in registry
+
+
+def test_load_failure(tmp_path, scan):
+    """Test plugins that cannot be imported raise ProviderError."""
+    registry = ProviderRegistry(tmp_path / "providers.json")
+    with pytest.raises(ProviderError, match="korea.kb"):
+        registry.load("kb")
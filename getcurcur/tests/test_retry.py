@@ -0,0 +1,186 @@
+"""Tests for the fetch retry policy."""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from getcurcur.browser_manager import LazyBrowserContext
+from getcurcur.config import Config
+from getcurcur.exceptions import NetworkError, ParseError, TimeoutError as GetCurCurTimeoutError
+from getcurcur.providers.base import AsyncExchangeRateProvider
+from getcurcur.retry import RetryPolicy
+
+NO_WAIT = RetryPolicy(base_delay=0, jitter=0)
+
+
+class FlakyProvider(AsyncExchangeRateProvider):
+    """Provider raising the queued errors before returning rates."""
+
+    def __init__(self, *errors, retry_policy=NO_WAIT):
+        super().__init__(cache_enabled=False, retry_policy=retry_policy)
+        self.history_enabled = False
+        self.errors = list(errors)
+        self.contexts = []
+
+    def get_provider_name(self):
+        return "Flaky Bank"
+
+    def get_country(self):
+        return "KR"
+
+    def _next(self):
+        if self.errors:
+            raise self.errors.pop(0)
+        return [{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+    def fetch_rates(self, context):
+        self.contexts.append(context.new_page())
+        return self._next()
+
+    async def fetch_rates_async(self, context):
+        self.contexts.append(context)
+        return self._next()
+
+
+def test_errors_are_classified():
+    """Test only network and timeout errors are transient by default."""
+    policy = RetryPolicy()
+    assert policy.is_transient(NetworkError("reset"))
+    assert policy.is_transient(GetCurCurTimeoutError("table"))
+    assert policy.is_transient(TimeoutError())
+    assert policy.is_transient(ConnectionResetError())
+    assert not policy.is_transient(ParseError("no table"))
+    assert not policy.is_transient(ValueError())
+    assert RetryPolicy(transient_errors=["ParseError"]).is_transient(ParseError("no table"))
+
+
+def test_parse_error_is_not_retried():
+    """Test a deterministic ParseError fails after one attempt."""
+    provider = FlakyProvider(ParseError("no table"), ParseError("no table"))
+    with pytest.raises(ParseError):
+        provider.get_rates(MagicMock(), use_cache=False)
+    assert len(provider.contexts) == 1
+
+
+def test_transient_error_is_retried():
+    """Test network errors are retried and the rates of the retry returned."""
+    provider = FlakyProvider(NetworkError("reset"), GetCurCurTimeoutError("table"))
+    rates = provider.get_rates(MagicMock(), use_cache=False)
+    assert len(rates) == 1
+    assert len(provider.contexts) == 3
+
+    provider = FlakyProvider(*[NetworkError("reset")] * 3, retry_policy=NO_WAIT)
+    with pytest.raises(NetworkError):
+        provider.get_rates(MagicMock(), use_cache=False)
+    assert len(provider.contexts) == 3
+
+
+def test_backoff_and_deadline():
+    """Test waits grow exponentially with jitter and stop at the deadline."""
+    def failing():
+        raise NetworkError("reset")
+
+    sleeps = []
+    policy = RetryPolicy(max_attempts=4, base_delay=1, max_delay=3, jitter=0.5, deadline=None)
+    with pytest.raises(NetworkError):
+        policy.retrying(sleep=sleeps.append)(failing)
+    assert [int(delay) for delay in sleeps] == [1, 2, 3]
+    assert all(0 <= delay - int(delay) <= 0.5 for delay in sleeps)
+
+    sleeps.clear()
+    policy = RetryPolicy(max_attempts=10, base_delay=1, jitter=0, deadline=3)
+    with pytest.raises(NetworkError):
+        policy.retrying(sleep=sleeps.append)(failing)
+    # The fake sleeps take no time, so only the 4s wait ends past the deadline
+    assert sleeps == [1, 2]
+
+
+def test_closed_context_is_not_retried():
+    """Test a retry is not attempted on a plain context that was closed."""
+    context = MagicMock()
+    context.cookies.side_effect = Exception("Target page, context or browser has been closed")
+    provider = FlakyProvider(NetworkError("reset"))
+    with pytest.raises(NetworkError):
+        provider.get_rates(context, use_cache=False)
+    assert len(provider.contexts) == 1
+
+
+def test_dead_lazy_context_is_relaunched():
+    """Test a lazy context whose browser died is reopened for the retry."""
+    contexts = [MagicMock(), MagicMock()]
+    contexts[0].cookies.side_effect = Exception("Browser has been closed")
+    manager = MagicMock()
+
+    @contextmanager
+    def browser_context():
+        yield contexts.pop(0)
+
+    manager.browser_context = browser_context
+    lazy = LazyBrowserContext(manager)
+    provider = FlakyProvider(NetworkError("crashed"))
+
+    provider.get_rates(lazy, use_cache=False)
+    assert not contexts
+    first, second = provider.contexts
+    assert first is not second
+
+
+def test_context_is_not_renewed_after_last_attempt():
+    """Test the context is only torn down when another attempt follows."""
+    manager = MagicMock()
+
+    @contextmanager
+    def browser_context():
+        context = MagicMock()
+        context.cookies.side_effect = Exception("Browser has been closed")
+        yield context
+
+    manager.browser_context = browser_context
+    lazy = LazyBrowserContext(manager)
+    resets = []
+    reset = lazy.reset
+    lazy.reset = lambda: (resets.append(True), reset())
+    provider = FlakyProvider(*[NetworkError("crashed")] * 3)
+
+    with pytest.raises(NetworkError):
+        provider.get_rates(lazy, use_cache=False)
+    assert len(provider.contexts) == 3
+    assert len(resets) == 2
+
+
+def test_policy_from_config(tmp_path):
+    """Test provider overrides in the retry section take precedence."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"retry": {
+        "max_attempts": 5,
+        "deadline_seconds": None,
+        "providers": {"Flaky Bank": {"max_attempts": 2, "transient_errors": ["NetworkError"]}},
+    }}))
+    config = Config(config_path)
+
+    default = RetryPolicy.from_config(config=config)
+    assert default.max_attempts == 5
+    assert default.deadline is None
+    assert default.base_delay == 0.5
+
+    flaky = RetryPolicy.from_config("Flaky Bank", config)
+    assert flaky.max_attempts == 2
+    assert flaky.transient_errors == ("NetworkError",)
+
+
+def test_async_retry_policy():
+    """Test the async API classifies errors and checks the context the same way."""
+    provider = FlakyProvider(NetworkError("reset"), ParseError("no table"))
+    with pytest.raises(ParseError):
+        asyncio.run(provider.get_rates_async(AsyncMock(), use_cache=False))
+    assert len(provider.contexts) == 2
+
+    closed = AsyncMock()
+    closed.cookies.side_effect = Exception("Target closed")
+    provider = FlakyProvider(NetworkError("reset"))
+    with pytest.raises(NetworkError):
+        asyncio.run(provider.get_rates_async(closed, use_cache=False))
+    assert len(provider.contexts) == 1
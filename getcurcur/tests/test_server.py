@@ -0,0 +1,338 @@
+"""Tests for the scheduled refresher and local lookup server."""
+
+import gzip
+import http.client
+import json
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from getcurcur.exceptions import ProviderError
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.rates import RateTable
+from getcurcur.server import BankHours, RateStore, RefreshScheduler, create_server
+
+
+class StubProvider(ExchangeRateProvider):
+    """Provider returning a fixed table without a browser."""
+
+    def __init__(self, buy="1,300.00", **kwargs):
+        super().__init__(cache_enabled=False, fetch_mode="browser", **kwargs)
+        self.history_enabled = False
+        self.buy = buy
+        self.calls = 0
+        self.contexts = []
+
+    def get_provider_name(self):
+        return "Stub Bank"
+
+    def get_country(self):
+        return "KR"
+
+    def fetch_rates(self, context):
+        self.calls += 1
+        self.contexts.append(context)
+        if self.buy is None:
+            raise ProviderError("Stub Bank is down")
+        return RateTable.from_rows("Stub Bank", "KR", [("미국", "USD", self.buy, "1,350.00")])
+
+
+def _browser_manager():
+    manager = MagicMock()
+
+    @contextmanager
+    def browser_context(lazy=False):
+        yield MagicMock()
+
+    manager.browser_context.side_effect = browser_context
+    return manager
+
+
+def _scheduler(providers, **kwargs):
+    kwargs.setdefault("jitter_seconds", 0)
+    return RefreshScheduler(providers, RateStore(), browser_manager=_browser_manager(), **kwargs)
+
+
+def test_bank_hours():
+    """Test bank hours are evaluated in the bank's local time."""
+    hours = BankHours(start=dt_time(9, 0), end=dt_time(20, 0), utc_offset_hours=9)
+    # Wednesday 2024-03-13, 10:00 and 21:00 KST
+    assert hours.is_open(datetime(2024, 3, 13, 1, 0, tzinfo=timezone.utc))
+    assert not hours.is_open(datetime(2024, 3, 13, 12, 0, tzinfo=timezone.utc))
+    # Saturday 10:00 KST
+    assert not hours.is_open(datetime(2024, 3, 16, 1, 0, tzinfo=timezone.utc))
+    assert BankHours(weekdays_only=False).is_open(datetime(2024, 3, 16, 1, 0))
+
+
+def test_bank_hours_from_config():
+    """Test bank hours are read from the serve.bank_hours config section."""
+    config = MagicMock()
+    config.get.return_value = {"start": "08:30", "end": "16:00", "utc_offset_hours": 0}
+    hours = BankHours.from_config(config)
+    assert (hours.start, hours.end, hours.utc_offset_hours) == (dt_time(8, 30), dt_time(16, 0), 0)
+
+    config.get.return_value = None
+    assert BankHours.from_config(config) is None
+
+
+def test_run_pending_schedules_by_bank_hours():
+    """Test refreshes follow the in-hours and off-hours intervals."""
+    provider = StubProvider()
+    scheduler = _scheduler({"korea.stub": provider}, interval_minutes=10,
+                           off_hours_interval_minutes=120, bank_hours=BankHours())
+    open_at = datetime(2024, 3, 13, 1, 0, tzinfo=timezone.utc).timestamp()
+
+    assert scheduler.run_pending(open_at) == ["korea.stub"]
+    assert scheduler.next_due()["korea.stub"] == open_at + 600
+    assert scheduler.run_pending(open_at + 599) == []
+    assert provider.calls == 1
+
+    closed_at = datetime(2024, 3, 13, 12, 0, tzinfo=timezone.utc).timestamp()
+    scheduler.run_pending(closed_at)
+    assert scheduler.next_due()["korea.stub"] == closed_at + 7200
+    assert provider.calls == 2
+    assert scheduler.store.get("stub").table.find("USD")["cash_buy"] == "1,300.00"
+
+
+def test_failed_refresh_keeps_last_table():
+    """Test a failed refresh is retried soon and the last table is kept."""
+    provider = StubProvider()
+    scheduler = _scheduler({"korea.stub": provider})
+    scheduler.run_pending(1000.0)
+
+    provider.buy = None
+    assert scheduler.run_pending(1000.0 + 600) == []
+    assert scheduler.next_due()["korea.stub"] == 1600.0 + RefreshScheduler.RETRY_SECONDS
+    assert len(scheduler.store.get("korea.stub").table) == 1
+
+
+def test_worker_keeps_one_session_context():
+    """Test the worker thread reuses one session context across refreshes."""
+    provider = StubProvider()
+    scheduler = _scheduler({"korea.stub": provider}, interval_minutes=0.0005)
+    session_context = MagicMock()
+    scheduler.browser_manager.session_context.return_value.__enter__.return_value = session_context
+
+    scheduler.start()
+    try:
+        deadline = datetime.now() + timedelta(seconds=5)
+        while provider.calls < 3 and datetime.now() < deadline:
+            threading.Event().wait(0.01)
+    finally:
+        scheduler.stop(timeout=5)
+
+    assert provider.calls >= 3
+    assert set(map(id, provider.contexts)) == {id(session_context)}
+    scheduler.browser_manager.session_context.assert_called_once()
+    scheduler.browser_manager.browser_context.assert_not_called()
+
+
+def test_start_up_serves_fresh_cache():
+    """Test a fresh cache entry is published without fetching at start-up."""
+    provider = StubProvider()
+    provider.cache_enabled = True
+    provider.cache_manager = MagicMock()
+    provider.cache_manager.get_entry.return_value = MagicMock(
+        data=RateTable.from_rows("Stub Bank", "KR", [("미국", "USD", "1,200.00", "-")]),
+        timestamp=datetime.now() - timedelta(minutes=5), stale=False,
+    )
+    scheduler = _scheduler({"korea.stub": provider})
+
+    assert scheduler.run_pending(1000.0) == ["korea.stub"]
+    assert provider.calls == 0
+    assert scheduler.store.get("korea.stub").table.find("USD")["cash_buy"] == "1,200.00"
+
+    provider.cache_manager.get_entry.return_value.stale = True
+    scheduler.run_pending(1000.0 + 600)
+    assert provider.calls == 1
+
+
+def test_open_circuit_publishes_last_known_good(tmp_path):
+    """Test rates served from an open circuit keep their age and are marked stale."""
+    from getcurcur.circuit import CircuitBreaker
+    from getcurcur.providers.base import CacheManager
+
+    provider = StubProvider()
+    provider.cache_enabled = True
+    provider.cache_manager = CacheManager(cache_dir=tmp_path, memory=False, decoder=RateTable.from_dicts)
+    provider.cache_manager.set("Stub Bank", RateTable.from_rows("Stub Bank", "KR", [("미국", "USD", "1,250.00", "-")]))
+    provider.circuit_breaker = CircuitBreaker(failure_threshold=1)
+    provider.circuit_breaker.record_failure(ProviderError("Stub Bank is down"))
+    scheduler = _scheduler({"korea.stub": provider})
+    scheduler._warmed.add("korea.stub")
+
+    assert scheduler.run_pending(1000.0) == []
+    snapshot = scheduler.store.get("korea.stub")
+    assert snapshot.stale
+    assert snapshot.fetched_at == provider.cache_manager.get_last_good("Stub Bank").timestamp
+    assert snapshot.table.find("USD")["cash_buy"] == "1,250.00"
+    assert provider.calls == 0
+
+
+def _stub_table():
+    rows = [("미국", "USD", "1,300.00", "1,350.00"), ("일본", "JPY (100)", "900.00", "950.00"),
+            ("유로", "EUR", "1,400.00", "-")]
+    rows += [(f"통화 {i}", f"X{i:02d}", "10.00", "11.00") for i in range(20)]
+    return RateTable.from_rows("Stub Bank", "KR", rows)
+
+
+def test_store_lookups_during_publish():
+    """Test bank-name lookups never see the snapshot dict change under them."""
+    store = RateStore()
+    table = _stub_table()
+    fetched_at = datetime(2024, 3, 13, 10, 0)
+    store.publish("korea.stub", "Stub Bank", table, fetched_at)
+    done = threading.Event()
+    errors = []
+
+    def publish():
+        for i in range(100):
+            store.publish(f"korea.bank{i}", f"Bank {i}", table, fetched_at)
+        done.set()
+
+    def lookup():
+        try:
+            while not done.is_set():
+                assert store.get("stub").identifier == "korea.stub"
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=lookup) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    publish()
+    for reader in readers:
+        reader.join()
+    assert not errors
+    assert len(store) == 101
+
+
+@pytest.fixture
+def server():
+    store = RateStore()
+    store.publish("korea.stub", "Stub Bank", _stub_table(), datetime(2024, 3, 13, 10, 0))
+    server = create_server(store, host="127.0.0.1", port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _get(conn, path, **headers):
+    conn.request("GET", path, headers=headers)
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_server_lookups(server):
+    """Test rates are served over one keep-alive connection."""
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    response, body = _get(conn, "/rates/hana")
+    assert response.status == 404
+    assert "error" in json.loads(body)
+
+    response, body = _get(conn, "/rates/stub")
+    data = json.loads(body)
+    assert response.status == 200
+    assert data["provider"] == "korea.stub"
+    assert data["fetched_at"] == "2024-03-13T10:00:00"
+    assert data["rates"][0]["cash_buy"] == "1,300.00"
+
+    response, body = _get(conn, "/rates/korea.stub/jpy")
+    assert json.loads(body)["code"] == "JPY (100)"
+    response, body = _get(conn, "/rates/stub/GBP")
+    assert response.status == 404
+
+    response, body = _get(conn, "/rates")
+    assert json.loads(body)["korea.stub"]["rates"] == 23
+    conn.close()
+
+
+def test_server_convert(server):
+    """Test conversions use the published table."""
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    response, body = _get(conn, "/convert?amount=100&from=usd&provider=stub&type=sell")
+    data = json.loads(body)
+    assert response.status == 200
+    assert (data["rate"], data["result"], data["to"]) == (1350.0, 135000.0, "KRW")
+
+    assert _get(conn, "/convert?from=USD&provider=stub")[0].status == 400
+    assert _get(conn, "/convert?amount=1&from=USD&provider=stub&type=hold")[0].status == 400
+    for amount in ("nan", "inf", "-inf", "1e308"):
+        response, body = _get(conn, f"/convert?amount={amount}&from=USD&provider=stub")
+        assert response.status == 400
+        assert "error" in json.loads(body)
+    response, body = _get(conn, "/convert?amount=100&from=USD&to=JPY&provider=stub")
+    assert json.loads(body)["result"] == pytest.approx(100 * 1300 / 9)
+    assert _get(conn, "/convert?amount=1&from=GBP&provider=stub")[0].status == 404
+    assert _get(conn, "/convert?amount=1&from=USD&to=EUR&provider=stub&type=sell")[0].status == 422
+    conn.close()
+
+
+def test_server_etag_and_gzip(server):
+    """Test conditional requests and gzip-encoded responses."""
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    response, body = _get(conn, "/rates/stub", **{"Accept-Encoding": "gzip"})
+    etag = response.getheader("ETag")
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert json.loads(gzip.decompress(body))["provider"] == "korea.stub"
+
+    response, body = _get(conn, "/rates/stub", **{"If-None-Match": etag})
+    assert (response.status, body) == (304, b"")
+    response, _ = _get(conn, "/rates/stub/USD", **{"If-None-Match": etag})
+    assert response.status == 304
+
+    # Publishing a new fetch changes the tag
+    server.store.publish("korea.stub", "Stub Bank", _stub_table(), datetime(2024, 3, 13, 10, 10))
+    response, body = _get(conn, "/rates/stub", **{"If-None-Match": etag, "Accept-Encoding": "gzip;q=0"})
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") is None
+    assert json.loads(body)["fetched_at"] == "2024-03-13T10:10:00"
+    conn.close()
+
+
+def test_server_not_fetched_yet():
+    """Test configured providers without rates yet answer 503."""
+    scheduler = _scheduler({"korea.stub": StubProvider()})
+    server = create_server(RateStore(), host="127.0.0.1", port=0, scheduler=scheduler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        assert _get(conn, "/rates/stub")[0].status == 503
+        assert _get(conn, "/rates/other")[0].status == 404
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not supported")
+def test_unix_socket_server(tmp_path):
+    """Test the server answers over a Unix domain socket."""
+    store = RateStore()
+    store.publish("korea.stub", "Stub Bank", RateTable.from_rows("Stub Bank", "KR", []), datetime.now())
+    path = tmp_path / "rates.sock"
+    server = create_server(store, socket_path=path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(path))
+        client.sendall(b"GET /rates HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+        response = b""
+        while chunk := client.recv(65536):
+            response += chunk
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b'"korea.stub"' in response
+    assert not path.exists()
@@ -0,0 +1,96 @@
+"""Tests for coalescing concurrent cache misses into one fetch."""
+
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from getcurcur.providers.base import CacheManager, ExchangeRateProvider
+
+PROCESSES = 6
+
+
+class CountingProvider(ExchangeRateProvider):
+    """Provider whose slow fetch appends a line to a counter file."""
+
+    def __init__(self, cache_dir: Path, counter_file: Path):
+        super().__init__(cache_enabled=True, cache_ttl=30)
+        self.cache_manager = CacheManager(cache_dir=cache_dir, ttl_minutes=30, memory=False)
+        self.history_enabled = False
+        self.counter_file = counter_file
+
+    def get_provider_name(self):
+        return "Single Flight Bank"
+
+    def get_country(self):
+        return "KR"
+
+    def fetch_rates(self, context):
+        with open(self.counter_file, "a", encoding="utf-8") as f:
+            f.write("fetch\n")
+        time.sleep(0.5)
+        return [{"code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+
+def _fetch_in_process(cache_dir, counter_file, start, results):
+    provider = CountingProvider(Path(cache_dir), Path(counter_file))
+    start.wait()
+    rates = provider.get_rates(MagicMock())
+    results.put(rates[0]["cash_buy"])
+
+
+def _fetch_count(counter_file: Path) -> int:
+    return len(counter_file.read_text(encoding="utf-8").splitlines()) if counter_file.exists() else 0
+
+
+def test_processes_share_one_fetch(tmp_path):
+    """Test concurrent cache misses in N processes trigger exactly one fetch."""
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Event()
+    results = ctx.Queue()
+    counter_file = tmp_path / "fetches.txt"
+    processes = [
+        ctx.Process(target=_fetch_in_process, args=(str(tmp_path / "cache"), str(counter_file), start, results))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    assert sorted(results.get(timeout=5) for _ in processes) == ["1,300.00"] * PROCESSES
+    assert _fetch_count(counter_file) == 1
+
+
+def test_threads_share_one_fetch(tmp_path):
+    """Test concurrent cache misses in one process trigger exactly one fetch."""
+    counter_file = tmp_path / "fetches.txt"
+    provider = CountingProvider(tmp_path / "cache", counter_file)
+    barrier = threading.Barrier(PROCESSES)
+    results = []
+
+    def _worker():
+        barrier.wait()
+        results.append(provider.get_rates(MagicMock())[0]["cash_buy"])
+
+    threads = [threading.Thread(target=_worker) for _ in range(PROCESSES)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert results == ["1,300.00"] * PROCESSES
+    assert _fetch_count(counter_file) == 1
+    assert provider.cache_manager.stats["coalesced"] == PROCESSES - 1
+
+
+def test_no_cache_bypasses_coalescing(tmp_path):
+    """Test use_cache=False always fetches."""
+    counter_file = tmp_path / "fetches.txt"
+    provider = CountingProvider(tmp_path / "cache", counter_file)
+    provider.get_rates(MagicMock())
+    provider.get_rates(MagicMock(), use_cache=False)
+    assert _fetch_count(counter_file) == 2
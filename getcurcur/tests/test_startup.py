@@ -0,0 +1,41 @@
+"""Startup regression tests for the CLI, based on `python -X importtime`."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules only the commands that fetch or render rates may import; loading
+# Playwright and BeautifulSoup at startup alone took ~300 ms. Absolute time
+# budgets are not asserted since they depend on the machine running the tests.
+HEAVY_MODULES = ("playwright", "bs4", "tenacity", "getcurcur.providers", "getcurcur.browser_manager",
+                 "rich.progress")
+
+
+def _imported_modules(*args):
+    """Run the CLI under -X importtime; return the names of the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from getcurcur.main import app; app()", *args],
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():  # skip the header
+            modules.add(name.strip())
+    return modules
+
+
+@pytest.mark.parametrize("args,also_forbidden", [
+    (["--version"], ("rich",)),
+    (["list-providers"], ()),
+])
+def test_startup_imports(args, also_forbidden):
+    """Test fast commands do not import browser, scraping or progress modules."""
+    modules = _imported_modules(*args)
+    forbidden = HEAVY_MODULES + also_forbidden
+    loaded = sorted(name for name in modules if name.startswith(forbidden))
+    assert not loaded, f"{' '.join(args)} imported {loaded}"
@@ -0,0 +1,136 @@
+"""Tests for timing spans and the --timings / --trace options."""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from getcurcur import tracing
+from getcurcur.main import app
+from getcurcur.providers.base import ExchangeRateProvider
+from getcurcur.tracing import span, start_tracing, stop_tracing
+
+ROWS_HTML = "<table><tbody><tr><td>미국 USD</td><td>1,300.00</td><td>1,350.00</td></tr></tbody></table>"
+
+
+@pytest.fixture
+def tracer():
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+class HtmlProvider(ExchangeRateProvider):
+    """Provider parsing a fixed HTML table."""
+
+    def __init__(self):
+        super().__init__(cache_enabled=False, fetch_mode="browser")
+        self.history_enabled = False
+
+    def get_provider_name(self):
+        return "Html Bank"
+
+    def get_country(self):
+        return "KR"
+
+    def fetch_rates(self, context):
+        from getcurcur.parsing import extract_table_cells
+
+        cells = extract_table_cells(ROWS_HTML, "table tbody tr", (0, 1, 2), backend="html.parser")
+        return [{"currency": name, "code": "USD", "cash_buy": buy, "cash_sell": sell} for name, buy, sell in cells]
+
+
+def test_span_is_a_no_op_when_disabled():
+    """Test span() hands out one shared no-op while tracing is off."""
+    assert tracing.get_tracer() is None
+    assert span("page.goto", url="x") is span("cache.read")
+    with span("page.goto"):
+        pass
+
+
+def test_spans_nest_and_add_up(tracer):
+    """Test phases are added up by name and keep their nesting depth."""
+    with span("fetch.attempt", attempt=1):
+        with span("page.goto"):
+            pass
+        with span("page.goto"):
+            pass
+    with pytest.raises(ValueError):
+        with span("parse.html"):
+            raise ValueError("bad table")
+
+    phases = {phase.name: phase for phase in tracer.phases()}
+    assert [phase.name for phase in tracer.phases()] == ["fetch.attempt", "page.goto", "parse.html"]
+    assert phases["page.goto"].calls == 2
+    assert phases["page.goto"].depth == 1
+    assert phases["fetch.attempt"].total >= phases["page.goto"].total
+    assert phases["parse.html"].depth == 0
+    assert tracer.spans[-1].args == {"error": "ValueError"}
+
+
+def test_chrome_trace_format(tracer, tmp_path):
+    """Test the trace file holds one complete event per span and thread names."""
+    with span("cache.read", provider="Html Bank"):
+        pass
+
+    def goto():
+        with span("page.goto", url="https://example.com"):
+            pass
+
+    worker = threading.Thread(target=goto, name="getcurcur-fetch-korea.html")
+    worker.start()
+    worker.join()
+    stop_tracing()
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(path)
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [(event["name"], event["cat"]) for event in complete] == [("cache.read", "cache"), ("page.goto", "page")]
+    assert complete[0]["args"] == {"provider": "Html Bank"}
+    assert complete[0]["tid"] != complete[1]["tid"]
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in complete)
+    names = {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+    assert "getcurcur-fetch-korea.html" in names
+
+
+def test_provider_pipeline_is_instrumented(tracer):
+    """Test a fresh fetch records its attempt, browser fetch and parse phases."""
+    rates = HtmlProvider().get_rates(MagicMock(), use_cache=False)
+    assert len(rates) == 1
+
+    phases = {phase.name: phase for phase in tracer.phases()}
+    assert phases["fetch.attempt"].depth == 0
+    assert phases["fetch.browser"].depth == 1
+    assert phases["parse.html"].depth == 2
+    parse = next(s for s in tracer.spans if s.name == "parse.html")
+    assert parse.args == {"backend": "html.parser", "size": len(ROWS_HTML)}
+
+
+@patch('getcurcur.main.get_browser_manager')
+@patch('getcurcur.main.get_provider')
+def test_show_timings_and_trace(mock_get_provider, mock_get_bm, tmp_path):
+    """Test show --timings --trace reports phases and writes the trace file."""
+    def get_rates(context, use_cache=True):
+        with span("fetch.browser", provider="Test Bank"):
+            return [{"currency": "US Dollar", "code": "USD", "cash_buy": "1,300.00", "cash_sell": "1,350.00"}]
+
+    mock_provider = MagicMock()
+    mock_provider.get_provider_name.return_value = "Test Bank"
+    mock_provider.get_rates.side_effect = get_rates
+    mock_provider.last_cache_entry = None
+    mock_get_provider.return_value = mock_provider
+    trace_path = tmp_path / "show.trace.json"
+
+    with patch('getcurcur.main._print_timings') as mock_print_timings:
+        result = CliRunner().invoke(app, ["show", "--timings", "--trace", str(trace_path)])
+
+    assert result.exit_code == 0
+    assert "USD" in result.stdout
+    reported = mock_print_timings.call_args[0][0]
+    assert [phase.name for phase in reported.phases()] == ["fetch.browser"]
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["fetch.browser"]
+    assert tracing.get_tracer() is None